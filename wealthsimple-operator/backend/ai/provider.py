@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from typing import Dict, Protocol
 
@@ -33,14 +34,12 @@ def _env_bool(value: str | None, default: bool = False) -> bool:
     return value.lower() in {"1", "true", "yes", "on"}
 
 
-def get_provider() -> AIProvider:
-    """Return the configured AI provider instance.
+@functools.lru_cache(maxsize=1)
+def _configured_provider() -> AIProvider:
+    """Build the provider selected by ``PROVIDER``, raising if it cannot be built.
 
-    Logic:
-    - PROVIDER=gemma_with_groq_fallback -> Gemma (primary) + Groq (fallback)
-    - PROVIDER=gemini -> Gemini only
-    - PROVIDER=groq -> Groq only
-    - PROVIDER=mock -> Mock provider (default)
+    lru_cache does not cache exceptions, so only a working provider is kept;
+    a failed build (missing key, transient init error) is retried next call.
     """
 
     from .mock_provider import MockAIProvider  # local import to avoid cycles
@@ -52,45 +51,61 @@ def get_provider() -> AIProvider:
     # Gemma + Groq fallback (recommended for production demo)
     if provider_env == "gemma_with_groq_fallback":
         if not gemini_key or not groq_key:
-            print(
-                "[WARNING] gemma_with_groq_fallback requires both GEMINI_API_KEY and GROQ_API_KEY. "
-                "Falling back to mock provider."
-            )
-            return MockAIProvider()
+            raise RuntimeError("gemma_with_groq_fallback requires both GEMINI_API_KEY and GROQ_API_KEY")
         try:
             from .gemma_groq_provider import GemmaGroqFallbackProvider
 
             return GemmaGroqFallbackProvider(gemma_api_key=gemini_key, groq_api_key=groq_key)
         except Exception as e:
-            print(f"[WARNING] GemmaGroqFallback initialization failed: {e}. Using mock provider.")
-            return MockAIProvider()
+            raise RuntimeError(f"GemmaGroqFallback initialization failed: {e}") from e
 
     # Gemini only
     if provider_env == "gemini":
         if not gemini_key:
-            print("[WARNING] PROVIDER=gemini requires GEMINI_API_KEY. Falling back to mock provider.")
-            return MockAIProvider()
+            raise RuntimeError("PROVIDER=gemini requires GEMINI_API_KEY")
         try:
             from .gemini_provider import GeminiAIProvider
 
             return GeminiAIProvider(api_key=gemini_key)
         except Exception as e:
-            print(f"[WARNING] Gemini initialization failed: {e}. Using mock provider.")
-            return MockAIProvider()
+            raise RuntimeError(f"Gemini initialization failed: {e}") from e
 
     # Groq only
     if provider_env == "groq":
         if not groq_key:
-            print("[WARNING] PROVIDER=groq requires GROQ_API_KEY. Falling back to mock provider.")
-            return MockAIProvider()
+            raise RuntimeError("PROVIDER=groq requires GROQ_API_KEY")
         try:
             from .groq_provider import GroqAIProvider
 
             return GroqAIProvider(api_key=groq_key)
         except Exception as e:
-            print(f"[WARNING] Groq initialization failed: {e}. Using mock provider.")
-            return MockAIProvider()
+            raise RuntimeError(f"Groq initialization failed: {e}") from e
 
     # Default: mock
     return MockAIProvider()
 
+
+def get_provider() -> AIProvider:
+    """Return the configured AI provider instance.
+
+    The instance is built once per process and reused, so provider clients are
+    not re-initialised on every request. Call ``get_provider.cache_clear()``
+    after changing ``PROVIDER`` or API keys at runtime. If the configured
+    provider cannot be built, a mock provider is returned for this call only.
+
+    Logic:
+    - PROVIDER=gemma_with_groq_fallback -> Gemma (primary) + Groq (fallback)
+    - PROVIDER=gemini -> Gemini only
+    - PROVIDER=groq -> Groq only
+    - PROVIDER=mock -> Mock provider (default)
+    """
+    try:
+        return _configured_provider()
+    except Exception as e:
+        from .mock_provider import MockAIProvider  # local import to avoid cycles
+
+        print(f"[WARNING] {e}. Falling back to mock provider.")
+        return MockAIProvider()
+
+
+get_provider.cache_clear = _configured_provider.cache_clear  # type: ignore[attr-defined]
@@ -0,0 +1,25 @@
+"""Short-lived cache for audit log totals.
+
+``GET /audit`` counts the rows matching each normalized filter set, which is
+the slow half of every page. The totals are kept for up to 30 seconds and are
+cleared whenever audit rows are written, by the request handlers as well as by
+the background audit writer.
+"""
+from __future__ import annotations
+
+from typing import Callable, Hashable
+
+from ttl_cache import TTLCache
+
+# Cached per normalized filter set (never per page).
+_AUDIT_COUNT_CACHE: TTLCache[int] = TTLCache(maxsize=512, ttl_seconds=30.0)
+
+
+def cached_audit_count(key: Hashable, factory: Callable[[], int]) -> int:
+    """Return the cached total for ``key``, counting with ``factory`` on miss."""
+    return _AUDIT_COUNT_CACHE.get_or_set(key, factory)
+
+
+def invalidate_audit_counts() -> None:
+    """Forget cached audit totals after audit rows have been written."""
+    _AUDIT_COUNT_CACHE.clear()
@@ -0,0 +1,231 @@
+"""Batched, off-request-path writer for AuditEvent rows.
+
+State-transition endpoints commit their own row changes synchronously and hand
+the accompanying audit entry to this writer. A background thread drains the
+queue every couple of seconds (or as soon as a full batch is waiting) and
+inserts the whole batch in one transaction, so mutation endpoints no longer
+pay for a second commit per request.
+
+The endpoints are sync FastAPI handlers running in Starlette's threadpool, so
+the queue is a thread-safe ``queue.Queue`` rather than an ``asyncio.Queue``.
+
+Handlers whose audit row must commit atomically with their own changes use
+``add_audit_event`` instead; either way the cached audit totals are cleared
+once the row is committed.
+"""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from audit_cache import invalidate_audit_counts
+from db import SessionLocal
+from db_utils import run_with_retry
+from models import AuditEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0
+DEFAULT_MAX_ATTEMPTS = 5
+
+# Session.info flag: the open transaction has added AuditEvent rows.
+_AUDIT_ROWS_PENDING = "audit_rows_pending"
+
+
+@dataclass
+class AuditEventPayload:
+    event_type: str
+    alert_id: Optional[int] = None
+    run_id: Optional[int] = None
+    actor: str = "Kunal Jha"
+    details: Dict[str, Any] = field(default_factory=dict)
+    # Stamped when the event happens, not when the batch is flushed.
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    # Failed flushes so far; bookkeeping only, not an AuditEvent column.
+    attempts: int = field(default=0, repr=False)
+
+    def as_row(self) -> Dict[str, Any]:
+        row = asdict(self)
+        del row["attempts"]
+        return row
+
+
+class AuditEventWriter:
+    """Queue audit events and insert them in batches from a daemon thread."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_attempts = max_attempts
+        self._queue: "queue.Queue[AuditEventPayload]" = queue.Queue()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the flusher thread and write anything still queued."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.flush()
+
+    def submit(self, payload: AuditEventPayload) -> None:
+        self._queue.put(payload)
+        if not self.running:
+            # No flusher (CLI scripts, tests): keep the old write-through behaviour.
+            self.flush()
+        elif self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Drain the queue synchronously; returns the number of rows written.
+
+        Events that could not be written are put back on the queue once the
+        drain is over, so the next flush retries them. An event that has failed
+        ``max_attempts`` flushes is logged in full and dropped instead, so one
+        poisoned row cannot be retried by every later flush forever.
+        """
+        written = 0
+        failed: List[AuditEventPayload] = []
+        with self._flush_lock:
+            while True:
+                batch = self._drain(self.batch_size)
+                if not batch:
+                    break
+                batch_failed = self._write_batch(batch)
+                written += len(batch) - len(batch_failed)
+                failed.extend(batch_failed)
+            for payload in failed:
+                payload.attempts += 1
+                if payload.attempts < self.max_attempts:
+                    self._queue.put(payload)
+                else:
+                    logger.error(
+                        "Dropping audit event after %d failed inserts: %r",
+                        payload.attempts,
+                        payload.as_row(),
+                    )
+        if written:
+            invalidate_audit_counts()
+        return written
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self.flush_interval_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Audit writer flush failed")
+
+    def _drain(self, limit: int) -> List[AuditEventPayload]:
+        batch: List[AuditEventPayload] = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_batch(self, batch: List[AuditEventPayload]) -> List[AuditEventPayload]:
+        """Insert ``batch`` in one transaction; returns the events left unwritten.
+
+        If the batch insert fails, fall back to one insert per event so a
+        single bad row cannot take the rest of the batch down with it.
+        """
+        try:
+            rows = [payload.as_row() for payload in batch]
+            run_with_retry(lambda: self._insert_rows(rows))
+            return []
+        except Exception:
+            logger.warning(
+                "Batch insert of %d audit events failed; retrying one at a time",
+                len(batch),
+                exc_info=True,
+            )
+
+        failed: List[AuditEventPayload] = []
+        for payload in batch:
+            try:
+                row = payload.as_row()
+                run_with_retry(lambda: self._insert_rows([row]))
+            except Exception:
+                failed.append(payload)
+        if failed:
+            logger.error("%d audit events failed to insert", len(failed))
+        return failed
+
+    def _insert_rows(self, rows: List[Dict[str, Any]]) -> None:
+        with self._session_factory() as session:
+            session.execute(insert(AuditEvent), rows)
+            session.commit()
+
+
+audit_writer = AuditEventWriter()
+
+
+def record_audit_event(
+    event_type: str,
+    *,
+    alert_id: Optional[int] = None,
+    run_id: Optional[int] = None,
+    actor: str = "Kunal Jha",
+    details: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Queue an audit event on the shared writer."""
+    audit_writer.submit(
+        AuditEventPayload(
+            event_type=event_type,
+            alert_id=alert_id,
+            run_id=run_id,
+            actor=actor,
+            details=details or {},
+        )
+    )
+
+
+def add_audit_event(db: Session, audit_event: AuditEvent) -> AuditEvent:
+    """Add ``audit_event`` to ``db``'s transaction; cached totals clear when it commits."""
+    db.add(audit_event)
+    db.info[_AUDIT_ROWS_PENDING] = True
+    return audit_event
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_audit_counts_after_commit(session: Session) -> None:
+    if session.info.pop(_AUDIT_ROWS_PENDING, False):
+        invalidate_audit_counts()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_pending_audit_rows(session: Session) -> None:
+    session.info.pop(_AUDIT_ROWS_PENDING, None)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import os
 import random
@@ -26,7 +25,7 @@ logging.getLogger("google.genai").setLevel(logging.WARNING)
 from ai.provider import get_provider
 from db import SessionLocal
 from db_utils import run_with_retry
-from generate_client_insights import generate_client_insights
+from generate_client_insights import generate_client_insights, write_client_insights
 from operator_engine import run_operator
 from seed import main as seed_main
 
@@ -92,12 +91,7 @@ def parse_args() -> argparse.Namespace:
 
 def write_insights(limit: int) -> int:
     insights = generate_client_insights(limit=limit)
-    root = Path(__file__).resolve().parent.parent
-    data_dir = root / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
-    out_path = data_dir / "client_insights.json"
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(insights, f, indent=2)
+    write_client_insights(insights)
     return len(insights)
 
 
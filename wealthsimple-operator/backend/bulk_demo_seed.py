@@ -10,7 +10,9 @@ Or specify options:
 import argparse
 import random
 from datetime import datetime, timedelta
+from sqlalchemy import insert
 from db import session_scope, SessionLocal
+from db_utils import next_ids
 from models import (
     Client, Portfolio, Position, Run, Alert, AuditEvent,
     MeetingNote, FollowUpDraft, Priority, AlertStatus, AuditEventType,
@@ -282,10 +284,10 @@ def generate_alert(run_id: int, portfolio_id: int, client_id: int):
         "risk_score": risk,
     }
 
-def generate_meeting_note(client_id: int):
+def generate_meeting_note(client_id: int, now: datetime):
     """Generate a realistic meeting note with transcript."""
     days_ago = random.randint(1, 365)
-    meeting_date = datetime.utcnow() - timedelta(days=days_ago)
+    meeting_date = now - timedelta(days=days_ago)
 
     template = random.choice(NOTE_TEMPLATES)
     note_body = template.format(
@@ -307,7 +309,7 @@ def generate_meeting_note(client_id: int):
         "call_transcript": random.choice(TRANSCRIPTS) if random.random() > 0.4 else None,
     }
 
-def generate_follow_up_draft(alert_id: int, client_id: int, run_id: int):
+def generate_follow_up_draft(alert_id: int, client_id: int, run_id: int, now: datetime):
     """Generate a realistic follow-up email draft."""
     quarter = random.randint(1, 4)
     subject_template = random.choice(EMAIL_SUBJECTS)
@@ -330,7 +332,7 @@ def generate_follow_up_draft(alert_id: int, client_id: int, run_id: int):
         "generation_provider": "mock",
         "generated_from": {"alert_id": alert_id},
         "approved_by": "demo_user" if random.random() > 0.5 else None,
-        "approved_at": datetime.utcnow() if random.random() > 0.5 else None,
+        "approved_at": now if random.random() > 0.5 else None,
     }
 
 # ============================================================================
@@ -340,6 +342,7 @@ def generate_follow_up_draft(alert_id: int, client_id: int, run_id: int):
 def bulk_seed(num_clients: int = 20, alerts_per_run: int = 20, num_notes: int = 30, num_runs: int = 3):
     """Generate bulk demo data."""
     session = SessionLocal()
+    now = datetime.utcnow()
 
     try:
         print(f"\n[*] Bulk Demo Seeding")
@@ -354,28 +357,31 @@ def bulk_seed(num_clients: int = 20, alerts_per_run: int = 20, num_notes: int =
         portfolios = []
         positions = []
 
+        # Ids are assigned here so the clients and portfolios flush as one
+        # executemany each; positions skip the ORM and go in as plain rows.
+        client_ids = next_ids(session, Client)
+        portfolio_ids = next_ids(session, Portfolio)
+        position_rows = []
+
         for i in range(num_clients):
             client_data = generate_client()
-            client = Client(**client_data)
+            client = Client(id=next(client_ids), **client_data)
             session.add(client)
-            session.flush()
             clients.append(client)
 
             # 1-3 portfolios per client
             for _ in range(random.randint(1, 3)):
                 portfolio_data = generate_portfolio(client.id)
-                portfolio = Portfolio(**portfolio_data)
+                portfolio = Portfolio(id=next(portfolio_ids), **portfolio_data)
                 session.add(portfolio)
-                session.flush()
                 portfolios.append(portfolio)
 
                 # 5-10 positions per portfolio
-                position_data = generate_positions(portfolio.id, portfolio_data["total_value"])
-                for pos in position_data:
-                    position = Position(**pos)
-                    session.add(position)
+                position_rows.extend(generate_positions(portfolio.id, portfolio_data["total_value"]))
 
-        session.commit()
+        session.flush()
+        if position_rows:
+            session.execute(insert(Position), position_rows)
         print(f"   [OK] Created {len(clients)} clients, {len(portfolios)} portfolios")
 
         # ====== RUNS & ALERTS ======
@@ -383,7 +389,7 @@ def bulk_seed(num_clients: int = 20, alerts_per_run: int = 20, num_notes: int =
         total_alerts = 0
 
         for run_num in range(num_runs):
-            run_date = datetime.utcnow() - timedelta(days=random.randint(1, 30))
+            run_date = now - timedelta(days=random.randint(1, 30))
             run = Run(started_at=run_date, completed_at=run_date, alerts_created=0, provider_used="mock")
             session.add(run)
             session.flush()
@@ -401,7 +407,7 @@ def bulk_seed(num_clients: int = 20, alerts_per_run: int = 20, num_notes: int =
 
                 # Occasionally add follow-up draft
                 if random.random() > 0.6:
-                    draft_data = generate_follow_up_draft(alert.id, client.id, run.id)
+                    draft_data = generate_follow_up_draft(alert.id, client.id, run.id, now)
                     draft = FollowUpDraft(**draft_data)
                     session.add(draft)
 
@@ -418,7 +424,6 @@ def bulk_seed(num_clients: int = 20, alerts_per_run: int = 20, num_notes: int =
                 total_alerts += 1
 
             run.alerts_created = run_alerts
-            session.commit()
             print(f"   [OK] Run {run_num + 1}: {run_alerts} alerts")
 
         print(f"   [OK] Total alerts: {total_alerts}")
@@ -427,12 +432,11 @@ def bulk_seed(num_clients: int = 20, alerts_per_run: int = 20, num_notes: int =
         print("[*] Creating meeting notes...")
         for i in range(num_notes):
             client = random.choice(clients)
-            note_data = generate_meeting_note(client.id)
+            note_data = generate_meeting_note(client.id, now)
             note = MeetingNote(**note_data)
             session.add(note)
 
             if (i + 1) % 10 == 0:
-                session.commit()
                 print(f"   [OK] Created {i + 1} meeting notes...")
 
         session.commit()
@@ -11,7 +11,9 @@ Run: python bulk_demo_seed_v2.py --clients 40 --runs 5 --alerts-per-run 25 --not
 import argparse
 import random
 from datetime import datetime, timedelta
+from sqlalchemy import insert
 from db import SessionLocal
+from db_utils import next_ids
 from models import (
     Client, Portfolio, Position, Run, Alert, AuditEvent,
     MeetingNote, FollowUpDraft, Priority, AlertStatus, AuditEventType,
@@ -266,10 +268,10 @@ def get_alert_context(alert_title: str) -> str:
     else:
         return "default"
 
-def generate_context_aware_meeting_note(client_id: int, alert: dict = None):
+def generate_context_aware_meeting_note(client_id: int, now: datetime, alert: dict = None):
     """Generate meeting note that relates to alert if provided."""
     days_ago = random.randint(1, 30)
-    meeting_date = datetime.utcnow() - timedelta(days=days_ago)
+    meeting_date = now - timedelta(days=days_ago)
 
     # Determine context
     context_type = "default"
@@ -318,6 +320,7 @@ def generate_context_aware_meeting_note(client_id: int, alert: dict = None):
 def bulk_seed(num_clients: int = 20, alerts_per_run: int = 20, num_notes: int = 30, num_runs: int = 3):
     """Generate bulk demo data with context-aware notes."""
     session = SessionLocal()
+    now = datetime.utcnow()
 
     try:
         print(f"\n[*] Bulk Demo Seeding (v2 - Context-Aware)")
@@ -337,28 +340,29 @@ def bulk_seed(num_clients: int = 20, alerts_per_run: int = 20, num_notes: int =
         clients = []
         portfolios = []
 
+        client_ids = next_ids(session, Client)
+        portfolio_ids = next_ids(session, Portfolio)
+        position_rows = []
+
         for i in range(num_clients):
             client_data = generate_client()
-            client = Client(**client_data)
+            client = Client(id=next(client_ids), **client_data)
             session.add(client)
-            session.flush()
             clients.append(client)
 
             # 1-3 portfolios per client
             for _ in range(random.randint(1, 3)):
                 portfolio_data = generate_portfolio(client.id)
-                portfolio = Portfolio(**portfolio_data)
+                portfolio = Portfolio(id=next(portfolio_ids), **portfolio_data)
                 session.add(portfolio)
-                session.flush()
                 portfolios.append(portfolio)
 
                 # Positions
-                position_data = generate_positions(portfolio.id, portfolio_data["total_value"])
-                for pos in position_data:
-                    position = Position(**pos)
-                    session.add(position)
+                position_rows.extend(generate_positions(portfolio.id, portfolio_data["total_value"]))
 
-        session.commit()
+        session.flush()
+        if position_rows:
+            session.execute(insert(Position), position_rows)
         print(f"   [OK] Created {len(clients)} clients, {len(portfolios)} portfolios")
 
         # ====== RUNS & ALERTS ======
@@ -367,7 +371,7 @@ def bulk_seed(num_clients: int = 20, alerts_per_run: int = 20, num_notes: int =
         all_alerts = []
 
         for run_num in range(num_runs):
-            run_date = datetime.utcnow() - timedelta(days=random.randint(1, 60))
+            run_date = now - timedelta(days=random.randint(1, 60))
             run = Run(started_at=run_date, completed_at=run_date, alerts_created=0, provider_used="mock")
             session.add(run)
             session.flush()
@@ -421,7 +425,6 @@ def bulk_seed(num_clients: int = 20, alerts_per_run: int = 20, num_notes: int =
                 total_alerts += 1
 
             run.alerts_created = run_alerts
-            session.commit()
             print(f"   [OK] Run {run_num + 1}: {run_alerts} alerts")
 
         print(f"   [OK] Total alerts: {total_alerts}")
@@ -435,18 +438,18 @@ def bulk_seed(num_clients: int = 20, alerts_per_run: int = 20, num_notes: int =
                 alert_ref = random.choice(all_alerts)
                 note_data = generate_context_aware_meeting_note(
                     alert_ref["client_id"],
+                    now,
                     {"_event_title": alert_ref.get("event_title", "Portfolio review")}
                 )
             else:
                 # Generic note for a random client
                 client = random.choice(clients)
-                note_data = generate_context_aware_meeting_note(client.id)
+                note_data = generate_context_aware_meeting_note(client.id, now)
 
             note = MeetingNote(**note_data)
             session.add(note)
 
             if (i + 1) % 10 == 0:
-                session.commit()
                 print(f"   [OK] Created {i + 1} meeting notes...")
 
         session.commit()
@@ -0,0 +1,36 @@
+"""Short-lived cache for the global dashboard responses.
+
+The risk dashboard, tax-loss scan, contact schedule and monitoring-universe
+endpoints are identical for every caller and only change when an operator run,
+alert action or contact/meeting-note write lands. Their responses are kept in
+process for up to a minute, and those writes clear the cache explicitly.
+Operator runs additionally rebuild the monitoring-universe entries right away
+(see ``refresh_dashboard``) so the first read after a run is not the slow one.
+"""
+from __future__ import annotations
+
+from typing import Callable, TypeVar
+
+from ttl_cache import TTLCache
+
+V = TypeVar("V")
+
+DASHBOARD_CACHE_TTL_SECONDS = 60.0
+
+_DASHBOARD_CACHE: TTLCache = TTLCache(maxsize=32, ttl_seconds=DASHBOARD_CACHE_TTL_SECONDS)
+
+
+def cached_dashboard(key: str, factory: Callable[[], V]) -> V:
+    """Return the cached response for ``key``, building it with ``factory`` on miss."""
+    return _DASHBOARD_CACHE.get_or_set(key, factory)
+
+
+def refresh_dashboard(key: str, factory: Callable[[], V]) -> V:
+    """Rebuild the entry for ``key`` now, whether or not it is cached."""
+    value = factory()
+    _DASHBOARD_CACHE.set(key, value)
+    return value
+
+
+def invalidate_dashboards() -> None:
+    _DASHBOARD_CACHE.clear()
@@ -6,9 +6,10 @@ from pathlib import Path
 from typing import Generator
 from urllib.parse import unquote
 
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
 
-from db_utils import create_sqlite_engine
+from db_utils import DEFAULT_MAX_OVERFLOW, DEFAULT_POOL_SIZE, create_sqlite_engine
 
 
 DEFAULT_DB_PATH = Path(__file__).resolve().parent / "operator.db"
@@ -34,12 +35,29 @@ def _resolve_database_url() -> str:
 
 SQLALCHEMY_DATABASE_URL = _resolve_database_url()
 
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", str(DEFAULT_POOL_SIZE)))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", str(DEFAULT_MAX_OVERFLOW)))
+
 engine = create_sqlite_engine(
     SQLALCHEMY_DATABASE_URL,
     busy_timeout_seconds=30,
     check_same_thread=False,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Keep attributes loaded after commit: mutation endpoints build their response
+# from the objects they just wrote, and expiring them would cost a SELECT each.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+# Sessions for read-only dashboard GETs. pysqlite does not emit BEGIN before a
+# SELECT, so each query would otherwise read its own WAL snapshot; opening the
+# read transaction explicitly makes a multi-query build see one consistent view.
+ReadOnlySessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+
+@event.listens_for(ReadOnlySessionLocal, "after_begin")
+def _begin_read_transaction(session, transaction, connection) -> None:
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("BEGIN")
 
 Base = declarative_base()
 
@@ -52,6 +70,20 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_readonly_db() -> Generator[Session, None, None]:
+    """Session for GET handlers that never write; always rolled back on exit.
+
+    The connection is only checked out on the first query, so handlers served
+    from a cache do not touch the pool at all.
+    """
+    db = ReadOnlySessionLocal()
+    try:
+        yield db
+    finally:
+        db.rollback()
+        db.close()
+
+
 @contextmanager
 def session_scope() -> Generator[Session, None, None]:
     """Provide a transactional scope around a series of operations."""
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -11,7 +10,7 @@ from sqlalchemy import text
 from ai.provider import get_provider
 from db import SessionLocal
 from db_utils import run_with_retry
-from generate_client_insights import generate_client_insights
+from generate_client_insights import generate_client_insights, write_client_insights
 from models import Alert, Client, Portfolio, Run
 from operator_engine import run_operator
 from seed import main as seed_main
@@ -69,10 +68,7 @@ def _has_required_schema() -> bool:
 
 def _write_insights(limit: int) -> int:
     insights = generate_client_insights(limit=limit)
-    root = Path(__file__).resolve().parent.parent
-    out_path = root / "data" / "client_insights.json"
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(insights, indent=2), encoding="utf-8")
+    write_client_insights(insights)
     return len(insights)
 
 
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
 from dotenv import load_dotenv
 from sqlalchemy import case
 from sqlalchemy.orm import Session, joinedload
@@ -13,11 +13,14 @@ from ai.provider import get_provider
 from db import SessionLocal
 from models import Alert, Client, Portfolio, Priority, MeetingNote
 from operator_engine import _compute_metrics, _latest_metrics_for_portfolio
+from ttl_cache import TTLCache
 
 
 # Ensure GEMINI_API_KEY / PROVIDER from backend/.env are available when the script runs
 load_dotenv(dotenv_path=Path(__file__).with_name(".env"), override=False)
 
+CLIENT_INSIGHTS_PATH = Path(__file__).resolve().parent.parent / "data" / "client_insights.json"
+
 
 def build_context(portfolio: Portfolio, client: Client) -> Dict[str, Any]:
   """Build a lightweight context object for Gemini/mock scoring."""
@@ -115,6 +118,20 @@ def _allocation_breakdown(portfolio: Portfolio) -> Dict[str, float]:
   }
 
 
+# Allocation only depends on a portfolio's positions, so it is versioned by
+# Portfolio.updated_at; the TTL just bounds staleness from out-of-band writes.
+_ALLOCATION_CACHE: TTLCache[Dict[str, float]] = TTLCache(maxsize=1024, ttl_seconds=3600.0)
+
+
+def _allocation_breakdown_cached(portfolio: Portfolio) -> Dict[str, float]:
+  """_allocation_breakdown memoized per (portfolio.id, portfolio.updated_at).
+
+  Positions are only loaded on a cache miss, so callers should not eager-load them.
+  """
+  key = (portfolio.id, portfolio.updated_at)
+  return dict(_ALLOCATION_CACHE.get_or_set(key, lambda: _allocation_breakdown(portfolio)))
+
+
 def _build_recent_meeting_notes(
   client_id: int,
   last_meeting: datetime,
@@ -479,16 +496,20 @@ def generate_client_insights(limit: int = 50) -> List[Dict[str, Any]]:
     session.close()
 
 
-def main() -> None:
-  insights = generate_client_insights(limit=50)
+def write_client_insights(
+  insights: List[Dict[str, Any]], output_path: Path = CLIENT_INSIGHTS_PATH
+) -> Path:
+  """Write the insights snapshot as indented JSON (encoded by orjson, written as bytes)."""
+  output_path.parent.mkdir(parents=True, exist_ok=True)
+  output_path.write_bytes(
+    orjson.dumps(insights, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+  )
+  return output_path
 
-  root = Path(__file__).resolve().parent.parent
-  data_dir = root / "data"
-  data_dir.mkdir(parents=True, exist_ok=True)
-  output_path = data_dir / "client_insights.json"
 
-  with output_path.open("w", encoding="utf-8") as f:
-    json.dump(insights, f, indent=2)
+def main() -> None:
+  insights = generate_client_insights(limit=50)
+  output_path = write_client_insights(insights)
 
   print(f"Wrote {len(insights)} client insights to {output_path}")
 
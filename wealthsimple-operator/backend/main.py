@@ -5,22 +5,30 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
+import anyio.to_thread
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from ai.provider import get_provider
-from db import Base, engine, get_db
-from models import Run
+from audit_writer import audit_writer
+from db import DB_MAX_OVERFLOW, DB_POOL_SIZE, Base, engine, get_db
+from models import ALERT_PRIORITY_RANK_SQL, Run
 from routes import alerts, audit, contacts, meeting_notes, operator, portfolios, risk_dashboard, simulations, tax_loss
 
 
 # Load backend/.env so GEMINI_API_KEY and PROVIDER are available
 load_dotenv(dotenv_path=Path(__file__).with_name(".env"), override=False)
 
-app = FastAPI(title="Wealthsimple Operator Console Backend")
+# orjson renders the (already validated) response payloads several times faster
+# than the stdlib encoder, which matters on the list endpoints.
+app = FastAPI(
+    title="Wealthsimple Operator Console Backend",
+    default_response_class=ORJSONResponse,
+)
 
 # Relaxed CORS for local development so the frontend can reach the API
 app.add_middleware(
@@ -47,6 +55,33 @@ def on_startup() -> None:
     # Ensure database schema is created.
     Base.metadata.create_all(bind=engine)
     _run_startup_migrations()
+    alerts.fail_interrupted_follow_up_drafts()
+    # Sync endpoints each hold a pooled connection while running in the
+    # threadpool; keep the two the same size so requests never queue twice.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = DB_POOL_SIZE + DB_MAX_OVERFLOW
+    audit_writer.start()
+
+
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+    # Write any audit events still waiting in the batch queue.
+    audit_writer.stop()
+
+
+# Keep these additive-only so existing data is preserved.
+_REQUIRED_COLUMNS: Dict[str, Dict[str, str]] = {
+    "meeting_notes": {
+        "action_item_completions": "JSON",
+    },
+    "portfolios": {
+        "updated_at": "DATETIME",
+    },
+    # SQLite cannot ADD a STORED generated column, so upgraded databases get a
+    # VIRTUAL one; it is still indexable.
+    "alerts": {
+        "priority_rank": f"SMALLINT GENERATED ALWAYS AS ({ALERT_PRIORITY_RANK_SQL}) VIRTUAL",
+    },
+}
 
 
 def _run_startup_migrations() -> None:
@@ -55,24 +90,31 @@ def _run_startup_migrations() -> None:
         return
 
     with engine.begin() as conn:
-        table_exists = conn.execute(
-            text("SELECT 1 FROM sqlite_master WHERE type='table' AND name='meeting_notes' LIMIT 1")
-        ).fetchone()
-        if not table_exists:
-            return
-
-        rows = conn.execute(text("PRAGMA table_info(meeting_notes)")).fetchall()
-        existing_columns = {row[1] for row in rows}
-
-        # Keep this list additive-only so existing data is preserved.
-        required_columns: Dict[str, str] = {
-            "action_item_completions": "JSON",
-        }
-
-        for column_name, column_type in required_columns.items():
-            if column_name in existing_columns:
+        for table_name, required_columns in _REQUIRED_COLUMNS.items():
+            table_exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:name LIMIT 1"),
+                {"name": table_name},
+            ).fetchone()
+            if not table_exists:
                 continue
-            conn.execute(text(f"ALTER TABLE meeting_notes ADD COLUMN {column_name} {column_type}"))
+
+            # table_xinfo (unlike table_info) also reports generated columns.
+            rows = conn.execute(text(f"PRAGMA table_xinfo({table_name})")).fetchall()
+            existing_columns = {row[1] for row in rows}
+
+            for column_name, column_type in required_columns.items():
+                if column_name in existing_columns:
+                    continue
+                conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"))
+
+        # Portfolios from before updated_at existed would all share a NULL cache
+        # version in _allocation_breakdown_cached; start them at created_at.
+        conn.execute(text("UPDATE portfolios SET updated_at = created_at WHERE updated_at IS NULL"))
+
+        # create_all() skips indexes on tables that already exist; add any new ones.
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
 
 
 app.include_router(operator.router)
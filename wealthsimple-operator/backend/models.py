@@ -9,16 +9,22 @@ from sqlalchemy import (
     JSON,
     Boolean,
     Column,
+    Computed,
     DateTime,
     Enum as SAEnum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
+    SmallInteger,
     String,
     Text,
+    event,
+    inspect,
+    update,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from db import Base
 
@@ -56,6 +62,8 @@ class AuditEventType(str, Enum):
 
 
 class FollowUpDraftStatus(str, Enum):
+    GENERATING = "GENERATING"
+    GENERATION_FAILED = "GENERATION_FAILED"
     PENDING_APPROVAL = "PENDING_APPROVAL"
     APPROVED_READY = "APPROVED_READY"
     REJECTED = "REJECTED"
@@ -75,6 +83,11 @@ class MeetingNoteType(str, Enum):
     REVIEW = "review"
 
 
+ALERT_PRIORITY_RANK_SQL = (
+    "CASE priority WHEN 'HIGH' THEN 0 WHEN 'MEDIUM' THEN 1 WHEN 'LOW' THEN 2 ELSE 99 END"
+)
+
+
 class Client(Base):
     __tablename__ = "clients"
 
@@ -109,6 +122,11 @@ class Portfolio(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, nullable=False
     )
+    # Bumped whenever the portfolio or any of its positions change (see
+    # _touch_portfolios_with_changed_positions); used as a cache version.
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=True
+    )
 
     client: Mapped[Client] = relationship("Client", back_populates="portfolios")
     positions: Mapped[List["Position"]] = relationship(
@@ -123,7 +141,10 @@ class Position(Base):
     __tablename__ = "positions"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    portfolio_id: Mapped[int] = mapped_column(ForeignKey("portfolios.id"), nullable=False)
+    # active_history keeps the old id on reassignment, so both portfolios get touched.
+    portfolio_id: Mapped[int] = mapped_column(
+        ForeignKey("portfolios.id"), nullable=False, active_history=True
+    )
     ticker: Mapped[str] = mapped_column(String, nullable=False)
     asset_class: Mapped[str] = mapped_column(String, nullable=False)
     weight: Mapped[float] = mapped_column(Float, nullable=False)
@@ -132,6 +153,33 @@ class Position(Base):
     portfolio: Mapped[Portfolio] = relationship("Portfolio", back_populates="positions")
 
 
+@event.listens_for(Session, "before_flush")
+def _touch_portfolios_with_changed_positions(session: Session, flush_context, instances) -> None:
+    """Bump Portfolio.updated_at once per flush for portfolios whose positions changed.
+
+    Both the FK column and the relationship are consulted, current and previous
+    values alike: a position appended via ``portfolio.positions`` has no
+    portfolio_id until this flush, and a reassigned position changes two
+    portfolios. New portfolios are skipped; their INSERT sets updated_at.
+    """
+    portfolio_ids = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, Position):
+            continue
+        attrs = inspect(obj).attrs
+        portfolio_ids.update(attrs.portfolio_id.history.sum())
+        portfolio_ids.update(p.id for p in attrs.portfolio.history.sum() if p is not None)
+    portfolio_ids.discard(None)
+    if portfolio_ids:
+        # Core statement on the flush's connection, so it cannot re-trigger autoflush.
+        portfolios = Portfolio.__table__
+        session.connection().execute(
+            update(portfolios)
+            .where(portfolios.c.id.in_(portfolio_ids))
+            .values(updated_at=datetime.utcnow())
+        )
+
+
 class Run(Base):
     __tablename__ = "runs"
 
@@ -162,6 +210,12 @@ class Alert(Base):
     )
 
     priority: Mapped[Priority] = mapped_column(SAEnum(Priority), nullable=False)
+    # Sortable rank derived by the database from `priority` (HIGH=0 .. LOW=2) so
+    # the alert queue ORDER BY can be served from an index instead of a CASE sort.
+    priority_rank: Mapped[int] = mapped_column(
+        SmallInteger,
+        Computed(ALERT_PRIORITY_RANK_SQL, persisted=True),
+    )
     confidence: Mapped[int] = mapped_column(Integer, nullable=False)
     event_title: Mapped[str] = mapped_column(String, nullable=False)
     summary: Mapped[str] = mapped_column(Text, nullable=False)
@@ -190,6 +244,17 @@ class Alert(Base):
         "FollowUpDraft", back_populates="alert", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Matches the alert queue ordering in routes/alerts.list_alerts.
+        Index(
+            "ix_alerts_queue_order",
+            "priority_rank",
+            created_at.desc(),
+            confidence.desc(),
+            id.desc(),
+        ),
+    )
+
 
 class FollowUpDraft(Base):
     __tablename__ = "follow_up_drafts"
@@ -215,6 +280,11 @@ class FollowUpDraft(Base):
     alert: Mapped[Alert] = relationship("Alert", back_populates="follow_up_drafts")
     client: Mapped[Client] = relationship("Client")
 
+    __table_args__ = (
+        # Latest-draft lookup per alert in routes/alerts.get_follow_up_draft.
+        Index("ix_follow_up_drafts_alert_created", "alert_id", created_at.desc()),
+    )
+
 
 class ReallocationPlan(Base):
     __tablename__ = "reallocation_plans"
@@ -271,6 +341,12 @@ class MeetingNote(Base):
 
     client: Mapped[Client] = relationship("Client", back_populates="meeting_notes")
 
+    __table_args__ = (
+        # Latest note per client: the contact schedule's correlated MAX(meeting_date),
+        # the per-client note list and the call script / pre-call brief lookups.
+        Index("ix_meeting_notes_client_date", "client_id", meeting_date.desc()),
+    )
+
 
 class AuditEvent(Base):
     __tablename__ = "audit_events"
@@ -293,6 +369,13 @@ class AuditEvent(Base):
     alert: Mapped[Optional[Alert]] = relationship("Alert", back_populates="audit_events")
     run: Mapped[Optional[Run]] = relationship("Run", back_populates="audit_events")
 
+    __table_args__ = (
+        # Type-filtered audit log ordering in routes/audit.py. The unfiltered
+        # (created_at, id) order is already served by the created_at index,
+        # since SQLite appends the rowid (id) to every index.
+        Index("ix_audit_events_type_created", "event_type", created_at.desc(), id.desc()),
+    )
+
 
 # ---------- Pydantic Schemas ----------
 
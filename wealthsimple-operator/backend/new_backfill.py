@@ -613,6 +613,8 @@ def enrich_existing_alerts(db):
         ),
     }
 
+    scenario_labels = {s["key"]: s["label"] for s in SCENARIOS}
+
     for idx, alert in enumerate(open_alerts, 1):
         print(f"[{idx}/{len(open_alerts)}] Enriching alert for {alert.client.name} - {alert.event_title}")
 
@@ -627,11 +629,11 @@ def enrich_existing_alerts(db):
             # Fallback: use change detection or scenario matching
             if alert.change_detection:
                 detected = alert.change_detection[0].get("to", "")
-                scenario_key = detected if detected in [s["key"] for s in SCENARIOS] else SCENARIOS[alert.id % len(SCENARIOS)]["key"]
+                scenario_key = detected if detected in scenario_labels else SCENARIOS[alert.id % len(SCENARIOS)]["key"]
             else:
                 scenario_key = SCENARIOS[alert.id % len(SCENARIOS)]["key"]
 
-        scenario_label = next((s["label"] for s in SCENARIOS if s["key"] == scenario_key), "Unknown")
+        scenario_label = scenario_labels.get(scenario_key, "Unknown")
 
         # Generate meeting note for this alert
         base_date = now - timedelta(days=random.randint(7, 21))
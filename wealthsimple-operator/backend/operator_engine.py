@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session, joinedload
 from ai.provider import AIProvider
 
 logger = logging.getLogger(__name__)
+from audit_writer import add_audit_event
 from db import session_scope
 from models import (
     Alert,
@@ -251,7 +252,8 @@ def run_operator(db: Session, provider: AIProvider, actor: str = "Kunal Jha", un
         )
 
     # Run-level audit start
-    db.add(
+    add_audit_event(
+        db,
         AuditEvent(
             run_id=run.id,
             event_type=AuditEventType.RUN_STARTED,
@@ -291,7 +293,8 @@ def run_operator(db: Session, provider: AIProvider, actor: str = "Kunal Jha", un
         )
         db.add(alert)
 
-        db.add(
+        add_audit_event(
+            db,
             AuditEvent(
                 alert_id=alert.id,
                 run_id=run.id,
@@ -320,7 +323,8 @@ def run_operator(db: Session, provider: AIProvider, actor: str = "Kunal Jha", un
     run.alerts_created = alerts_created
     run.completed_at = datetime.utcnow()
 
-    db.add(
+    add_audit_event(
+        db,
         AuditEvent(
             run_id=run.id,
             event_type=AuditEventType.RUN_COMPLETED,
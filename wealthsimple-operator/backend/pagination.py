@@ -0,0 +1,61 @@
+"""Keyset (cursor) pagination helpers shared by the list endpoints.
+
+A cursor is an opaque, URL-safe token holding the sort-key values of the last
+row on the previous page. The next page is selected with a WHERE clause that
+seeks past those values, so the database never scans and discards skipped
+rows the way OFFSET does.
+"""
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+# (column expression, cursor value, descending?)
+KeysetColumn = Tuple[ColumnElement, Any, bool]
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """Encode sort-key values into an opaque cursor token."""
+    payload = {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in values.items()
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, *, datetime_keys: Sequence[str] = ()) -> Dict[str, Any]:
+    """Decode a cursor token, raising ValueError when it is malformed."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as exc:
+        raise ValueError("Malformed pagination cursor") from exc
+    if not isinstance(payload, dict):
+        raise ValueError("Malformed pagination cursor")
+    for key in datetime_keys:
+        try:
+            payload[key] = datetime.fromisoformat(payload[key])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError("Malformed pagination cursor") from exc
+    return payload
+
+
+def keyset_condition(keys: Sequence[KeysetColumn]) -> ColumnElement:
+    """Build the "strictly after this row" predicate for a mixed-direction sort.
+
+    For keys (a asc, b desc, c desc) this expands to
+    ``a > :a OR (a = :a AND b < :b) OR (a = :a AND b = :b AND c < :c)``,
+    which matches the ORDER BY exactly and stays index-friendly.
+    """
+    clauses = []
+    for i, (column, value, descending) in enumerate(keys):
+        prefix = [keys[j][0] == keys[j][1] for j in range(i)]
+        step = column < value if descending else column > value
+        clauses.append(and_(*prefix, step) if prefix else step)
+    return or_(*clauses)
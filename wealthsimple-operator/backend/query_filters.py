@@ -0,0 +1,24 @@
+"""Parsing helpers for comma-separated query-string filters.
+
+List endpoints accept filters such as ``priority=HIGH,MEDIUM``. The same few
+strings arrive on almost every request, so parsed results are memoized.
+"""
+from __future__ import annotations
+
+import functools
+from enum import Enum
+from typing import Tuple, Type, TypeVar
+
+E = TypeVar("E", bound=Enum)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_csv(raw: str) -> Tuple[str, ...]:
+    """Split ``raw`` on commas into sorted, de-duplicated, upper-cased tokens."""
+    return tuple(sorted({part.strip().upper() for part in raw.split(",") if part.strip()}))
+
+
+@functools.lru_cache(maxsize=256)
+def parse_enum_csv(raw: str, enum_cls: Type[E]) -> Tuple[E, ...]:
+    """Parse ``raw`` into members of ``enum_cls``, silently dropping unknown names."""
+    return tuple(enum_cls[name] for name in parse_csv(raw) if name in enum_cls.__members__)
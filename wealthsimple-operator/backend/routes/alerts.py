@@ -1,35 +1,25 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import anyio
+import anyio.to_thread
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import case
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import case, exists
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
 from ai.provider import get_provider
-from db import get_db
-
-logger = logging.getLogger(__name__)
-
-# Cache file path for pre-generated reallocation rationales
-REALLOCATION_CACHE_FILE = Path(__file__).parent.parent / ".reallocation_cache.json"
-
-
-def _load_reallocation_cache() -> Dict[str, str]:
-    """Load pre-generated reallocation AI rationales cache."""
-    if not REALLOCATION_CACHE_FILE.exists():
-        return {}
-    try:
-        with open(REALLOCATION_CACHE_FILE, "r") as f:
-            return json.load(f)
-    except Exception:
-        return {}
-from generate_client_insights import _allocation_breakdown, _build_profile_view
+from audit_writer import add_audit_event, record_audit_event
+from dashboard_cache import invalidate_dashboards
+from db import SessionLocal, get_db
+from db_utils import lazy_limiter
+from generate_client_insights import _allocation_breakdown_cached, _build_profile_view
 from models import (
     Alert,
     AlertDetail,
@@ -37,6 +27,7 @@ from models import (
     AlertSummary,
     AuditEvent,
     AuditEventType,
+    Client,
     ClientSummary,
     FollowUpDraft,
     FollowUpDraftStatus,
@@ -52,13 +43,51 @@ from models import (
     ReallocationPlanView,
     ReallocationTrade,
 )
+from pagination import decode_cursor, encode_cursor, keyset_condition
+from query_filters import parse_enum_csv
+from ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Cache file path for pre-generated reallocation rationales
+REALLOCATION_CACHE_FILE = Path(__file__).parent.parent / ".reallocation_cache.json"
+
+
+def _load_reallocation_cache() -> Dict[str, str]:
+    """Load pre-generated reallocation AI rationales cache."""
+    if not REALLOCATION_CACHE_FILE.exists():
+        return {}
+    try:
+        with open(REALLOCATION_CACHE_FILE, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
 
 router = APIRouter(prefix="/alerts", tags=["alerts"])
 
+# COUNT(*) over the filtered alert set dominates list latency; cache it briefly
+# per filter combination and drop it whenever alerts are created or updated.
+_ALERT_COUNT_CACHE: TTLCache[int] = TTLCache(maxsize=512, ttl_seconds=30.0)
+
+
+def invalidate_alert_counts() -> None:
+    """Forget cached alert totals after alerts are created or change status."""
+    _ALERT_COUNT_CACHE.clear()
+
+
+# ORDER BY expressions are built once per process rather than per request.
+_DRAFT_STATUS_RANK = case(
+    (FollowUpDraft.status == FollowUpDraftStatus.PENDING_APPROVAL, 0),
+    (FollowUpDraft.status == FollowUpDraftStatus.APPROVED_READY, 1),
+    else_=2,
+)
+
 
 class AlertsListResponse(BaseModel):
     items: List[AlertSummary]
     total: int
+    next_cursor: Optional[str] = None
 
 
 class AlertActionRequest(BaseModel):
@@ -87,6 +116,8 @@ class ReallocationPlanRequest(BaseModel):
     target_cash_amount: float = 266000.0  # Magic value: 266000 triggers intelligent calculation based on alert severity (concentration, drift, volatility); user-set values override
 
 
+# Pure functions of a small ticker universe, recomputed on every plan otherwise.
+@functools.lru_cache(maxsize=4096)
 def _estimate_unit_price(ticker: str, asset_class: str) -> float:
     seed = (sum(ord(c) for c in ticker) % 35) + 40
     if asset_class == "Equity":
@@ -96,6 +127,7 @@ def _estimate_unit_price(ticker: str, asset_class: str) -> float:
     return 1.0
 
 
+@functools.lru_cache(maxsize=4096)
 def _estimate_gain_rate(ticker: str, asset_class: str) -> float:
     seed = (sum(ord(c) for c in ticker) % 9) / 100.0
     if asset_class == "Equity":
@@ -133,6 +165,28 @@ def _overweight_score(pos, positions: List, portfolio) -> float:
     return actual_weight - target_weight
 
 
+def _client_summary(client: Client) -> ClientSummary:
+    # Fields come straight off typed ORM columns, so skip Pydantic validation.
+    return ClientSummary.model_construct(
+        id=client.id,
+        name=client.name,
+        email=client.email,
+        segment=client.segment,
+        risk_profile=client.risk_profile,
+    )
+
+
+def _portfolio_summary(portfolio: Portfolio) -> PortfolioSummary:
+    return PortfolioSummary.model_construct(
+        id=portfolio.id,
+        name=portfolio.name,
+        total_value=float(portfolio.total_value),
+        target_equity_pct=float(portfolio.target_equity_pct),
+        target_fixed_income_pct=float(portfolio.target_fixed_income_pct),
+        target_cash_pct=float(portfolio.target_cash_pct),
+    )
+
+
 def _plan_to_view(plan: ReallocationPlan) -> ReallocationPlanView:
     return ReallocationPlanView(
         plan_id=plan.id,
@@ -168,7 +222,7 @@ def _plan_to_view(plan: ReallocationPlan) -> ReallocationPlanView:
 def _draft_to_view(draft: FollowUpDraft | None) -> FollowUpDraftView:
     if draft is None:
         raise HTTPException(status_code=404, detail="Follow-up draft not found")
-    return FollowUpDraftView(
+    return FollowUpDraftView.model_construct(
         id=draft.id,
         alert_id=draft.alert_id,
         client_id=draft.client_id,
@@ -198,69 +252,81 @@ def list_alerts(
     ),
     client_id: Optional[int] = Query(None, description="Filter by client ID"),
     limit: int = Query(50, ge=1, le=200),
-    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from a previous page's next_cursor.",
+    ),
 ) -> AlertsListResponse:
+    # selectinload keeps the page query narrow (one IN query per relationship),
+    # and raiseload turns any other lazy relationship access into an error
+    # instead of a silent per-row SELECT.
     query = db.query(Alert).options(
-        joinedload(Alert.client),
-        joinedload(Alert.portfolio),
+        selectinload(Alert.client),
+        selectinload(Alert.portfolio),
+        raiseload("*"),
     )
 
     # CRITICAL: Apply client_id filter - FIX: Using explicit type check instead of if client_id:
     if client_id is not None and isinstance(client_id, int):
         query = query.filter(Alert.client_id == client_id)
 
-    if priority:
-        raw_values = {p.strip().upper() for p in priority.split(",") if p.strip()}
-        priority_enums = [Priority(v) for v in raw_values if v in Priority.__members__]
-        if priority_enums:
-            query = query.filter(Alert.priority.in_(priority_enums))
-
-    if status:
-        raw_status = {s.strip().upper() for s in status.split(",") if s.strip()}
-        status_enums = [AlertStatus(v) for v in raw_status if v in AlertStatus.__members__]
-        if status_enums:
-            query = query.filter(Alert.status.in_(status_enums))
-
-    total = query.count()
-
-    priority_rank = case(
-        (Alert.priority == Priority.HIGH, 0),
-        (Alert.priority == Priority.MEDIUM, 1),
-        (Alert.priority == Priority.LOW, 2),
-        else_=99,
-    )
-
-    alerts: Sequence[Alert] = (
-        query.order_by(priority_rank.asc(), Alert.created_at.desc(), Alert.confidence.desc())
-        .offset(offset)
+    priority_enums = parse_enum_csv(priority, Priority) if priority else ()
+    if priority_enums:
+        query = query.filter(Alert.priority.in_(priority_enums))
+
+    status_enums = parse_enum_csv(status, AlertStatus) if status else ()
+    if status_enums:
+        query = query.filter(Alert.status.in_(status_enums))
+
+    # Key on the normalized filters only (not limit/cursor) so every page of
+    # the same listing shares one cached count.
+    count_key = (client_id, priority_enums, status_enums)
+    total = _ALERT_COUNT_CACHE.get_or_set(count_key, query.count)
+
+    if cursor:
+        try:
+            after = decode_cursor(cursor, datetime_keys=("created_at",))
+            query = query.filter(
+                keyset_condition(
+                    [
+                        (Alert.priority_rank, int(after["rank"]), False),
+                        (Alert.created_at, after["created_at"], True),
+                        (Alert.confidence, int(after["confidence"]), True),
+                        (Alert.id, int(after["id"]), True),
+                    ]
+                )
+            )
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+    # Stream rows in batches rather than materializing the full page up front;
+    # selectinload runs once per yielded batch.
+    alerts: Iterable[Alert] = (
+        query.order_by(
+            Alert.priority_rank.asc(),
+            Alert.created_at.desc(),
+            Alert.confidence.desc(),
+            Alert.id.desc(),
+        )
         .limit(limit)
-        .all()
+        .yield_per(50)
     )
 
     items: List[AlertSummary] = []
+    fetched = 0
+    last: Alert | None = None
     for a in alerts:
+        fetched += 1
+        last = a
         client = a.client
         portfolio = a.portfolio
         if client is None or portfolio is None:
             # Skip orphaned records to keep /alerts resilient against legacy/incomplete rows.
             continue
-        client_summary = ClientSummary(
-            id=client.id,
-            name=client.name,
-            email=client.email,
-            segment=client.segment,
-            risk_profile=client.risk_profile,
-        )
-        portfolio_summary = PortfolioSummary(
-            id=portfolio.id,
-            name=portfolio.name,
-            total_value=float(portfolio.total_value),
-            target_equity_pct=float(portfolio.target_equity_pct),
-            target_fixed_income_pct=float(portfolio.target_fixed_income_pct),
-            target_cash_pct=float(portfolio.target_cash_pct),
-        )
+        client_summary = _client_summary(client)
+        portfolio_summary = _portfolio_summary(portfolio)
         items.append(
-            AlertSummary(
+            AlertSummary.model_construct(
                 id=a.id,
                 created_at=a.created_at,
                 priority=a.priority,
@@ -273,7 +339,18 @@ def list_alerts(
             )
         )
 
-    return AlertsListResponse(items=items, total=total)
+    next_cursor = None
+    if last is not None and fetched == limit:
+        next_cursor = encode_cursor(
+            {
+                "rank": last.priority_rank,
+                "created_at": last.created_at,
+                "confidence": last.confidence,
+                "id": last.id,
+            }
+        )
+
+    return AlertsListResponse(items=items, total=total, next_cursor=next_cursor)
 
 
 # New dedicated endpoint for client-specific alerts using path parameter
@@ -286,21 +363,15 @@ def list_alerts_for_client(
 ) -> AlertsListResponse:
     """Get all OPEN/ESCALATED alerts for a specific client (path parameter)"""
     query = db.query(Alert).options(
-        joinedload(Alert.client),
-        joinedload(Alert.portfolio),
+        selectinload(Alert.client),
+        selectinload(Alert.portfolio),
+        raiseload("*"),
     ).filter(Alert.client_id == client_id).filter(Alert.status.in_([AlertStatus.OPEN, AlertStatus.ESCALATED]))
 
     total = query.count()
 
-    priority_rank = case(
-        (Alert.priority == Priority.HIGH, 0),
-        (Alert.priority == Priority.MEDIUM, 1),
-        (Alert.priority == Priority.LOW, 2),
-        else_=99,
-    )
-
     alerts: Sequence[Alert] = (
-        query.order_by(priority_rank.asc(), Alert.created_at.desc(), Alert.confidence.desc())
+        query.order_by(Alert.priority_rank.asc(), Alert.created_at.desc(), Alert.confidence.desc())
         .offset(offset)
         .limit(limit)
         .all()
@@ -312,23 +383,10 @@ def list_alerts_for_client(
         portfolio = a.portfolio
         if client is None or portfolio is None:
             continue
-        client_summary = ClientSummary(
-            id=client.id,
-            name=client.name,
-            email=client.email,
-            segment=client.segment,
-            risk_profile=client.risk_profile,
-        )
-        portfolio_summary = PortfolioSummary(
-            id=portfolio.id,
-            name=portfolio.name,
-            total_value=float(portfolio.total_value),
-            target_equity_pct=float(portfolio.target_equity_pct),
-            target_fixed_income_pct=float(portfolio.target_fixed_income_pct),
-            target_cash_pct=float(portfolio.target_cash_pct),
-        )
+        client_summary = _client_summary(client)
+        portfolio_summary = _portfolio_summary(portfolio)
         items.append(
-            AlertSummary(
+            AlertSummary.model_construct(
                 id=a.id,
                 created_at=a.created_at,
                 priority=a.priority,
@@ -344,55 +402,53 @@ def list_alerts_for_client(
     return AlertsListResponse(items=items, total=total)
 
 
-@router.get("/{alert_id:int}", response_model=AlertDetail)
-def get_alert(alert_id: int, db: Session = Depends(get_db)) -> AlertDetail:
-    alert: Alert | None = (
+def _load_alert_for_detail(db: Session, alert_id: int) -> Alert | None:
+    """Load an alert with its client and portfolio in a single query.
+
+    Positions are left lazy: the allocation breakdown is cached per portfolio
+    version and only touches them on a cache miss.
+    """
+    return (
         db.query(Alert)
-        .options(
-            joinedload(Alert.client),
-            joinedload(Alert.portfolio).joinedload(Portfolio.positions),
-        )
+        .options(joinedload(Alert.client), joinedload(Alert.portfolio))
         .filter(Alert.id == alert_id)
         .first()
     )
+
+
+@router.get("/{alert_id:int}", response_model=AlertDetail)
+def get_alert(alert_id: int, db: Session = Depends(get_db)) -> AlertDetail:
+    alert = _load_alert_for_detail(db, alert_id)
     if not alert:
         raise HTTPException(
             status_code=404,
             detail=f"Alert {alert_id} not found. It may have been archived or removed; select an active alert and retry.",
         )
+    return _alert_to_detail(alert, db)
 
+
+def _alert_to_detail(alert: Alert, db: Session, include_profile: bool = True) -> AlertDetail:
     client = alert.client
     portfolio = alert.portfolio
-    client_summary = ClientSummary(
-        id=client.id,
-        name=client.name,
-        email=client.email,
-        segment=client.segment,
-        risk_profile=client.risk_profile,
-    )
-    portfolio_summary = PortfolioSummary(
-        id=portfolio.id,
-        name=portfolio.name,
-        total_value=float(portfolio.total_value),
-        target_equity_pct=float(portfolio.target_equity_pct),
-        target_fixed_income_pct=float(portfolio.target_fixed_income_pct),
-        target_cash_pct=float(portfolio.target_cash_pct),
-    )
-    allocation = _allocation_breakdown(portfolio)
-    metrics = {
-        "concentration_score": float(alert.concentration_score),
-        "drift_score": float(alert.drift_score),
-        "volatility_proxy": float(alert.volatility_proxy),
-        "risk_score": float(alert.risk_score),
-    }
-    client_profile_view = _build_profile_view(
-        client=client,
-        portfolio=portfolio,
-        metrics=metrics,
-        allocation=allocation,
-        generated_at=alert.created_at,
-        db=db,
-    )
+    client_summary = _client_summary(client)
+    portfolio_summary = _portfolio_summary(portfolio)
+    client_profile_view = None
+    if include_profile:
+        allocation = _allocation_breakdown_cached(portfolio)
+        metrics = {
+            "concentration_score": float(alert.concentration_score),
+            "drift_score": float(alert.drift_score),
+            "volatility_proxy": float(alert.volatility_proxy),
+            "risk_score": float(alert.risk_score),
+        }
+        client_profile_view = _build_profile_view(
+            client=client,
+            portfolio=portfolio,
+            metrics=metrics,
+            allocation=allocation,
+            generated_at=alert.created_at,
+            db=db,
+        )
 
     return AlertDetail(
         id=alert.id,
@@ -404,15 +460,10 @@ def get_alert(alert_id: int, db: Session = Depends(get_db)) -> AlertDetail:
         reasoning_bullets=alert.reasoning_bullets,
         human_review_required=alert.human_review_required,
         suggested_next_step=alert.suggested_next_step,
-        decision_trace_steps=[{"step": s["step"], "detail": s["detail"]} for s in alert.decision_trace_steps],
-        change_detection=[
-            {
-                "metric": c.get("metric", ""),
-                "from": c.get("from", ""),
-                "to": c.get("to", ""),
-            }
-            for c in alert.change_detection
-        ],
+        # Stored in canonical shape by every writer (validated through AIOutput),
+        # so the JSON columns are passed through without re-projecting each item.
+        decision_trace_steps=alert.decision_trace_steps,
+        change_detection=alert.change_detection,
         status=alert.status,
         concentration_score=alert.concentration_score,
         drift_score=alert.drift_score,
@@ -430,7 +481,7 @@ def act_on_alert(
     payload: AlertActionRequest,
     db: Session = Depends(get_db),
 ) -> AlertActionResponse:
-    alert: Alert | None = db.query(Alert).filter(Alert.id == alert_id).first()
+    alert = _load_alert_for_detail(db, alert_id)
     if not alert:
         raise HTTPException(status_code=404, detail="Alert not found")
 
@@ -448,32 +499,117 @@ def act_on_alert(
         message = "Alert marked as false positive."
 
     alert.status = new_status
-    db.add(
-        AuditEvent(
-            alert_id=alert.id,
-            run_id=alert.run_id,
-            event_type=event_type,
-            actor="Kunal Jha",
-            details={"new_status": new_status.value},
-        )
-    )
     db.commit()
-    db.refresh(alert)
+    record_audit_event(
+        alert_id=alert.id,
+        run_id=alert.run_id,
+        event_type=event_type,
+        actor="Kunal Jha",
+        details={"new_status": new_status.value},
+    )
+    invalidate_alert_counts()
+    invalidate_dashboards()
 
-    # Reuse get_alert logic to build the detailed view
-    detail = get_alert(alert_id=alert.id, db=db)
+    # Build the detailed view from the already-loaded alert rather than re-querying.
+    # The profile view is unchanged by a status action, so callers keep the copy
+    # they already have from GET /alerts/{id}.
+    detail = _alert_to_detail(alert, db, include_profile=False)
     return AlertActionResponse(alert=detail, message=message)
 
 
+# Provider calls take seconds; run them on their own small limiter so they never
+# occupy the request threadpool (which is sized to the DB connection pool).
+_DRAFT_GENERATION_TOKENS = 4
+_draft_generation_limiter = lazy_limiter(_DRAFT_GENERATION_TOKENS)
+
+
+def _generate_follow_up_draft_content(draft_id: int, run_id: int | None, alert_context: Dict[str, Any]) -> None:
+    """Call the provider and fill in a GENERATING draft."""
+    provider = get_provider()
+    # No session is open during the provider call, so no connection is held either.
+    try:
+        content = provider.generate_follow_up_draft(alert_context=alert_context)
+    except Exception:
+        logger.exception("Follow-up draft generation failed for draft %s", draft_id)
+        content = None
+
+    with SessionLocal() as db:
+        draft = db.get(FollowUpDraft, draft_id)
+        if draft is None or draft.status != FollowUpDraftStatus.GENERATING:
+            return
+        if content is None:
+            draft.status = FollowUpDraftStatus.GENERATION_FAILED
+            db.commit()
+            return
+
+        draft.subject = content.subject
+        draft.body = content.body
+        draft.status = FollowUpDraftStatus.PENDING_APPROVAL
+        # Already off the request path, so write the audit row in the same
+        # transaction instead of paying for a second commit via the writer.
+        add_audit_event(
+            db,
+            AuditEvent(
+                alert_id=draft.alert_id,
+                run_id=run_id,
+                event_type=AuditEventType.FOLLOW_UP_DRAFT_CREATED,
+                actor="Kunal Jha",
+                details={
+                    "draft_id": draft.id,
+                    "status": draft.status.value,
+                    "recipient_email": draft.recipient_email,
+                    "provider": draft.generation_provider,
+                },
+            )
+        )
+        db.commit()
+
+
+async def _run_follow_up_draft_generation(draft_id: int, run_id: int | None, alert_context: Dict[str, Any]) -> None:
+    """Background task entry point: hand the blocking work to the draft limiter."""
+    await anyio.to_thread.run_sync(
+        _generate_follow_up_draft_content,
+        draft_id,
+        run_id,
+        alert_context,
+        limiter=_draft_generation_limiter(),
+    )
+
+
+def fail_interrupted_follow_up_drafts() -> int:
+    """Mark drafts left GENERATING by an earlier process as GENERATION_FAILED.
+
+    Generation runs as an in-process background task, so a draft still
+    GENERATING at startup lost its task to a restart or crash and would
+    otherwise never settle. Returns the number of drafts marked.
+    """
+    with SessionLocal() as db:
+        failed = (
+            db.query(FollowUpDraft)
+            .filter(FollowUpDraft.status == FollowUpDraftStatus.GENERATING)
+            .update({"status": FollowUpDraftStatus.GENERATION_FAILED}, synchronize_session=False)
+        )
+        db.commit()
+    return failed
+
+
 @router.post("/{alert_id}/follow-up-draft", response_model=FollowUpDraftResponse)
 def create_follow_up_draft(
     alert_id: int,
     payload: FollowUpDraftCreateRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ) -> FollowUpDraftResponse:
+    """Start generating a follow-up draft.
+
+    The provider call can take several seconds, so it runs as a background task
+    after the response is sent. The returned draft is GENERATING; poll
+    GET /alerts/follow-up-drafts/{draft_id} with its id until it becomes
+    PENDING_APPROVAL (or GENERATION_FAILED).
+    """
     alert: Alert | None = (
         db.query(Alert)
-        .options(joinedload(Alert.client), joinedload(Alert.portfolio))
+        .options(joinedload(Alert.client))
         .filter(Alert.id == alert_id)
         .first()
     )
@@ -493,15 +629,13 @@ def create_follow_up_draft(
         "risk_profile": alert.client.risk_profile,
     }
 
-    content = provider.generate_follow_up_draft(alert_context=alert_context)
-
     draft = FollowUpDraft(
         alert_id=alert.id,
         client_id=alert.client_id,
-        status=FollowUpDraftStatus.PENDING_APPROVAL,
+        status=FollowUpDraftStatus.GENERATING,
         recipient_email=alert.client.email,
-        subject=content.subject,
-        body=content.body,
+        subject="",
+        body="",
         generation_provider=provider.name,
         generated_from={
             "alert_id": alert.id,
@@ -511,28 +645,12 @@ def create_follow_up_draft(
         },
     )
     db.add(draft)
-    db.flush()
-
-    db.add(
-        AuditEvent(
-            alert_id=alert.id,
-            run_id=alert.run_id,
-            event_type=AuditEventType.FOLLOW_UP_DRAFT_CREATED,
-            actor="Kunal Jha",
-            details={
-                "draft_id": draft.id,
-                "status": draft.status.value,
-                "recipient_email": draft.recipient_email,
-                "provider": draft.generation_provider,
-            },
-        )
-    )
     db.commit()
-    db.refresh(draft)
+    background_tasks.add_task(_run_follow_up_draft_generation, draft.id, alert.run_id, alert_context)
 
     return FollowUpDraftResponse(
         draft=_draft_to_view(draft),
-        message="Follow-up draft generated (fresh each time).",
+        message="Follow-up draft is being generated.",
     )
 
 
@@ -541,24 +659,30 @@ def get_follow_up_draft(
     alert_id: int,
     db: Session = Depends(get_db),
 ) -> FollowUpDraftResponse:
-    alert: Alert | None = db.query(Alert).filter(Alert.id == alert_id).first()
-    if not alert:
-        raise HTTPException(status_code=404, detail="Alert not found")
+    """Latest usable draft for the alert.
 
+    Drafts still GENERATING or that failed have no content yet, so they are
+    skipped here; pollers follow their own draft via its id instead.
+    """
     draft: FollowUpDraft | None = (
         db.query(FollowUpDraft)
-        .filter(FollowUpDraft.alert_id == alert_id)
-        .order_by(
-            case(
-                (FollowUpDraft.status == FollowUpDraftStatus.PENDING_APPROVAL, 0),
-                (FollowUpDraft.status == FollowUpDraftStatus.APPROVED_READY, 1),
-                else_=2,
+        .filter(
+            FollowUpDraft.alert_id == alert_id,
+            FollowUpDraft.status.notin_(
+                [FollowUpDraftStatus.GENERATING, FollowUpDraftStatus.GENERATION_FAILED]
             ),
+        )
+        .order_by(
+            _DRAFT_STATUS_RANK,
             FollowUpDraft.created_at.desc(),
         )
         .first()
     )
     if not draft:
+        # Only pay for the alert lookup on a miss, to pick the right 404.
+        alert_exists = db.query(exists().where(Alert.id == alert_id)).scalar()
+        if not alert_exists:
+            raise HTTPException(status_code=404, detail="Alert not found")
         raise HTTPException(status_code=404, detail="No follow-up draft found for this alert")
 
     return FollowUpDraftResponse(
@@ -567,6 +691,22 @@ def get_follow_up_draft(
     )
 
 
+@router.get("/follow-up-drafts/{draft_id}", response_model=FollowUpDraftResponse)
+def get_follow_up_draft_by_id(
+    draft_id: int,
+    db: Session = Depends(get_db),
+) -> FollowUpDraftResponse:
+    """Fetch one draft by id, so a poller sees exactly the generation it started."""
+    draft: FollowUpDraft | None = db.get(FollowUpDraft, draft_id)
+    if not draft:
+        raise HTTPException(status_code=404, detail="Follow-up draft not found")
+
+    return FollowUpDraftResponse(
+        draft=_draft_to_view(draft),
+        message="Follow-up draft retrieved.",
+    )
+
+
 @router.post("/follow-up-drafts/{draft_id}/approve", response_model=FollowUpDraftResponse)
 def approve_follow_up_draft(
     draft_id: int,
@@ -587,17 +727,14 @@ def approve_follow_up_draft(
     draft.approved_by = "Kunal Jha"
     draft.approved_at = datetime.utcnow()
 
-    db.add(
-        AuditEvent(
-            alert_id=draft.alert_id,
-            run_id=draft.alert.run_id if draft.alert else None,
-            event_type=AuditEventType.FOLLOW_UP_DRAFT_APPROVED,
-            actor="Kunal Jha",
-            details={"draft_id": draft.id, "status": draft.status.value},
-        )
-    )
     db.commit()
-    db.refresh(draft)
+    record_audit_event(
+        alert_id=draft.alert_id,
+        run_id=draft.alert.run_id if draft.alert else None,
+        event_type=AuditEventType.FOLLOW_UP_DRAFT_APPROVED,
+        actor="Kunal Jha",
+        details={"draft_id": draft.id, "status": draft.status.value},
+    )
 
     return FollowUpDraftResponse(
         draft=_draft_to_view(draft),
@@ -624,21 +761,18 @@ def reject_follow_up_draft(
 
     draft.status = FollowUpDraftStatus.REJECTED
 
-    db.add(
-        AuditEvent(
-            alert_id=draft.alert_id,
-            run_id=draft.alert.run_id if draft.alert else None,
-            event_type=AuditEventType.FOLLOW_UP_DRAFT_REJECTED,
-            actor="Kunal Jha",
-            details={
-                "draft_id": draft.id,
-                "status": draft.status.value,
-                "reason": (payload.reason or "").strip(),
-            },
-        )
-    )
     db.commit()
-    db.refresh(draft)
+    record_audit_event(
+        alert_id=draft.alert_id,
+        run_id=draft.alert.run_id if draft.alert else None,
+        event_type=AuditEventType.FOLLOW_UP_DRAFT_REJECTED,
+        actor="Kunal Jha",
+        details={
+            "draft_id": draft.id,
+            "status": draft.status.value,
+            "reason": (payload.reason or "").strip(),
+        },
+    )
 
     return FollowUpDraftResponse(
         draft=_draft_to_view(draft),
@@ -723,7 +857,8 @@ def generate_rebalance_suggestion(
     ai_rationale += "Review each position carefully and adjust for tax efficiency and client circumstances."
 
     # Log audit event
-    db.add(
+    add_audit_event(
+        db,
         AuditEvent(
             alert_id=alert.id,
             run_id=alert.run_id,
@@ -829,11 +964,14 @@ def generate_reallocation_plan(
     sell_candidates = [
         p for p in positions if p.asset_class in {"Equity", "Fixed Income"} and float(p.value) > 0
     ]
+    # Gain rates are deterministic per position; compute once and reuse for the
+    # chosen plan and both alternatives instead of re-hashing tickers per pass.
+    gain_rates = {p.id: _estimate_gain_rate(p.ticker, p.asset_class) for p in sell_candidates}
     # Sort: most overweight first, then lowest gain rate (tax efficient), then largest value
     sell_candidates.sort(
         key=lambda p: (
             -_overweight_score(p, positions, portfolio),  # overweight first (descending)
-            _estimate_gain_rate(p.ticker, p.asset_class),  # then lowest tax gain rate
+            gain_rates[p.id],  # then lowest tax gain rate
             -float(p.value),  # then largest value
         )
     )
@@ -843,6 +981,7 @@ def generate_reallocation_plan(
     total_realized_gains = 0.0
     total_tax_impact = 0.0
     settlement_days = 0
+    sold_total = 0.0
     updated_values = {p.id: float(p.value) for p in positions}
 
     for pos in sell_candidates:
@@ -852,7 +991,7 @@ def generate_reallocation_plan(
         sell_amount = min(available, remaining)
         if sell_amount <= 0:
             continue
-        gain_rate = _estimate_gain_rate(pos.ticker, pos.asset_class)
+        gain_rate = gain_rates[pos.id]
         estimated_gain = round(sell_amount * gain_rate, 2)
         estimated_tax = round(estimated_gain * tax_inclusion_rate * marginal_tax_rate, 2)
         unit_price = _estimate_unit_price(pos.ticker, pos.asset_class)
@@ -860,12 +999,13 @@ def generate_reallocation_plan(
         settle = 2 if pos.asset_class == "Equity" else 1
         settlement_days = max(settlement_days, settle)
 
+        trade_amount = round(sell_amount, 2)
         trades.append(
             {
                 "ticker": pos.ticker,
                 "asset_class": pos.asset_class,
                 "action": "SELL",
-                "amount": round(sell_amount, 2),
+                "amount": trade_amount,
                 "estimated_units": units,
                 "settlement_days": settle,
                 "estimated_gain_realized": estimated_gain,
@@ -873,12 +1013,13 @@ def generate_reallocation_plan(
             }
         )
         updated_values[pos.id] = round(max(0.0, updated_values[pos.id] - sell_amount), 2)
+        sold_total += trade_amount
         total_realized_gains += estimated_gain
         total_tax_impact += estimated_tax
         remaining -= sell_amount
 
     # The proposed sells are modeled as moving proceeds into cash.
-    updated_cash_amount = current_cash_amount + sum(t["amount"] for t in trades)
+    updated_cash_amount = current_cash_amount + sold_total
 
     def _portfolio_volatility(values: Dict[int, float], cash_value: float) -> float:
         if total_value <= 0:
@@ -911,7 +1052,7 @@ def generate_reallocation_plan(
     alt1_candidates = sorted(
         sell_candidates,
         key=lambda p: (
-            -_estimate_gain_rate(p.ticker, p.asset_class),  # highest gain first
+            -gain_rates[p.id],  # highest gain first
             -float(p.value),
         )
     )
@@ -923,7 +1064,7 @@ def generate_reallocation_plan(
         sell_amount = min(available, alt1_remaining)
         if sell_amount <= 0:
             continue
-        gain_rate = _estimate_gain_rate(pos.ticker, pos.asset_class)
+        gain_rate = gain_rates[pos.id]
         estimated_gain = round(sell_amount * gain_rate, 2)
         estimated_tax = round(estimated_gain * tax_inclusion_rate * marginal_tax_rate, 2)
         settle = 2 if pos.asset_class == "Equity" else 1
@@ -956,7 +1097,7 @@ def generate_reallocation_plan(
         sell_amount = min(available, proportion * additional_cash_needed)
         if sell_amount <= 0:
             continue
-        gain_rate = _estimate_gain_rate(pos.ticker, pos.asset_class)
+        gain_rate = gain_rates[pos.id]
         estimated_gain = round(sell_amount * gain_rate, 2)
         estimated_tax = round(estimated_gain * tax_inclusion_rate * marginal_tax_rate, 2)
         settle = 2 if pos.asset_class == "Equity" else 1
@@ -1001,7 +1142,7 @@ def generate_reallocation_plan(
         raise HTTPException(status_code=400, detail="Unable to produce a sell plan for this portfolio")
 
     coverage = round(
-        (sum(t["amount"] for t in trades) / additional_cash_needed * 100) if additional_cash_needed > 0 else 100.0,
+        (sold_total / additional_cash_needed * 100) if additional_cash_needed > 0 else 100.0,
         1,
     )
 
@@ -1060,7 +1201,8 @@ def generate_reallocation_plan(
     db.add(plan)
     db.flush()
 
-    db.add(
+    add_audit_event(
+        db,
         AuditEvent(
             alert_id=alert.id,
             run_id=alert.run_id,
@@ -1077,7 +1219,6 @@ def generate_reallocation_plan(
         )
     )
     db.commit()
-    db.refresh(plan)
     return _plan_to_view(plan)
 
 
@@ -1087,10 +1228,7 @@ def queue_reallocation_plan(
     db: Session = Depends(get_db),
 ) -> ReallocationPlanView:
     plan: ReallocationPlan | None = (
-        db.query(ReallocationPlan)
-        .options(joinedload(ReallocationPlan.alert))
-        .filter(ReallocationPlan.id == plan_id)
-        .first()
+        db.query(ReallocationPlan).filter(ReallocationPlan.id == plan_id).first()
     )
     if not plan:
         raise HTTPException(status_code=404, detail="Reallocation plan not found")
@@ -1100,17 +1238,16 @@ def queue_reallocation_plan(
     if plan.status == ReallocationPlanStatus.PLANNED:
         plan.status = ReallocationPlanStatus.QUEUED
         plan.queued_at = datetime.utcnow()
-        db.add(
-            AuditEvent(
-                alert_id=plan.alert_id,
-                run_id=plan.alert.run_id if plan.alert else None,
-                event_type=AuditEventType.REALLOCATION_PLAN_QUEUED,
-                actor="Kunal Jha",
-                details={"plan_id": plan.id, "status": plan.status.value},
-            )
-        )
+        # Only the run id is needed for the audit row, so skip loading the full alert.
+        run_id = db.query(Alert.run_id).filter(Alert.id == plan.alert_id).scalar()
         db.commit()
-        db.refresh(plan)
+        record_audit_event(
+            alert_id=plan.alert_id,
+            run_id=run_id,
+            event_type=AuditEventType.REALLOCATION_PLAN_QUEUED,
+            actor="Kunal Jha",
+            details={"plan_id": plan.id, "status": plan.status.value},
+        )
 
     return _plan_to_view(plan)
 
@@ -1135,17 +1272,14 @@ def approve_reallocation_plan(
         plan.status = ReallocationPlanStatus.APPROVED
         plan.approved_by = "Kunal Jha"
         plan.approved_at = datetime.utcnow()
-        db.add(
-            AuditEvent(
-                alert_id=plan.alert_id,
-                run_id=plan.alert.run_id if plan.alert else None,
-                event_type=AuditEventType.REALLOCATION_PLAN_APPROVED,
-                actor="Kunal Jha",
-                details={"plan_id": plan.id, "status": plan.status.value, "approved_by": plan.approved_by},
-            )
-        )
         db.commit()
-        db.refresh(plan)
+        record_audit_event(
+            alert_id=plan.alert_id,
+            run_id=plan.alert.run_id if plan.alert else None,
+            event_type=AuditEventType.REALLOCATION_PLAN_APPROVED,
+            actor="Kunal Jha",
+            details={"plan_id": plan.id, "status": plan.status.value, "approved_by": plan.approved_by},
+        )
 
     return _plan_to_view(plan)
 
@@ -1171,21 +1305,18 @@ def execute_reallocation_plan(
         plan.status = ReallocationPlanStatus.EXECUTED
         plan.executed_at = now
         plan.execution_reference = f"SIM-{plan.id}-{now.strftime('%Y%m%d%H%M%S')}"
-        db.add(
-            AuditEvent(
-                alert_id=plan.alert_id,
-                run_id=plan.alert.run_id if plan.alert else None,
-                event_type=AuditEventType.REALLOCATION_PLAN_EXECUTED,
-                actor="Kunal Jha",
-                details={
-                    "plan_id": plan.id,
-                    "status": plan.status.value,
-                    "execution_reference": plan.execution_reference,
-                    "simulated": True,
-                },
-            )
-        )
         db.commit()
-        db.refresh(plan)
+        record_audit_event(
+            alert_id=plan.alert_id,
+            run_id=plan.alert.run_id if plan.alert else None,
+            event_type=AuditEventType.REALLOCATION_PLAN_EXECUTED,
+            actor="Kunal Jha",
+            details={
+                "plan_id": plan.id,
+                "status": plan.status.value,
+                "execution_reference": plan.execution_reference,
+                "simulated": True,
+            },
+        )
 
     return _plan_to_view(plan)
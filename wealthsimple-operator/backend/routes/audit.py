@@ -1,29 +1,32 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 from sqlalchemy import and_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, contains_eager, raiseload, selectinload
 
+from audit_cache import cached_audit_count
+from audit_writer import add_audit_event
 from db import get_db
+from pagination import decode_cursor, encode_cursor, keyset_condition
+from query_filters import parse_csv, parse_enum_csv
 from models import (
     Alert,
     AlertStatus,
     AuditEvent,
     AuditEventEntry,
     Priority,
-    Client,
 )
 
 router = APIRouter(prefix="/audit", tags=["audit"])
 
-
 class AuditListResponse(BaseModel):
     items: List[AuditEventEntry]
     total: int
+    next_cursor: Optional[str] = None
 
 
 class AuditActivityRequest(BaseModel):
@@ -65,7 +68,7 @@ def log_audit_activity(
         run_id=None,
         details=details,
     )
-    db.add(event)
+    add_audit_event(db, event)
     db.commit()
     db.refresh(event)
 
@@ -94,9 +97,14 @@ def list_audit_events(
     from_date: Optional[datetime] = Query(None),
     to_date: Optional[datetime] = Query(None),
     limit: int = Query(100, ge=1, le=500),
-    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(
+        None,
+        description="Opaque cursor from a previous page's next_cursor.",
+    ),
 ) -> AuditListResponse:
-    query = db.query(AuditEvent)
+    # Only alert -> client is read per row (eager-loaded below); fail loudly if
+    # anything else is ever touched lazily.
+    query = db.query(AuditEvent).options(raiseload("*"))
 
     # Join to alerts only when needed for filters (use left outer join to preserve run-level events).
     join_alerts = bool(priority or status)
@@ -105,22 +113,19 @@ def list_audit_events(
 
     conditions = []
 
-    if priority:
-        raw_values = {p.strip().upper() for p in priority.split(",") if p.strip()}
-        priority_enums = [Priority(v) for v in raw_values if v in Priority.__members__]
-        if priority_enums:
-            conditions.append(Alert.priority.in_(priority_enums))
+    priority_enums = parse_enum_csv(priority, Priority) if priority else ()
+    if priority_enums:
+        conditions.append(Alert.priority.in_(priority_enums))
 
-    if status:
-        raw_status = {s.strip().upper() for s in status.split(",") if s.strip()}
-        status_enums = [AlertStatus(v) for v in raw_status if v in AlertStatus.__members__]
-        if status_enums:
-            conditions.append(Alert.status.in_(status_enums))
+    status_enums = parse_enum_csv(status, AlertStatus) if status else ()
+    if status_enums:
+        conditions.append(Alert.status.in_(status_enums))
 
-    if event_type:
-        raw_types = {e.strip().upper() for e in event_type.split(",") if e.strip()}
-        if raw_types:
-            conditions.append(AuditEvent.event_type.in_(raw_types))
+    # Event types stay free-form strings: the column also holds types that are
+    # not (yet) members of AuditEventType.
+    raw_types = parse_csv(event_type) if event_type else ()
+    if raw_types:
+        conditions.append(AuditEvent.event_type.in_(raw_types))
 
     if from_date:
         conditions.append(AuditEvent.created_at >= from_date)
@@ -130,28 +135,61 @@ def list_audit_events(
     if conditions:
         query = query.filter(and_(*conditions))
 
-    total = query.count()
+    count_key = (
+        join_alerts,
+        priority_enums,
+        status_enums,
+        raw_types,
+        from_date,
+        to_date,
+    )
+    total = cached_audit_count(count_key, query.count)
+
+    if cursor:
+        try:
+            after = decode_cursor(cursor, datetime_keys=("created_at",))
+            query = query.filter(
+                keyset_condition(
+                    [
+                        (AuditEvent.created_at, after["created_at"], True),
+                        (AuditEvent.id, int(after["id"]), True),
+                    ]
+                )
+            )
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
 
-    events: List[AuditEvent] = (
-        query.order_by(AuditEvent.created_at.desc()).offset(offset).limit(limit).all()
+    if join_alerts:
+        # Reuse the filter JOIN's alert columns instead of emitting a second JOIN.
+        alert_loader = contains_eager(AuditEvent.alert)
+    else:
+        alert_loader = selectinload(AuditEvent.alert)
+    query = query.options(alert_loader.selectinload(Alert.client))
+
+    # Fetch in batches (up to 500 rows per page) instead of materializing the
+    # whole page before serialization starts.
+    events: Iterable[AuditEvent] = (
+        query.order_by(AuditEvent.created_at.desc(), AuditEvent.id.desc())
+        .limit(limit)
+        .yield_per(50)
     )
 
     items: List[AuditEventEntry] = []
+    last: AuditEvent | None = None
     for e in events:
+        last = e
         client_id = None
         client_name = None
 
-        # Fetch client info from alert if alert_id exists
-        if e.alert_id:
-            alert = db.query(Alert).filter(Alert.id == e.alert_id).first()
-            if alert:
-                client_id = alert.client_id
-                client = db.query(Client).filter(Client.id == client_id).first()
-                if client:
-                    client_name = client.name
+        alert = e.alert
+        if alert is not None:
+            client_id = alert.client_id
+            if alert.client is not None:
+                client_name = alert.client.name
 
+        # Rows come from typed ORM columns; skip per-row validation.
         items.append(
-            AuditEventEntry(
+            AuditEventEntry.model_construct(
                 id=e.id,
                 alert_id=e.alert_id,
                 run_id=e.run_id,
@@ -164,5 +202,9 @@ def list_audit_events(
             )
         )
 
-    return AuditListResponse(items=items, total=total)
+    next_cursor = None
+    if last is not None and len(items) == limit:
+        next_cursor = encode_cursor({"created_at": last.created_at, "id": last.id})
+
+    return AuditListResponse(items=items, total=total, next_cursor=next_cursor)
 
@@ -5,14 +5,41 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, joinedload
 
-from db import get_db
+from audit_writer import add_audit_event
+from dashboard_cache import cached_dashboard, invalidate_dashboards
+from db import get_db, get_readonly_db
 from models import Alert, AlertStatus, Client, ContactScheduleEntry, ContactScheduleResponse, MeetingNote, MeetingNoteType, Portfolio, Priority, FollowUpDraft, FollowUpDraftStatus, AuditEvent
 from ai.provider import get_provider
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
+# Schedule lookups, keyed by the client's highest active alert priority.
+_RANK_TO_PRIORITY = {0: Priority.HIGH, 1: Priority.MEDIUM, 2: Priority.LOW}
+# priority -> (days without contact before it is due, urgency once due)
+_CONTACT_THRESHOLDS = {
+    Priority.HIGH: (5, "OVERDUE"),
+    Priority.MEDIUM: (10, "DUE_SOON"),
+    Priority.LOW: (21, "UPCOMING"),
+}
+# priority -> (suggested action, suggested channel)
+_CONTACT_SUGGESTIONS = {
+    Priority.HIGH: ("Review alert details and discuss portfolio rebalancing strategy", "phone"),
+    Priority.MEDIUM: ("Schedule call to discuss risk profile alignment", "email_then_call"),
+    Priority.LOW: ("Quarterly check-in on portfolio performance", "email"),
+}
+_URGENCY_ORDER = {"OVERDUE": 0, "DUE_SOON": 1, "UPCOMING": 2}
+
+# Correlated per-client latest contact date for the schedule query, built once.
+_LATEST_MEETING_DATE = (
+    select(func.max(MeetingNote.meeting_date))
+    .where(MeetingNote.client_id == Client.id)
+    .correlate(Client)
+    .scalar_subquery()
+)
+
 
 # Pydantic schemas
 class CallScriptDraft(BaseModel):
@@ -53,7 +80,11 @@ class ApprovalResponse(BaseModel):
 
 
 @router.get("/schedule", response_model=ContactScheduleResponse)
-def get_contact_schedule(db: Session = Depends(get_db)) -> ContactScheduleResponse:
+def get_contact_schedule(db: Session = Depends(get_readonly_db)) -> ContactScheduleResponse:
+    return cached_dashboard("contact-schedule", lambda: _build_contact_schedule(db))
+
+
+def _build_contact_schedule(db: Session) -> ContactScheduleResponse:
     """
     Get contact schedule grouped by urgency for all clients.
 
@@ -62,108 +93,54 @@ def get_contact_schedule(db: Session = Depends(get_db)) -> ContactScheduleRespon
     - DUE_SOON: MEDIUM alert AND no contact in > 10 days
     - UPCOMING: LOW alert AND no contact in > 21 days
     """
-    # Bulk load all clients with active alerts (avoid N+1)
-    from sqlalchemy import func, desc
-
-    # Get all clients that have open/escalated alerts
-    clients_with_alerts = (
-        db.query(Client)
-        .join(Alert, Client.id == Alert.client_id)
-        .filter(Alert.status.in_([AlertStatus.OPEN, AlertStatus.ESCALATED]))
-        .distinct()
-        .all()
-    )
-
-    # Bulk load all alerts for these clients
-    client_ids = [c.id for c in clients_with_alerts]
-    alerts_by_client = {}
-    if client_ids:
-        alerts = (
-            db.query(Alert)
-            .filter(
-                Alert.client_id.in_(client_ids),
-                Alert.status.in_([AlertStatus.OPEN, AlertStatus.ESCALATED])
-            )
-            .all()
-        )
-        for alert in alerts:
-            if alert.client_id not in alerts_by_client:
-                alerts_by_client[alert.client_id] = []
-            alerts_by_client[alert.client_id].append(alert)
-
-    # Bulk load latest meeting notes
-    latest_notes_subquery = (
+    # One grouped query: each client with active alerts, its alert count, best
+    # priority (via the indexed Alert.priority_rank) and latest meeting date.
+    schedule_rows = (
         db.query(
-            MeetingNote.client_id,
-            func.max(MeetingNote.meeting_date).label("latest_date")
+            Client.id,
+            Client.name,
+            Client.email,
+            Client.segment,
+            func.count(Alert.id).label("alert_count"),
+            func.min(Alert.priority_rank).label("best_rank"),
+            _LATEST_MEETING_DATE.label("latest_meeting_date"),
         )
-        .filter(MeetingNote.client_id.in_(client_ids))
-        .group_by(MeetingNote.client_id)
-        .subquery()
-    )
-
-    latest_notes = (
-        db.query(MeetingNote)
-        .join(latest_notes_subquery,
-              (MeetingNote.client_id == latest_notes_subquery.c.client_id) &
-              (MeetingNote.meeting_date == latest_notes_subquery.c.latest_date))
+        .join(Alert, Client.id == Alert.client_id)
+        .filter(Alert.status.in_([AlertStatus.OPEN, AlertStatus.ESCALATED]))
+        .group_by(Client.id)
+        .order_by(Client.id)
         .all()
     )
-    notes_by_client = {note.client_id: note for note in latest_notes}
 
     entries: List[ContactScheduleEntry] = []
+    urgency_counts = {"OVERDUE": 0, "DUE_SOON": 0, "UPCOMING": 0}
+    now = datetime.utcnow()
 
-    for client in clients_with_alerts:
-        open_alerts = alerts_by_client.get(client.id, [])
-
-        if not open_alerts:
-            continue  # Skip if no active alerts
-
-        # Get highest priority alert
-        priority_order = {Priority.HIGH: 0, Priority.MEDIUM: 1, Priority.LOW: 2}
-        highest_priority = min(
-            (alert.priority for alert in open_alerts),
-            key=lambda p: priority_order.get(p, 3),
-            default=Priority.LOW
-        )
-
-        # Get latest meeting note
-        latest_meeting_note = notes_by_client.get(client.id)
+    for row in schedule_rows:
+        highest_priority = _RANK_TO_PRIORITY.get(row.best_rank, Priority.LOW)
 
         # Calculate days since contact
-        if latest_meeting_note:
-            days_since_contact = (datetime.utcnow() - latest_meeting_note.meeting_date).days
+        if row.latest_meeting_date:
+            days_since_contact = (now - row.latest_meeting_date).days
         else:
             days_since_contact = 999  # Very old, no contact
 
-        # Determine urgency
-        if highest_priority == Priority.HIGH and days_since_contact > 5:
-            urgency = "OVERDUE"
-        elif highest_priority == Priority.MEDIUM and days_since_contact > 10:
-            urgency = "DUE_SOON"
-        elif highest_priority == Priority.LOW and days_since_contact > 21:
-            urgency = "UPCOMING"
-        else:
-            urgency = "UPCOMING"  # Default to upcoming
+        # Determine urgency (anything not past its threshold defaults to upcoming)
+        threshold_days, overdue_urgency = _CONTACT_THRESHOLDS[highest_priority]
+        urgency = overdue_urgency if days_since_contact > threshold_days else "UPCOMING"
+        urgency_counts[urgency] += 1
 
         # Suggested action and channel based on priority
-        if highest_priority == Priority.HIGH:
-            suggested_action = "Review alert details and discuss portfolio rebalancing strategy"
-            suggested_channel = "phone"
-        elif highest_priority == Priority.MEDIUM:
-            suggested_action = "Schedule call to discuss risk profile alignment"
-            suggested_channel = "email_then_call"
-        else:
-            suggested_action = "Quarterly check-in on portfolio performance"
-            suggested_channel = "email"
-
-        entry = ContactScheduleEntry(
-            client_id=client.id,
-            client_name=client.name,
-            email=client.email,
-            segment=client.segment,
+        suggested_action, suggested_channel = _CONTACT_SUGGESTIONS[highest_priority]
+
+        # Fields come from typed columns and the lookup tables above; skip validation.
+        entry = ContactScheduleEntry.model_construct(
+            client_id=row.id,
+            client_name=row.name,
+            email=row.email,
+            segment=row.segment,
             urgency=urgency,
-            alert_count=len(open_alerts),
+            alert_count=row.alert_count,
             highest_priority=highest_priority.value,
             days_since_contact=days_since_contact,
             suggested_action=suggested_action,
@@ -172,21 +149,15 @@ def get_contact_schedule(db: Session = Depends(get_db)) -> ContactScheduleRespon
         entries.append(entry)
 
     # Sort by urgency priority, then by days_since_contact (desc)
-    urgency_order = {"OVERDUE": 0, "DUE_SOON": 1, "UPCOMING": 2}
     entries.sort(
-        key=lambda e: (urgency_order.get(e.urgency, 3), -e.days_since_contact)
+        key=lambda e: (_URGENCY_ORDER.get(e.urgency, 3), -e.days_since_contact)
     )
 
-    # Count by urgency
-    overdue_count = sum(1 for e in entries if e.urgency == "OVERDUE")
-    due_soon_count = sum(1 for e in entries if e.urgency == "DUE_SOON")
-    upcoming_count = sum(1 for e in entries if e.urgency == "UPCOMING")
-
     return ContactScheduleResponse(
         entries=entries,
-        overdue_count=overdue_count,
-        due_soon_count=due_soon_count,
-        upcoming_count=upcoming_count
+        overdue_count=urgency_counts["OVERDUE"],
+        due_soon_count=urgency_counts["DUE_SOON"],
+        upcoming_count=urgency_counts["UPCOMING"]
     )
 
 
@@ -327,10 +298,11 @@ def approve_call_scheduled(req: DraftApprovalRequest, db: Session = Depends(get_
         raise HTTPException(status_code=404, detail="Client not found")
 
     # Create meeting note for call
+    now = datetime.utcnow()
     meeting_note = MeetingNote(
         client_id=req.client_id,
-        title=f"Scheduled Call - {datetime.utcnow().strftime('%B %d, %Y')}",
-        meeting_date=datetime.utcnow(),
+        title=f"Scheduled Call - {now.strftime('%B %d, %Y')}",
+        meeting_date=now,
         note_body="Call scheduled for portfolio review discussion.",
         meeting_type=MeetingNoteType.CALL
     )
@@ -346,9 +318,10 @@ def approve_call_scheduled(req: DraftApprovalRequest, db: Session = Depends(get_
             "client_name": client.name
         }
     )
-    db.add(audit_event)
+    add_audit_event(db, audit_event)
 
     db.commit()
+    invalidate_dashboards()
 
     return ApprovalResponse(
         success=True,
@@ -365,10 +338,11 @@ def approve_email_sent(req: DraftApprovalRequest, db: Session = Depends(get_db))
         raise HTTPException(status_code=404, detail="Client not found")
 
     # Create meeting note for email
+    now = datetime.utcnow()
     meeting_note = MeetingNote(
         client_id=req.client_id,
-        title=f"Email Sent - {datetime.utcnow().strftime('%B %d, %Y')}",
-        meeting_date=datetime.utcnow(),
+        title=f"Email Sent - {now.strftime('%B %d, %Y')}",
+        meeting_date=now,
         note_body="Outreach email sent to client.",
         meeting_type=MeetingNoteType.EMAIL
     )
@@ -384,9 +358,10 @@ def approve_email_sent(req: DraftApprovalRequest, db: Session = Depends(get_db))
             "client_name": client.name
         }
     )
-    db.add(audit_event)
+    add_audit_event(db, audit_event)
 
     db.commit()
+    invalidate_dashboards()
 
     return ApprovalResponse(
         success=True,
@@ -404,10 +379,11 @@ def approve_activity_logged(req: DraftApprovalRequest, db: Session = Depends(get
 
     # Create meeting note for activity
     note_body = req.notes or "Contact activity recorded."
+    now = datetime.utcnow()
     meeting_note = MeetingNote(
         client_id=req.client_id,
-        title=f"Activity Logged - {datetime.utcnow().strftime('%B %d, %Y')}",
-        meeting_date=datetime.utcnow(),
+        title=f"Activity Logged - {now.strftime('%B %d, %Y')}",
+        meeting_date=now,
         note_body=note_body,
         meeting_type=MeetingNoteType.NOTE
     )
@@ -423,9 +399,10 @@ def approve_activity_logged(req: DraftApprovalRequest, db: Session = Depends(get
             "client_name": client.name
         }
     )
-    db.add(audit_event)
+    add_audit_event(db, audit_event)
 
     db.commit()
+    invalidate_dashboards()
 
     return ApprovalResponse(
         success=True,
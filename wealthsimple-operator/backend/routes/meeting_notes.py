@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import functools
+import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import anyio
+import anyio.to_thread
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
 
 from ai.provider import get_provider
-from db import get_db
+from audit_writer import add_audit_event
+from dashboard_cache import invalidate_dashboards
+from db import SessionLocal, get_db
+from db_utils import lazy_limiter
 from models import (
     AuditEvent,
     MeetingNote,
@@ -22,6 +30,7 @@ from models import (
 
 
 router = APIRouter(prefix="/meeting-notes", tags=["meeting-notes"])
+logger = logging.getLogger(__name__)
 
 
 class MeetingNotesListResponse(BaseModel):
@@ -56,16 +65,23 @@ def list_meeting_notes(
 ) -> MeetingNotesListResponse:
     """List meeting notes for a specific client."""
     query = db.query(MeetingNote).filter(MeetingNote.client_id == client_id)
-    total = query.count()
 
-    notes = (
-        query.order_by(MeetingNote.meeting_date.desc())
+    # COUNT(*) OVER () is evaluated before OFFSET/LIMIT, so each row carries the
+    # full total and the page plus its count come back in one round-trip.
+    rows = (
+        query.add_columns(func.count().over().label("total"))
+        .order_by(MeetingNote.meeting_date.desc())
         .offset(offset)
         .limit(limit)
         .all()
     )
+    if rows:
+        total = rows[0].total
+    else:
+        # An empty page past the end carries no count; only then ask separately.
+        total = query.count() if offset else 0
 
-    items = [_note_to_view(note) for note in notes]
+    items = [_note_to_view(note) for note, _ in rows]
     return MeetingNotesListResponse(items=items, total=total)
 
 
@@ -84,8 +100,7 @@ def create_meeting_note(
     db: Session = Depends(get_db),
 ) -> MeetingNoteView:
     """Create a new meeting note."""
-    from datetime import datetime as dt_class
-    meeting_date = dt_class.fromisoformat(payload.meeting_date) if isinstance(payload.meeting_date, str) else payload.meeting_date
+    meeting_date = datetime.fromisoformat(payload.meeting_date) if isinstance(payload.meeting_date, str) else payload.meeting_date
 
     note = MeetingNote(
         client_id=payload.client_id,
@@ -113,75 +128,168 @@ def create_meeting_note(
             "has_transcript": bool(payload.call_transcript),
         }
     )
-    db.add(audit_event)
+    add_audit_event(db, audit_event)
     db.commit()
+    # A new note moves the client's last-contact date on the contact schedule.
+    invalidate_dashboards()
 
     return _note_to_view(note)
 
 
-@router.post("/{note_id}/summarize", response_model=SummarizeTranscriptResponse)
-def summarize_transcript(
-    note_id: int,
-    payload: SummarizeTranscriptRequest,
-    db: Session = Depends(get_db),
-) -> SummarizeTranscriptResponse:
-    """Generate AI summary for a meeting note's transcript."""
-    note: MeetingNote | None = db.query(MeetingNote).filter(MeetingNote.id == note_id).first()
-    if not note:
-        raise HTTPException(status_code=404, detail="Meeting note not found")
+# Summaries wait on an external AI provider. Those calls run on their own
+# capacity limiter so a burst of summarize requests (or one large batch) cannot
+# occupy the threadpool workers the database routes depend on.
+_SUMMARY_TOKENS = 4
+_summary_limiter = lazy_limiter(_SUMMARY_TOKENS)
+MAX_SUMMARIZE_BATCH = 25
 
-    if not note.call_transcript:
-        raise HTTPException(status_code=400, detail="Meeting note has no transcript to summarize")
 
-    if note.ai_summary and not payload.force_regenerate:
-        raise HTTPException(
-            status_code=409,
-            detail="Meeting note already summarized. Use force_regenerate=true to regenerate."
+class SummarizeBatchRequest(BaseModel):
+    note_ids: List[int]
+    force_regenerate: bool = False
+
+
+class SummarizeBatchItem(BaseModel):
+    note_id: int
+    note: Optional[MeetingNoteView] = None
+    error: Optional[str] = None
+
+
+class SummarizeBatchResponse(BaseModel):
+    items: List[SummarizeBatchItem]
+    summarized_count: int
+
+
+def _load_transcript_for_summary(note_id: int, force_regenerate: bool) -> Tuple[str, Dict[str, Any]]:
+    """Check the note can be summarized; return its transcript and provider context."""
+    with SessionLocal() as db:
+        note: MeetingNote | None = (
+            db.query(MeetingNote)
+            .options(joinedload(MeetingNote.client))
+            .filter(MeetingNote.id == note_id)
+            .first()
         )
+        if not note:
+            raise HTTPException(status_code=404, detail="Meeting note not found")
 
-    # Get the AI provider and summarize
-    provider = get_provider()
-    client = note.client
+        if not note.call_transcript:
+            raise HTTPException(status_code=400, detail="Meeting note has no transcript to summarize")
+
+        if note.ai_summary and not force_regenerate:
+            raise HTTPException(
+                status_code=409,
+                detail="Meeting note already summarized. Use force_regenerate=true to regenerate."
+            )
 
-    summary_result: TranscriptSummary = provider.summarize_transcript(
-        transcript=note.call_transcript,
-        context={
-            "client_name": client.name,
-            "risk_profile": client.risk_profile,
+        return note.call_transcript, {
+            "client_name": note.client.name,
+            "risk_profile": note.client.risk_profile,
         }
-    )
 
-    # Update the note with the summary
-    note.ai_summary = summary_result.summary_paragraph
-    note.ai_action_items = summary_result.action_items
-    note.ai_summarized_at = datetime.utcnow()
-    note.ai_provider_used = getattr(provider, "name", "unknown")
 
-    db.commit()
-    db.refresh(note)
+def _store_transcript_summary(
+    note_id: int, summary_result: TranscriptSummary, provider_name: str
+) -> MeetingNoteView:
+    """Write the summary and its audit event in one transaction."""
+    with SessionLocal() as db:
+        note: MeetingNote | None = db.get(MeetingNote, note_id)
+        if not note:
+            raise HTTPException(status_code=404, detail="Meeting note not found")
+
+        note.ai_summary = summary_result.summary_paragraph
+        note.ai_action_items = summary_result.action_items
+        note.ai_summarized_at = datetime.utcnow()
+        note.ai_provider_used = provider_name
+
+        add_audit_event(
+            db,
+            AuditEvent(
+                event_type="MEETING_NOTE_SUMMARIZED",
+                actor="system",
+                alert_id=None,
+                run_id=None,
+                details={
+                    "client_id": note.client_id,
+                    "note_id": note.id,
+                    "ai_provider": provider_name,
+                    "action_items_count": len(note.ai_action_items) if note.ai_action_items else 0,
+                }
+            )
+        )
+        db.commit()
+        return _note_to_view(note)
 
-    # Log audit event
-    audit_event = AuditEvent(
-        event_type="MEETING_NOTE_SUMMARIZED",
-        actor="system",
-        alert_id=None,
-        run_id=None,
-        details={
-            "client_id": note.client_id,
-            "note_id": note.id,
-            "ai_provider": note.ai_provider_used,
-            "action_items_count": len(note.ai_action_items) if note.ai_action_items else 0,
-        }
+
+async def _summarize_note(note_id: int, force_regenerate: bool) -> SummarizeTranscriptResponse:
+    """Summarize one note; no database connection is held during the provider call."""
+    transcript, context = await anyio.to_thread.run_sync(
+        _load_transcript_for_summary, note_id, force_regenerate
+    )
+
+    provider = get_provider()
+    summary_result: TranscriptSummary = await anyio.to_thread.run_sync(
+        functools.partial(provider.summarize_transcript, transcript=transcript, context=context),
+        limiter=_summary_limiter(),
     )
-    db.add(audit_event)
-    db.commit()
 
+    provider_name = getattr(provider, "name", "unknown")
+    note_view = await anyio.to_thread.run_sync(
+        _store_transcript_summary, note_id, summary_result, provider_name
+    )
     return SummarizeTranscriptResponse(
-        note=_note_to_view(note),
-        message=f"Transcript summarized using {note.ai_provider_used} provider."
+        note=note_view,
+        message=f"Transcript summarized using {provider_name} provider."
+    )
+
+
+@router.post("/summarize-batch", response_model=SummarizeBatchResponse)
+async def summarize_transcripts_batch(payload: SummarizeBatchRequest) -> SummarizeBatchResponse:
+    """Summarize several meeting notes concurrently.
+
+    Each note succeeds or fails on its own; failures are reported per item
+    instead of failing the whole batch.
+    """
+    note_ids = list(dict.fromkeys(payload.note_ids))
+    if not note_ids:
+        raise HTTPException(status_code=400, detail="note_ids must not be empty")
+    if len(note_ids) > MAX_SUMMARIZE_BATCH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_SUMMARIZE_BATCH} notes can be summarized per batch",
+        )
+
+    results: Dict[int, SummarizeBatchItem] = {}
+
+    async def _summarize_item(note_id: int) -> None:
+        try:
+            response = await _summarize_note(note_id, payload.force_regenerate)
+            results[note_id] = SummarizeBatchItem(note_id=note_id, note=response.note)
+        except HTTPException as exc:
+            results[note_id] = SummarizeBatchItem(note_id=note_id, error=str(exc.detail))
+        except Exception as exc:
+            logger.exception("Transcript summary failed for note %s", note_id)
+            results[note_id] = SummarizeBatchItem(note_id=note_id, error=f"Summarization failed: {exc}")
+
+    async with anyio.create_task_group() as tg:
+        for note_id in note_ids:
+            tg.start_soon(_summarize_item, note_id)
+
+    items = [results[note_id] for note_id in note_ids]
+    return SummarizeBatchResponse(
+        items=items,
+        summarized_count=sum(1 for item in items if item.note is not None),
     )
 
 
+@router.post("/{note_id}/summarize", response_model=SummarizeTranscriptResponse)
+async def summarize_transcript(
+    note_id: int,
+    payload: SummarizeTranscriptRequest,
+) -> SummarizeTranscriptResponse:
+    """Generate AI summary for a meeting note's transcript."""
+    return await _summarize_note(note_id, payload.force_regenerate)
+
+
 class PreCallBriefRequest(BaseModel):
     client_id: int
 
@@ -287,7 +395,7 @@ def update_action_item(
             "completed": payload.completed,
         }
     )
-    db.add(audit_event)
+    add_audit_event(db, audit_event)
     db.commit()
 
     return UpdateActionItemResponse(
@@ -297,8 +405,11 @@ def update_action_item(
 
 
 def _note_to_view(note: MeetingNote) -> MeetingNoteView:
-    """Convert a MeetingNote ORM object to a Pydantic view."""
-    return MeetingNoteView(
+    """Convert a MeetingNote ORM object to a Pydantic view.
+
+    The ORM columns already carry the view's types, so validation is skipped.
+    """
+    return MeetingNoteView.model_construct(
         id=note.id,
         client_id=note.client_id,
         title=note.title,
@@ -2,24 +2,32 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException
 
 from ai.provider import get_provider
+from dashboard_cache import invalidate_dashboards
 from db import SessionLocal
 from db_utils import run_with_retry
 from models import RunSummary
 from operator_engine import get_cached_run_summary, run_operator
+from routes.alerts import invalidate_alert_counts
+from routes.portfolios import refresh_monitoring_dashboards
 
 router = APIRouter(prefix="/operator", tags=["operator"])
 logger = logging.getLogger(__name__)
 
 
 @router.post("/run", response_model=RunSummary)
-def run_operator_endpoint(force: bool = False, max_age_seconds: int = 120) -> RunSummary:
+def run_operator_endpoint(
+    background_tasks: BackgroundTasks,
+    force: bool = False,
+    max_age_seconds: int = 120,
+) -> RunSummary:
     provider = get_provider()
     try:
-        if not force:
-            with SessionLocal() as db:
+        # One session (and pooled connection) serves both the cache check and the run.
+        with SessionLocal() as db:
+            if not force:
                 cached = get_cached_run_summary(
                     db,
                     provider_name=provider.name,
@@ -28,15 +36,19 @@ def run_operator_endpoint(force: bool = False, max_age_seconds: int = 120) -> Ru
                 if cached is not None:
                     return cached
 
-        def _run_once() -> RunSummary:
-            with SessionLocal() as db:
+            def _run_once() -> RunSummary:
                 try:
                     return run_operator(db=db, provider=provider)
                 except Exception:
                     db.rollback()
                     raise
 
-        summary = run_with_retry(_run_once)
+            summary = run_with_retry(_run_once)
+        invalidate_alert_counts()
+        invalidate_dashboards()
+        # Rebuild the monitoring-universe views after the response is sent, so
+        # the page load that follows a run reads them from cache.
+        background_tasks.add_task(refresh_monitoring_dashboards)
         return summary
     except Exception as exc:
         logger.exception("Operator run failed")
@@ -3,7 +3,8 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from db import get_db
+from dashboard_cache import cached_dashboard, refresh_dashboard
+from db import ReadOnlySessionLocal, get_readonly_db
 from models import MonitoringUniverseDetail, MonitoringUniverseSummary
 from operator_engine import (
     compute_monitoring_universe_detail,
@@ -14,11 +15,18 @@ router = APIRouter(prefix="/portfolios", tags=["portfolios"])
 
 
 @router.get("/summary", response_model=MonitoringUniverseSummary)
-def get_portfolios_summary(db: Session = Depends(get_db)) -> MonitoringUniverseSummary:
-    return compute_monitoring_universe_summary(db)
+def get_portfolios_summary(db: Session = Depends(get_readonly_db)) -> MonitoringUniverseSummary:
+    return cached_dashboard("portfolios-summary", lambda: compute_monitoring_universe_summary(db))
 
 
 @router.get("/monitoring-detail", response_model=MonitoringUniverseDetail)
-def get_monitoring_detail(db: Session = Depends(get_db)) -> MonitoringUniverseDetail:
-    return compute_monitoring_universe_detail(db)
+def get_monitoring_detail(db: Session = Depends(get_readonly_db)) -> MonitoringUniverseDetail:
+    return cached_dashboard("monitoring-detail", lambda: compute_monitoring_universe_detail(db))
 
+
+
+def refresh_monitoring_dashboards() -> None:
+    """Precompute both monitoring-universe responses after an operator run."""
+    with ReadOnlySessionLocal() as db:
+        refresh_dashboard("portfolios-summary", lambda: compute_monitoring_universe_summary(db))
+        refresh_dashboard("monitoring-detail", lambda: compute_monitoring_universe_detail(db))
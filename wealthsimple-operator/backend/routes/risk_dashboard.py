@@ -1,19 +1,50 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends
+from sqlalchemy import Row, func, select
 from sqlalchemy.orm import Session
 
-from db import get_db
+from dashboard_cache import cached_dashboard
+from db import get_readonly_db
 from models import Alert, Client, Portfolio, RiskClientRow, RiskDashboardResponse
 
 router = APIRouter(prefix="/risk-dashboard", tags=["risk-dashboard"])
 
+# Built once per process; only the execution (not the expression tree) is per request.
+_ALERTS_RANKED_PER_PORTFOLIO = select(
+    Alert.id,
+    func.row_number()
+    .over(partition_by=Alert.portfolio_id, order_by=(Alert.created_at.desc(), Alert.id.desc()))
+    .label("rn"),
+).subquery()
+
+
+def _project_risk(
+    current_risk: float, previous_risk: Optional[float]
+) -> Tuple[str, Optional[float], float]:
+    """Return (trend, trend_pct, predicted_30d_risk) for one portfolio."""
+    if previous_risk is None:
+        return "STABLE", None, current_risk * 1.01
+
+    delta = current_risk - previous_risk
+    trend_pct = round((delta / previous_risk) * 100, 1) if previous_risk != 0 else None
+    if delta > 0.5:
+        return "RISING", trend_pct, min(10.0, current_risk * 1.08)
+    if delta < -0.5:
+        return "FALLING", trend_pct, max(0.0, current_risk * 0.96)
+    return "STABLE", trend_pct, current_risk * 1.01
+
 
 @router.get("/summary", response_model=RiskDashboardResponse)
-def get_risk_dashboard(db: Session = Depends(get_db)) -> RiskDashboardResponse:
+def get_risk_dashboard(db: Session = Depends(get_readonly_db)) -> RiskDashboardResponse:
+    return cached_dashboard("risk-dashboard", lambda: _build_risk_dashboard(db))
+
+
+def _build_risk_dashboard(db: Session) -> RiskDashboardResponse:
     """
     Get risk dashboard with forward-looking risk scores and trend direction.
 
@@ -24,63 +55,68 @@ def get_risk_dashboard(db: Session = Depends(get_db)) -> RiskDashboardResponse:
     - predicted_30d_risk: current * (1.08 if RISING, 0.96 if FALLING, 1.01 if STABLE)
     - days_without_review: days since latest alert was created (if OPEN) or reviewed
     """
-    # Load all clients with portfolios
-    clients = db.query(Client).all()
+    # Three bulk queries instead of one per client and one per portfolio. Each
+    # selects only the columns the rows need, so results come back as plain Row
+    # tuples instead of hydrated, identity-mapped ORM objects.
+    clients = db.query(Client.id, Client.name, Client.segment, Client.risk_profile).all()
+
+    portfolios_by_client: Dict[int, List[Row]] = defaultdict(list)
+    portfolio_rows = db.query(
+        Portfolio.id, Portfolio.client_id, Portfolio.name, Portfolio.total_value
+    ).order_by(Portfolio.id)
+    for portfolio in portfolio_rows:
+        portfolios_by_client[portfolio.client_id].append(portfolio)
+
+    # Latest two alerts per portfolio, ranked in SQL.
+    alerts_by_portfolio: Dict[int, List[Row]] = defaultdict(list)
+    latest_two = (
+        db.query(
+            Alert.id,
+            Alert.portfolio_id,
+            Alert.risk_score,
+            Alert.created_at,
+            Alert.priority,
+            Alert.status,
+        )
+        .join(_ALERTS_RANKED_PER_PORTFOLIO, _ALERTS_RANKED_PER_PORTFOLIO.c.id == Alert.id)
+        .filter(_ALERTS_RANKED_PER_PORTFOLIO.c.rn <= 2)
+        .order_by(Alert.portfolio_id, _ALERTS_RANKED_PER_PORTFOLIO.c.rn)
+    )
+    for alert in latest_two:
+        alerts_by_portfolio[alert.portfolio_id].append(alert)
 
     rows: List[RiskClientRow] = []
+    # Aggregates are folded into the build loop rather than re-walking the rows.
+    current_risk_total = 0.0
+    predicted_risk_total = 0.0
+    rising_count = 0
+    high_risk_count = 0
+    now = datetime.utcnow()
 
     for client in clients:
-        # Get all portfolios for this client
-        portfolios = db.query(Portfolio).filter(Portfolio.client_id == client.id).all()
-
-        for portfolio in portfolios:
-            # Get latest 2 alerts for this portfolio
-            latest_alerts = (
-                db.query(Alert)
-                .filter(Alert.portfolio_id == portfolio.id)
-                .order_by(Alert.created_at.desc())
-                .limit(2)
-                .all()
-            )
+        for portfolio in portfolios_by_client.get(client.id, []):
+            latest_alerts = alerts_by_portfolio.get(portfolio.id)
 
             if not latest_alerts:
                 continue  # Skip portfolios with no alerts
 
-            # Current and previous risk
             current_alert = latest_alerts[0]
             current_risk = current_alert.risk_score
+            previous_risk = latest_alerts[1].risk_score if len(latest_alerts) >= 2 else None
+            trend, trend_pct, predicted_30d_risk = _project_risk(current_risk, previous_risk)
 
-            previous_risk: Optional[float] = None
-            trend = "STABLE"
-            trend_pct: Optional[float] = None
-
-            if len(latest_alerts) >= 2:
-                previous_alert = latest_alerts[1]
-                previous_risk = previous_alert.risk_score
-                delta = current_risk - previous_risk
-
-                if delta > 0.5:
-                    trend = "RISING"
-                elif delta < -0.5:
-                    trend = "FALLING"
-                else:
-                    trend = "STABLE"
-
-                if previous_risk != 0:
-                    trend_pct = round((delta / previous_risk) * 100, 1)
+            # Days without review
+            days_without_review = (now - current_alert.created_at).days
 
-            # Predict 30d risk
+            current_risk_total += current_risk
+            predicted_risk_total += predicted_30d_risk
             if trend == "RISING":
-                predicted_30d_risk = min(10.0, current_risk * 1.08)
-            elif trend == "FALLING":
-                predicted_30d_risk = max(0.0, current_risk * 0.96)
-            else:
-                predicted_30d_risk = current_risk * 1.01
-
-            # Days without review
-            days_without_review = (datetime.utcnow() - current_alert.created_at).days
+                rising_count += 1
+            if predicted_30d_risk >= 7:
+                high_risk_count += 1
 
-            row = RiskClientRow(
+            # Every field is computed locally from typed ORM columns; skip validation.
+            row = RiskClientRow.model_construct(
                 alert_id=current_alert.id,
                 client_id=client.id,
                 client_name=client.name,
@@ -103,17 +139,8 @@ def get_risk_dashboard(db: Session = Depends(get_db)) -> RiskDashboardResponse:
     # Sort by predicted_30d_risk (descending)
     rows.sort(key=lambda r: r.predicted_30d_risk, reverse=True)
 
-    # Compute aggregates
-    if rows:
-        avg_current_risk = sum(r.current_risk for r in rows) / len(rows)
-        avg_predicted_risk = sum(r.predicted_30d_risk for r in rows) / len(rows)
-        rising_count = sum(1 for r in rows if r.trend == "RISING")
-        high_risk_count = sum(1 for r in rows if r.predicted_30d_risk >= 7)
-    else:
-        avg_current_risk = 0.0
-        avg_predicted_risk = 0.0
-        rising_count = 0
-        high_risk_count = 0
+    avg_current_risk = current_risk_total / len(rows) if rows else 0.0
+    avg_predicted_risk = predicted_risk_total / len(rows) if rows else 0.0
 
     return RiskDashboardResponse(
         rows=rows,
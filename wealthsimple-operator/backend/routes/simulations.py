@@ -9,8 +9,10 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from sqlalchemy.orm import Session, joinedload
 
+from audit_writer import add_audit_event
 from db import get_db
 from models import (
+    Portfolio,
     SimulationRequest,
     SimulationSummary,
     SimulationScenario,
@@ -39,6 +41,31 @@ def _load_simulation_cache() -> Dict[str, Any]:
 
 router = APIRouter(prefix="/simulations", tags=["simulations"])
 
+_PLAYBOOK_URGENCY = {
+    "severe": ("Contact immediately", "Urgent"),
+    "moderate": ("Review rebalancing", "High"),
+    "mild": ("Monitor", "Medium"),
+}
+
+_PLAYBOOK_EMAIL_BODY = """Dear {client_name},
+
+Recent market analysis indicates your portfolio may need attention due to {scenario}.
+
+Current situation:
+- Your {portfolio_name} may experience trajectory drift in this scenario
+- Severity: {severity}
+- Recommended action: {action_type}
+
+Next steps:
+1. Review your current allocation and targets
+2. Discuss any life changes affecting your plan
+3. Consider rebalancing if allocations have drifted
+
+We recommend scheduling a call within 5 business days to discuss.
+
+Best regards,
+Advisor Team"""
+
 
 class PlaybookRequest(BaseModel):
     scenario: SimulationScenario
@@ -71,8 +98,6 @@ def generate_playbook(
     db: Session = Depends(get_db),
 ) -> PlaybookSummary:
     """Generate a defensive playbook with ranked actions for off-trajectory portfolios."""
-    from models import Alert, Portfolio, Client
-
     # Fetch portfolios and their clients
     portfolios = (
         db.query(Portfolio)
@@ -87,38 +112,23 @@ def generate_playbook(
     # Generate ranked action plan
     actions: List[PlaybookAction] = []
 
-    urgency_map = {
-        "severe": ("Contact immediately", "Urgent"),
-        "moderate": ("Review rebalancing", "High"),
-        "mild": ("Monitor", "Medium"),
-    }
+    action_type, urgency = _PLAYBOOK_URGENCY.get(payload.severity.value, ("Monitor", "Medium"))
 
-    action_type, urgency = urgency_map.get(payload.severity.value, ("Monitor", "Medium"))
+    # Scenario/severity text is the same for every portfolio; format it once.
+    scenario_text = payload.scenario.value.replace("_", " ")
+    subject = f"Action Required: Portfolio Review Due to {scenario_text.title()}"
+    severity_text = payload.severity.value.capitalize()
 
     for idx, portfolio in enumerate(portfolios, 1):
         client = portfolio.client
 
-        # Draft email subject and body
-        subject = f"Action Required: Portfolio Review Due to {payload.scenario.value.replace('_', ' ').title()}"
-
-        body = f"""Dear {client.name},
-
-Recent market analysis indicates your portfolio may need attention due to {payload.scenario.value.replace('_', ' ')}.
-
-Current situation:
-- Your {portfolio.name} may experience trajectory drift in this scenario
-- Severity: {payload.severity.value.capitalize()}
-- Recommended action: {action_type}
-
-Next steps:
-1. Review your current allocation and targets
-2. Discuss any life changes affecting your plan
-3. Consider rebalancing if allocations have drifted
-
-We recommend scheduling a call within 5 business days to discuss.
-
-Best regards,
-Advisor Team"""
+        body = _PLAYBOOK_EMAIL_BODY.format(
+            client_name=client.name,
+            scenario=scenario_text,
+            portfolio_name=portfolio.name,
+            severity=severity_text,
+            action_type=action_type,
+        )
 
         actions.append(
             PlaybookAction(
@@ -135,7 +145,8 @@ Advisor Team"""
     ai_rationale = f"Playbook generated for {len(portfolios)} portfolios off trajectory in {payload.scenario.value} scenario at {payload.severity.value} severity. Actions ranked by exposure and client tier. Review drafts and customize before sending."
 
     # Log audit event
-    db.add(
+    add_audit_event(
+        db,
         AuditEvent(
             event_type=AuditEventType.PLAYBOOK_GENERATED,
             actor="Kunal Jha",
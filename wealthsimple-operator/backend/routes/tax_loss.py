@@ -1,17 +1,29 @@
 from __future__ import annotations
 
+import functools
+import heapq
 from typing import Dict, List, Optional
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from db import get_db
+from dashboard_cache import cached_dashboard
+from db import get_readonly_db
 from models import Alert, Client, Portfolio, Position, TaxLossOpportunity, TaxLossResponse
 
 router = APIRouter(prefix="/tax-loss", tags=["tax-loss"])
 
+# Built once per process; only the execution (not the expression tree) is per request.
+_ALERTS_RANKED_PER_PORTFOLIO = select(
+    Alert.id,
+    func.row_number()
+    .over(partition_by=Alert.portfolio_id, order_by=(Alert.created_at.desc(), Alert.id.desc()))
+    .label("rn"),
+).subquery()
 
+
+@functools.lru_cache(maxsize=4096)
 def _estimate_unit_price(ticker: str, asset_class: str) -> float:
     """
     Deterministic unit price estimation using weighted character hash.
@@ -45,6 +57,7 @@ _FALLBACK_REPLACEMENT: Dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=4096)
 def _estimate_replacement_ticker(ticker: str, asset_class: str) -> Optional[str]:
     """Suggest a replacement ETF keyed by specific ticker, with asset class fallback."""
     return _REPLACEMENT_MAP.get(ticker) or _FALLBACK_REPLACEMENT.get(asset_class)
@@ -81,7 +94,11 @@ def _estimate_holding_period(ticker: str, portfolio_id: int) -> int:
 
 
 @router.get("/opportunities", response_model=TaxLossResponse)
-def get_tax_loss_opportunities(db: Session = Depends(get_db)) -> TaxLossResponse:
+def get_tax_loss_opportunities(db: Session = Depends(get_readonly_db)) -> TaxLossResponse:
+    return cached_dashboard("tax-loss-opportunities", lambda: _build_tax_loss_opportunities(db))
+
+
+def _build_tax_loss_opportunities(db: Session) -> TaxLossResponse:
     """
     Scan all positions for tax-loss harvesting opportunities.
 
@@ -94,49 +111,60 @@ def get_tax_loss_opportunities(db: Session = Depends(get_db)) -> TaxLossResponse
     - tax_savings_estimate: unrealized_loss * 0.2 (20% capital gains rate proxy)
     - wash_sale_risk: True if position.weight > 0.15 (high concentration)
     """
-    # Load all portfolios with positions
-    portfolios = db.query(Portfolio).all()
+    # Load all portfolios with their client and positions
+    portfolios = (
+        db.query(Portfolio)
+        .options(joinedload(Portfolio.client), selectinload(Portfolio.positions))
+        .all()
+    )
+
+    # Latest alert per portfolio (for drift/concentration scores) in one query
+    ranked = _ALERTS_RANKED_PER_PORTFOLIO
+    latest_alerts = db.query(Alert).join(ranked, ranked.c.id == Alert.id).filter(ranked.c.rn == 1)
+    latest_alert_by_portfolio: Dict[int, Alert] = {alert.portfolio_id: alert for alert in latest_alerts}
 
     opportunities: List[TaxLossOpportunity] = []
 
     for portfolio in portfolios:
-        # Get latest alert for this portfolio (for drift/concentration scores)
-        latest_alert = (
-            db.query(Alert)
-            .filter(Alert.portfolio_id == portfolio.id)
-            .order_by(Alert.created_at.desc())
-            .first()
+        latest_alert = latest_alert_by_portfolio.get(portfolio.id)
+
+        # Everything derived from the alert and client is per portfolio, not per position.
+        if latest_alert:
+            loss_factor = min(
+                0.25,
+                (latest_alert.drift_score + latest_alert.concentration_score) / 40.0
+            )
+        else:
+            loss_factor = 0.05  # Baseline if no alert
+
+        # Skip if loss factor too small
+        if loss_factor < 0.03:
+            continue
+
+        # Segment-adjusted capital gains rate
+        tax_rate = _marginal_tax_rate(portfolio.client.segment)
+
+        # Loss reason (context from alert metrics)
+        loss_reason = _loss_reason(
+            latest_alert.drift_score if latest_alert else 0.0,
+            latest_alert.concentration_score if latest_alert else 0.0
         )
 
         # Scan each position
         for position in portfolio.positions:
-            # Estimate unit price
+            # Estimate unit price (memoized per ticker across requests)
             unit_price = _estimate_unit_price(position.ticker, position.asset_class)
 
             # Estimate units (convert Decimal to float for calculation)
             estimated_units = float(position.value) / unit_price if unit_price > 0 else 0
 
-            # Compute loss factor from alert scores
-            if latest_alert:
-                loss_factor = min(
-                    0.25,
-                    (latest_alert.drift_score + latest_alert.concentration_score) / 40.0
-                )
-            else:
-                loss_factor = 0.05  # Baseline if no alert
-
-            # Skip if loss factor too small
-            if loss_factor < 0.03:
-                continue
-
             # Estimate cost basis per unit
             cost_basis_per_unit = unit_price * (1 + loss_factor)
 
             # Calculate unrealized loss
             unrealized_loss = estimated_units * (cost_basis_per_unit - unit_price)
 
-            # Tax savings (segment-adjusted capital gains rate)
-            tax_rate = _marginal_tax_rate(portfolio.client.segment)
+            # Tax savings
             tax_savings_estimate = unrealized_loss * tax_rate
 
             # Wash sale risk: high concentration = likely reacquired
@@ -145,16 +173,11 @@ def get_tax_loss_opportunities(db: Session = Depends(get_db)) -> TaxLossResponse
             # Replacement ticker (ticker-specific lookup with fallback)
             replacement_ticker = _estimate_replacement_ticker(position.ticker, position.asset_class)
 
-            # Loss reason (context from alert metrics)
-            loss_reason = _loss_reason(
-                latest_alert.drift_score if latest_alert else 0.0,
-                latest_alert.concentration_score if latest_alert else 0.0
-            )
-
             # Holding period (deterministic, ticker + portfolio dependent)
             holding_period_days = _estimate_holding_period(position.ticker, portfolio.id)
 
-            opportunity = TaxLossOpportunity(
+            # All fields are computed locally from typed columns; skip validation.
+            opportunity = TaxLossOpportunity.model_construct(
                 portfolio_id=portfolio.id,
                 portfolio_name=portfolio.name,
                 client_name=portfolio.client.name,
@@ -174,9 +197,9 @@ def get_tax_loss_opportunities(db: Session = Depends(get_db)) -> TaxLossResponse
             )
             opportunities.append(opportunity)
 
-    # Sort by tax savings (descending) and take top 20
-    opportunities.sort(key=lambda o: o.tax_savings_estimate, reverse=True)
-    top_opportunities = opportunities[:20]
+    # Top 20 by tax savings (descending); a bounded heap instead of a full sort,
+    # with the same stable ordering as sorted(..., reverse=True)[:20].
+    top_opportunities = heapq.nlargest(20, opportunities, key=lambda o: o.tax_savings_estimate)
 
     # Compute aggregates
     total_harvestable_loss = sum(o.unrealized_loss for o in top_opportunities)
@@ -13,20 +13,30 @@ Run: python seed.py [--clients N] [--gemini-enabled]
 
 from __future__ import annotations
 
-import json
+import hashlib
+import logging
+import logging.handlers
 import os
+import queue
+import sys
 import random
 import re
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from decimal import Decimal
-from typing import List, Tuple, Optional, Dict, Any
+from types import MappingProxyType
+from typing import List, Tuple, Optional, Dict, Any, Iterable, Iterator, Mapping
 from pathlib import Path
 
+import orjson
+from sqlalchemy import inspect, insert
 from sqlalchemy.orm import Session
 from dotenv import load_dotenv
 
 from db import Base, SessionLocal, engine
+from db_utils import next_ids
 from models import (
     Client,
     Portfolio,
@@ -47,6 +57,7 @@ try:
     from google import genai
     from google.genai import types
     from google.genai import errors as genai_errors
+    import httpx
 
     GEMINI_AVAILABLE = True
 except ImportError:
@@ -56,10 +67,29 @@ except ImportError:
 BASE_DIR = Path(__file__).resolve().parent
 load_dotenv(BASE_DIR / ".env", override=True)
 
+logger = logging.getLogger(__name__)
+
+# Gemini calls are network-bound, so several are kept in flight at once.
+# 429s are still absorbed by generate_with_retry's backoff.
+GEMINI_CONCURRENCY = int(os.getenv("SEED_GEMINI_CONCURRENCY", "8"))
+
+# Parsed Gemini responses are kept on disk so repeat seed runs skip the network.
+# They live in the user cache dir rather than the source tree; SEED_GEMINI_CACHE overrides.
+GEMINI_CACHE_PATH = Path(
+    os.getenv(
+        "SEED_GEMINI_CACHE",
+        str(
+            Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+            / "wealthsimple-operator"
+            / "gemini_seed_cache.sqlite"
+        ),
+    )
+)
+
 # ============================================================================
 # Scenario definitions for structured meeting note progression
 # ============================================================================
-SCENARIOS = [
+_SCENARIO_DEFINITIONS = [
     {
         "key": "EDUCATION_WITHDRAWAL",
         "label": "Education Withdrawal",
@@ -181,128 +211,210 @@ SCENARIOS = [
         "timeline_days": [0, 20, 58],
     },
 ]
-SCENARIO_KEYS_PROMPT = "|".join(s["key"] for s in SCENARIOS)
+# Frozen so the definitions can be shared safely with the Gemini worker threads.
+SCENARIOS: Tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType({**s, "timeline_days": tuple(s["timeline_days"])}) for s in _SCENARIO_DEFINITIONS
+)
+SCENARIO_BY_KEY: Dict[str, Mapping[str, Any]] = {s["key"]: s for s in SCENARIOS}
+SCENARIO_KEYS_PROMPT = "|".join(SCENARIO_BY_KEY)
 
 # Segments and risk profiles
-SEGMENTS = ["Core", "Affluent", "HNW", "UHNW"]
-RISK_PROFILES = ["Conservative", "Balanced", "Growth", "Aggressive"]
+SEGMENTS = ("Core", "Affluent", "HNW", "UHNW")
+RISK_PROFILES = ("Conservative", "Balanced", "Growth", "Aggressive")
 
-# Extended name pools for better diversity
-FIRST_NAMES = [
+# Extended name pools for better diversity (immutable; each name listed once so
+# random draws stay uniform)
+FIRST_NAMES = (
     "Alex", "Amelia", "Aria", "Benjamin", "Jordan", "Noah", "Liam", "Taylor",
-    "Priya", "Maya", "Morgan", "Ethan", "Olivia", "Casey", "Sofia", "Emma",
-    "Riley", "Lucas", "Aiden", "Avery", "Harper", "Nora", "Quinn", "Mateo",
-    "Isla", "Jamie", "Leo", "Mila", "Cameron", "Kai", "Zoe", "Aisha",
-    "Rohan", "Daniel", "Samira", "Chloe", "Owen", "Ruby", "Gabriel", "Layla",
-    "Ivy", "Elias", "Hassan", "Fatima", "Diego", "Lucia", "Anika", "Marcus",
-    "Jasmine", "Adrian", "Nina", "Vikram", "Patel", "Sarah", "Michael", "Jennifer",
-    "David", "Anna", "James", "Maria", "Robert", "Patricia", "William", "Linda",
-    "Richard", "Barbara", "Joseph", "Susan", "Thomas", "Jessica", "Christopher",
-    "Karen", "Matthew", "Lisa", "Anthony", "Nancy", "Donald", "Betty", "Mark",
-    "Margaret", "Steven", "Sandra", "Paul", "Ashley", "Andrew", "Kimberly",
-    "Joshua", "Donna", "Kenneth", "Carol", "Kevin", "Michelle", "Brian", "Amanda",
-    "George", "Melissa", "Edward", "Deborah", "Ronald", "Stephanie", "Timothy",
-    "Rebecca", "Jason", "Laura", "Jeffrey", "Sharon", "Ryan", "Cynthia", "Jacob",
-    "Kathleen", "Gary", "Amy", "Nicholas", "Shirley", "Eric", "Angela", "Jonathan",
-    "Helen", "Stephen", "Anna", "Larry", "Brenda", "Justin", "Pamela", "Scott",
-    "Nicole", "Brandon", "Samantha", "Benjamin", "Katherine", "Samuel", "Christine"
-]
+    "Priya", "Maya", "Morgan", "Ethan", "Olivia", "Casey", "Sofia", "Emma", "Riley",
+    "Lucas", "Aiden", "Avery", "Harper", "Nora", "Quinn", "Mateo", "Isla", "Jamie",
+    "Leo", "Mila", "Cameron", "Kai", "Zoe", "Aisha", "Rohan", "Daniel", "Samira",
+    "Chloe", "Owen", "Ruby", "Gabriel", "Layla", "Ivy", "Elias", "Hassan", "Fatima",
+    "Diego", "Lucia", "Anika", "Marcus", "Jasmine", "Adrian", "Nina", "Vikram",
+    "Patel", "Sarah", "Michael", "Jennifer", "David", "Anna", "James", "Maria",
+    "Robert", "Patricia", "William", "Linda", "Richard", "Barbara", "Joseph",
+    "Susan", "Thomas", "Jessica", "Christopher", "Karen", "Matthew", "Lisa",
+    "Anthony", "Nancy", "Donald", "Betty", "Mark", "Margaret", "Steven", "Sandra",
+    "Paul", "Ashley", "Andrew", "Kimberly", "Joshua", "Donna", "Kenneth", "Carol",
+    "Kevin", "Michelle", "Brian", "Amanda", "George", "Melissa", "Edward",
+    "Deborah", "Ronald", "Stephanie", "Timothy", "Rebecca", "Jason", "Laura",
+    "Jeffrey", "Sharon", "Ryan", "Cynthia", "Jacob", "Kathleen", "Gary", "Amy",
+    "Nicholas", "Shirley", "Eric", "Angela", "Jonathan", "Helen", "Stephen",
+    "Larry", "Brenda", "Justin", "Pamela", "Scott", "Nicole", "Brandon", "Samantha",
+    "Katherine", "Samuel", "Christine"
+)
 
-LAST_NAMES = [
+LAST_NAMES = (
     "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
     "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
     "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
     "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Young",
-    "Allen", "King", "Wright", "Scott", "Torres", "Peterson", "Phillips", "Campbell",
-    "Parker", "Evans", "Edwards", "Collins", "Reyes", "Stewart", "Morris", "Morales",
-    "Murphy", "Cook", "Rogers", "Morgan", "Peterson", "Cooper", "Reed", "Bell",
-    "Gomez", "Russell", "Fox", "Freeman", "Wells", "Webb", "Simpson", "Stevens",
-    "Tucker", "Porter", "Hunter", "Hicks", "Crawford", "Henry", "Boyd", "Mason",
-    "Moreno", "Kennedy", "Warren", "Dixon", "Ramos", "Reeves", "Burns", "Gordon",
-    "Shaw", "Holmes", "Rice", "Robertson", "Hunt", "Black", "Daniels", "Palmer",
-    "Mills", "Nichols", "Grant", "Knight", "Ferguson", "Stone", "Hawkins", "Dunn",
-    "Perkins", "Hudson", "Spencer", "Gardner", "Stephens", "Payne", "Pierce", "Berry",
-    "Matthews", "Arnold", "Wagner", "Willis", "Ray", "Watkins", "Olson", "Carroll",
-    "Duncan", "Snyder", "Hart", "Cunningham", "Knight", "Benson", "Wilkins", "Carpenter",
-    "Mccarthy", "Patel", "Khan", "Kumar", "Gupta", "Singh", "Sharma", "Desai",
-    "Chen", "Wang", "Zhang", "Liu", "Li", "Yang", "Wu", "Zhou",
+    "Allen", "King", "Wright", "Scott", "Torres", "Peterson", "Phillips",
+    "Campbell", "Parker", "Evans", "Edwards", "Collins", "Reyes", "Stewart",
+    "Morris", "Morales", "Murphy", "Cook", "Rogers", "Morgan", "Cooper", "Reed",
+    "Bell", "Gomez", "Russell", "Fox", "Freeman", "Wells", "Webb", "Simpson",
+    "Stevens", "Tucker", "Porter", "Hunter", "Hicks", "Crawford", "Henry", "Boyd",
+    "Mason", "Moreno", "Kennedy", "Warren", "Dixon", "Ramos", "Reeves", "Burns",
+    "Gordon", "Shaw", "Holmes", "Rice", "Robertson", "Hunt", "Black", "Daniels",
+    "Palmer", "Mills", "Nichols", "Grant", "Knight", "Ferguson", "Stone", "Hawkins",
+    "Dunn", "Perkins", "Hudson", "Spencer", "Gardner", "Stephens", "Payne",
+    "Pierce", "Berry", "Matthews", "Arnold", "Wagner", "Willis", "Ray", "Watkins",
+    "Olson", "Carroll", "Duncan", "Snyder", "Hart", "Cunningham", "Benson",
+    "Wilkins", "Carpenter", "Mccarthy", "Patel", "Khan", "Kumar", "Gupta", "Singh",
+    "Sharma", "Desai", "Chen", "Wang", "Zhang", "Liu", "Li", "Yang", "Wu", "Zhou",
     "Tanaka", "Yamamoto", "Nakamura", "Kobayashi", "Watanabe", "Kimura", "Hayashi",
-    "Kim", "Park", "Choi", "Jung", "Lee", "Kang", "Cho", "Yoon",
-    "Muller", "Schmidt", "Schneider", "Fischer", "Meyer", "Weber", "Wagner", "Becker",
-    "Schulz", "Hoffmann", "Koch", "Bauer", "Richter", "Klein", "Wolf", "Schroeder",
-    "Dubois", "Martin", "Bernard", "Clement", "Garand", "Bouchard", "Levesque", "Gagnon",
-    "O'Brien", "Sullivan", "Murphy", "Kelly", "Byrne", "Ryan", "Walsh", "Kennedy",
-    "McCarthy", "Donnelly", "Flanagan", "Duffy", "Lynch", "Gallagher", "Quinn"
-]
+    "Kim", "Park", "Choi", "Jung", "Kang", "Cho", "Yoon", "Muller", "Schmidt",
+    "Schneider", "Fischer", "Meyer", "Weber", "Becker", "Schulz", "Hoffmann",
+    "Koch", "Bauer", "Richter", "Klein", "Wolf", "Schroeder", "Dubois", "Bernard",
+    "Clement", "Garand", "Bouchard", "Levesque", "Gagnon", "O'Brien", "Sullivan",
+    "Kelly", "Byrne", "Ryan", "Walsh", "McCarthy", "Donnelly", "Flanagan", "Duffy",
+    "Lynch", "Gallagher", "Quinn"
+)
+
+
+def _shuffled_name_pool() -> Iterator[str]:
+    """
+    Yield every first/last name combination exactly once, in random order.
+
+    Drawing from this replaces rejection sampling against the used-name set, whose
+    retries grow as the set fills. The shuffle is an incremental Fisher-Yates over
+    combination indices: only displaced slots are stored, and only names actually
+    drawn are formatted, so cost follows the number of clients, not the pool size.
+    """
+    last_count = len(LAST_NAMES)
+    size = len(FIRST_NAMES) * last_count
+    displaced: Dict[int, int] = {}
+    for i in range(size):
+        j = random.randrange(i, size)
+        picked = displaced.get(j, j)
+        displaced[j] = displaced.pop(i, i)
+        first_idx, last_idx = divmod(picked, last_count)
+        yield f"{FIRST_NAMES[first_idx]} {LAST_NAMES[last_idx]}"
+
 
 # ============================================================================
 # Retry and error handling
 # ============================================================================
 
 
+# Rate-limit and transient server failures worth retrying.
+_RETRYABLE_ERROR_MARKERS = ("429", "RESOURCE_EXHAUSTED", "500", "503", "UNAVAILABLE")
+MAX_RETRY_DELAY_SECONDS = 60.0
+
+
 def generate_with_retry(call_fn, max_retries=8):
-    """Retry with exponential backoff and jitter."""
+    """Retry rate limits, server errors and timeouts with capped full-jitter backoff."""
     delay = 8.0
     for attempt in range(max_retries):
         try:
             return call_fn()
-        except genai_errors.ClientError as e:
+        except (genai_errors.APIError, httpx.TimeoutException, TimeoutError) as e:
             msg = str(e)
-            print(f"   [Attempt {attempt + 1}/{max_retries}] Error: {msg[:80]}")
-            if "429" in msg or "RESOURCE_EXHAUSTED" in msg or "503" in msg:
-                jittered_delay = delay + random.random()
-                print(f"   Rate limited/Overloaded. Retrying in {jittered_delay:.1f}s...")
-                time.sleep(jittered_delay)
-                delay = min(delay * 2, 20)
-                continue
-            raise
+            logger.debug("   [Attempt %d/%d] Error: %.80s", attempt + 1, max_retries, msg)
+            retryable = not isinstance(e, genai_errors.APIError) or any(
+                marker in msg for marker in _RETRYABLE_ERROR_MARKERS
+            )
+            if not retryable:
+                raise
+            if attempt == max_retries - 1:
+                break
+            # Full jitter: concurrent workers spread out instead of retrying in lockstep.
+            jittered_delay = random.uniform(0, delay)
+            logger.info("   Rate limited/Overloaded. Retrying in %.1fs...", jittered_delay)
+            time.sleep(jittered_delay)
+            delay = min(delay * 2, MAX_RETRY_DELAY_SECONDS)
+    return None
+
+
+class GeminiResponseCache:
+    """Parsed Gemini JSON responses in a local SQLite file, keyed by prompt hash."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by the worker threads; the lock serializes access.
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS gemini_responses "
+                "(prompt_hash TEXT PRIMARY KEY, response_json TEXT NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        return hashlib.blake2b("\x00".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response_json FROM gemini_responses WHERE prompt_hash = ?", (key,)
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO gemini_responses (prompt_hash, response_json) VALUES (?, ?)",
+                (key, orjson.dumps(value).decode("utf-8")),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Set for the duration of seed_client_universes when caching is enabled.
+_gemini_cache: Optional[GeminiResponseCache] = None
 
 
 def _extract_json_object(raw_text: str) -> Dict[str, Any]:
     """Parse model output into dict, even if wrapped with extra text/fences."""
-    text = raw_text.strip()
-    if text.startswith("```"):
-        text = "\n".join(
-            [line for line in text.splitlines() if not line.strip().startswith("```")]
-        ).strip()
+    # The outermost {...} span already excludes code fences and surrounding
+    # chatter, so one find/rfind pair replaces a line-by-line fence strip.
+    start = raw_text.find("{")
+    end = raw_text.rfind("}")
+    if start == -1 or end < start:
+        raise ValueError("Could not parse model output as JSON object")
 
     try:
-        parsed = json.loads(text)
-        if isinstance(parsed, dict):
-            return parsed
-    except Exception:
-        pass
-
-    start = text.find("{")
-    end = text.rfind("}")
-    if start != -1 and end != -1 and end > start:
-        maybe = text[start : end + 1]
-        parsed = json.loads(maybe)
-        if isinstance(parsed, dict):
-            return parsed
-    raise ValueError("Could not parse model output as JSON object")
+        parsed = orjson.loads(raw_text[start : end + 1])
+    except orjson.JSONDecodeError as exc:
+        raise ValueError("Could not parse model output as JSON object") from exc
+    if not isinstance(parsed, dict):
+        raise ValueError("Could not parse model output as JSON object")
+    return parsed
+
+
+# Transcript clean-up patterns, compiled once rather than on every call.
+_QUOTED_LINE_RE = re.compile(r'"([^"\n]+)"')
+_SCENE_HEADING_RE = re.compile(r"^(INT|EXT)\.\s+.+\s+-\s+(DAY|NIGHT|EVENING|MORNING)$")
+_SCENE_MARKERS = frozenset({"[SCENE START]", "[SCENE END]"})
+
+
+def _transcript_entry_line(entry: Any) -> str:
+    """Render one transcript list entry as a line; empty when it has no dialogue."""
+    if isinstance(entry, dict):
+        dialogue = str(entry.get("dialogue", "")).strip()
+        if not dialogue:
+            return ""
+        return f"{str(entry.get('speaker', 'Unknown')).strip()}: {dialogue}"
+    return str(entry).strip()
 
 
 def _normalize_transcript_text(call_transcript: Any) -> str:
     """Convert transcript payload into clean plain text dialogue."""
     transcript: str
     if isinstance(call_transcript, list):
-        lines = []
-        for entry in call_transcript:
-            if isinstance(entry, dict):
-                speaker = str(entry.get("speaker", "Unknown")).strip()
-                dialogue = str(entry.get("dialogue", "")).strip()
-                if dialogue:
-                    lines.append(f"{speaker}: {dialogue}")
-            else:
-                text = str(entry).strip()
-                if text:
-                    lines.append(text)
-        transcript = "\n".join(lines)
+        transcript = "\n".join(
+            line for line in map(_transcript_entry_line, call_transcript) if line
+        )
     elif isinstance(call_transcript, str):
         text = call_transcript.strip()
         try:
-            parsed = json.loads(text)
+            parsed = orjson.loads(text)
             if isinstance(parsed, list):
                 return _normalize_transcript_text(parsed)
             if isinstance(parsed, dict):
@@ -314,22 +426,22 @@ def _normalize_transcript_text(call_transcript: Any) -> str:
     else:
         transcript = str(call_transcript).strip()
 
-    # If transcript is malformed "quoted lines" block without commas, recover quoted lines.
+    # If transcript is malformed "quoted lines" block without commas, recover quoted
+    # lines and clean them directly rather than re-joining and re-splitting.
+    lines: Iterable[str] = ()
     if ('"' in transcript) and ("\n" in transcript) and ("Advisor:" not in transcript and "Client:" not in transcript):
-        quoted_lines = re.findall(r'"([^"\n]+)"', transcript)
-        if quoted_lines:
-            transcript = "\n".join(line.strip() for line in quoted_lines if line.strip())
+        lines = _QUOTED_LINE_RE.findall(transcript)
+    if not lines:
+        lines = transcript.splitlines()
 
-    # Strip scene markers and screenplay-style headings.
+    # One pass: strip, drop scene markers and screenplay-style headings.
     cleaned_lines: List[str] = []
-    for line in transcript.splitlines():
+    for line in lines:
         stripped = line.strip().strip("()")
         if not stripped:
             continue
         upper = stripped.upper()
-        if upper in {"[SCENE START]", "[SCENE END]"}:
-            continue
-        if re.match(r"^(INT|EXT)\.\s+.+\s+-\s+(DAY|NIGHT|EVENING|MORNING)$", upper):
+        if upper in _SCENE_MARKERS or _SCENE_HEADING_RE.fullmatch(upper):
             continue
         cleaned_lines.append(stripped)
 
@@ -340,29 +452,8 @@ def _normalize_transcript_text(call_transcript: Any) -> str:
 # Core Gemini-powered generation
 # ============================================================================
 
-
-def generate_client_universe_with_gemini(
-    gemini_client, client_id: int, used_names: set = None
-) -> Dict[str, Any]:
-    """
-    Generate a complete client universe using Gemini.
-
-    Returns a dict with:
-    - name: Full name (unique, not in used_names set)
-    - segment: Client segment (Core, Affluent, HNW, UHNW)
-    - risk_profile: Risk tolerance
-    - aum: AUM in dollars
-    - assets: List of asset allocations
-    - goals: Investment goals (detailed, 3-4 sentences)
-    - has_alert: Boolean (30% true)
-    - scenario: Scenario key if has_alert, else None
-    """
-    if used_names is None:
-        used_names = set()
-
-    prompt = f"""Generate a unique, realistic Canadian investor universe. Return ONLY JSON (no markdown):
-
-{{
+# One client universe, shared by the single-client and batched prompts.
+_UNIVERSE_JSON_SPEC = f"""{{
   "name": "<Full Canadian name (first and last)>",
   "segment": "<Core|Affluent|HNW|UHNW>",
   "risk_profile": "<Conservative|Balanced|Growth|Aggressive>",
@@ -374,9 +465,9 @@ def generate_client_universe_with_gemini(
   ],
   "has_alert": <true or false with 30% probability>,
   "scenario": "<if has_alert, one of: {SCENARIO_KEYS_PROMPT}, else null>"
-}}
+}}"""
 
-Requirements:
+_UNIVERSE_REQUIREMENTS = """Requirements:
 - name: Unique Canadian context (use surnames like Smith, Chen, Kumar, O'Brien, Bouchard, etc.) - MUST BE DIFFERENT FROM PREVIOUS
 - segment: Distribute realistically (60% Core, 25% Affluent, 10% HNW, 5% UHNW)
 - aum: Scale to segment (Core: 50k-300k, Affluent: 300k-800k, HNW: 800k-2M, UHNW: 2M+)
@@ -388,59 +479,249 @@ Requirements:
 - scenario: Only set if has_alert=true
 """
 
-    try:
-        response = generate_with_retry(
-            lambda: gemini_client.models.generate_content(
-                model="gemini-2.5-flash-lite",
-                contents=prompt,
-                config=types.GenerateContentConfig(temperature=0.9),
-            )
+# Static prompt text, assembled once at import rather than on every Gemini call.
+_UNIVERSE_PROMPT = f"""Generate a unique, realistic Canadian investor universe. Return ONLY JSON (no markdown):
+
+{_UNIVERSE_JSON_SPEC}
+
+{_UNIVERSE_REQUIREMENTS}"""
+
+_UNIVERSE_BATCH_PROMPT_BODY = f"""
+{_UNIVERSE_JSON_SPEC}
+>]}}
+
+{_UNIVERSE_REQUIREMENTS}- Every client in the array must have a different name
+"""
+
+_MEETING_PROMPT_REQUIREMENTS = """
+Requirements:
+- Natural dialogue between advisor and client
+- Realistic Canadian context (RRSP, TFSA, tax strategies, etc.)
+- Specific details (names, amounts, dates)
+- Action items and next steps
+- DO NOT include screenplay markers or scene headings (no "INT.", "EXT.", "[Sound ...]").
+
+Return ONLY JSON (no markdown):
+{
+  "note_body": "<1-2 paragraphs summarizing the meeting>",
+  "call_transcript": "<realistic advisor-client conversation>"
+}
+"""
+
+# Universes requested per Gemini call during seeding.
+UNIVERSE_BATCH_SIZE = 10
+
+# Structured-output schemas: Gemini returns JSON matching these exactly, so
+# responses arrive pre-parsed on ``response.parsed``.
+if GEMINI_AVAILABLE:
+    CLIENT_SCHEMA = types.Schema(
+        type=types.Type.OBJECT,
+        properties={
+            "name": types.Schema(type=types.Type.STRING),
+            "segment": types.Schema(type=types.Type.STRING, enum=list(SEGMENTS)),
+            "risk_profile": types.Schema(type=types.Type.STRING, enum=list(RISK_PROFILES)),
+            "aum": types.Schema(type=types.Type.NUMBER),
+            "goals": types.Schema(type=types.Type.STRING),
+            "assets": types.Schema(
+                type=types.Type.ARRAY,
+                items=types.Schema(
+                    type=types.Type.OBJECT,
+                    properties={
+                        "ticker": types.Schema(type=types.Type.STRING),
+                        "asset_class": types.Schema(
+                            type=types.Type.STRING, enum=["Equity", "Fixed Income", "Cash"]
+                        ),
+                        "percentage": types.Schema(type=types.Type.NUMBER),
+                    },
+                    required=["ticker", "asset_class", "percentage"],
+                ),
+            ),
+            "has_alert": types.Schema(type=types.Type.BOOLEAN),
+            "scenario": types.Schema(
+                type=types.Type.STRING, enum=list(SCENARIO_BY_KEY), nullable=True
+            ),
+        },
+        required=["name", "segment", "risk_profile", "aum", "goals", "assets", "has_alert"],
+    )
+    CLIENT_BATCH_SCHEMA = types.Schema(
+        type=types.Type.OBJECT,
+        properties={"clients": types.Schema(type=types.Type.ARRAY, items=CLIENT_SCHEMA)},
+        required=["clients"],
+    )
+    MEETING_SCHEMA = types.Schema(
+        type=types.Type.OBJECT,
+        properties={
+            "note_body": types.Schema(type=types.Type.STRING),
+            "call_transcript": types.Schema(type=types.Type.STRING),
+        },
+        required=["note_body", "call_transcript"],
+    )
+
+
+def _response_json_object(response) -> Dict[str, Any]:
+    """Return the structured-output dict, parsing the text only if the SDK could not."""
+    if isinstance(response.parsed, dict):
+        return response.parsed
+    if not response.text:
+        raise ValueError("Empty response from Gemini")
+    return _extract_json_object(response.text)
+
+
+def _generate_json(gemini_client, prompt: str, schema, cache_slot: str = "") -> Dict[str, Any]:
+    """
+    Run one structured-output Gemini request, answering from the response cache when possible.
+
+    ``cache_slot`` separates calls that share a prompt (the universe prompt is the
+    same for every client), so each slot caches its own response.
+    """
+    cache_key = GeminiResponseCache.key(prompt, cache_slot) if _gemini_cache else None
+    if cache_key:
+        cached = _gemini_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    response = generate_with_retry(
+        lambda: gemini_client.models.generate_content(
+            model="gemini-2.5-flash-lite",
+            contents=prompt,
+            config=types.GenerateContentConfig(
+                temperature=0.9,
+                response_mime_type="application/json",
+                response_schema=schema,
+            ),
         )
+    )
+
+    if not response:
+        raise ValueError("Empty response from Gemini")
+
+    parsed = _response_json_object(response)
+    if cache_key:
+        _gemini_cache.set(cache_key, parsed)
+    return parsed
 
-        if not response or not response.text:
-            raise ValueError("Empty response from Gemini")
-
-        raw_text = response.text.strip()
-        # Strip markdown code fences if present
-        if raw_text.startswith("```"):
-            raw_text = "\n".join(
-                [
-                    line
-                    for line in raw_text.splitlines()
-                    if not line.strip().startswith("```")
-                ]
-            ).strip()
-
-        parsed = json.loads(raw_text)
-        return parsed
+
+def generate_client_universe_with_gemini(
+    gemini_client,
+    client_id: int,
+    *,
+    rng: Optional[random.Random] = None,
+) -> Dict[str, Any]:
+    """
+    Generate a complete client universe using Gemini.
+
+    ``rng`` drives the fallback universe; pool workers pass their own so they
+    do not contend on the shared module-level generator.
+
+    Returns a dict with:
+    - name: Full name (duplicates are replaced by the caller)
+    - segment: Client segment (Core, Affluent, HNW, UHNW)
+    - risk_profile: Risk tolerance
+    - aum: AUM in dollars
+    - assets: List of asset allocations
+    - goals: Investment goals (detailed, 3-4 sentences)
+    - has_alert: Boolean (30% true)
+    - scenario: Scenario key if has_alert, else None
+    """
+    try:
+        return _generate_json(
+            gemini_client, _UNIVERSE_PROMPT, CLIENT_SCHEMA, cache_slot=f"client:{client_id}"
+        )
     except Exception as e:
-        print(f"   ERROR generating universe with Gemini: {e}")
+        logger.warning("   ERROR generating universe with Gemini: %s", e)
         # Return a fallback universe
-        fallback_risk = random.choice(RISK_PROFILES)
+        rng = rng or random.Random(os.urandom(8))
+        fallback_risk = rng.choice(RISK_PROFILES)
         fallback_equity, fallback_fixed_income, fallback_cash = _target_allocations_for_profile(
-            fallback_risk
+            fallback_risk, rng
         )
         return {
             "name": f"Client {client_id}",
-            "segment": random.choice(SEGMENTS),
+            "segment": rng.choice(SEGMENTS),
             "risk_profile": fallback_risk,
-            "aum": _non_round_dollar_amount(50_000, 2_000_000),
+            "aum": _non_round_dollar_amount(50_000, 2_000_000, rng),
             "goals": "Long-term wealth accumulation and retirement planning",
             "assets": [
                 {"ticker": "XBAL", "asset_class": "Equity", "percentage": fallback_equity},
                 {"ticker": "XBB", "asset_class": "Fixed Income", "percentage": fallback_fixed_income},
                 {"ticker": "CASH-CA", "asset_class": "Cash", "percentage": fallback_cash},
             ],
-            "has_alert": random.random() < 0.30,
+            "has_alert": rng.random() < 0.30,
             "scenario": None,
         }
 
 
+def generate_client_universe_batch_with_gemini(
+    gemini_client, batch_size: int, used_names: set = None, batch_index: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Generate up to ``batch_size`` client universes with a single Gemini call.
+
+    Each entry has the same shape as generate_client_universe_with_gemini's
+    result. May return fewer entries than requested (or none on error);
+    callers top up the shortfall with single-client calls. ``batch_index``
+    keeps each batch's cached response separate.
+    """
+    avoid_names = ""
+    if used_names:
+        avoid_names = "- Do not reuse any of these names: " + ", ".join(sorted(used_names)) + "\n"
+
+    prompt = (
+        f"Generate {batch_size} unique, realistic Canadian investor universes. "
+        "Return ONLY JSON (no markdown):\n\n"
+        f'{{"clients": [<exactly {batch_size} objects, each shaped like:'
+        + _UNIVERSE_BATCH_PROMPT_BODY
+        + avoid_names
+    )
+
+    try:
+        clients = _generate_json(
+            gemini_client, prompt, CLIENT_BATCH_SCHEMA, cache_slot=f"batch:{batch_index}"
+        ).get("clients")
+        if not isinstance(clients, list):
+            raise ValueError("Response has no 'clients' array")
+        return [c for c in clients if isinstance(c, dict)][:batch_size]
+    except Exception as e:
+        logger.warning("   ERROR generating universe batch with Gemini: %s", e)
+        return []
+
+
+def _generate_universes_in_batches(gemini_client, gemini_pool, count: int) -> List[Dict[str, Any]]:
+    """Generate ``count`` universes as concurrent batched calls, in client order."""
+
+    def _batch(start: int) -> List[Dict[str, Any]]:
+        size = min(UNIVERSE_BATCH_SIZE, count - start)
+        rng = random.Random(os.urandom(8))
+        universes = generate_client_universe_batch_with_gemini(
+            gemini_client, size, batch_index=start // UNIVERSE_BATCH_SIZE
+        )
+        # Top up a short batch one client at a time (that path has its own fallback).
+        for client_number in range(start + len(universes) + 1, start + size + 1):
+            universes.append(
+                generate_client_universe_with_gemini(gemini_client, client_number, rng=rng)
+            )
+        return universes
+
+    batches = gemini_pool.map(_batch, range(0, count, UNIVERSE_BATCH_SIZE))
+    return [universe for batch in batches for universe in batch]
+
+
+# Meeting kinds by timeline stage: first, middle, last.
+_MEETING_TYPES = ("initial planning meeting", "follow-up check-in", "final review call")
+
+
+def _meeting_stage(timeline_index: int, total_in_timeline: int) -> int:
+    """Index into _MEETING_TYPES for a note's position in its scenario timeline."""
+    if timeline_index == 0:
+        return 0
+    return 2 if timeline_index == total_in_timeline - 1 else 1
+
+
 def generate_scenario_meeting_notes_with_gemini(
     gemini_client,
     client_name: str,
     risk_profile: str,
-    scenario: Dict[str, Any],
+    scenario: Mapping[str, Any],
     timeline_index: int,
     total_in_timeline: int,
 ) -> Tuple[str, str]:
@@ -454,52 +735,23 @@ def generate_scenario_meeting_notes_with_gemini(
     scenario_label = scenario["label"]
     scenario_desc = scenario["description"]
 
-    if timeline_index == 0:
-        meeting_type_desc = "initial planning meeting"
-    elif timeline_index == total_in_timeline - 1:
-        meeting_type_desc = "final review call"
-    else:
-        meeting_type_desc = "follow-up check-in"
+    meeting_type_desc = _MEETING_TYPES[_meeting_stage(timeline_index, total_in_timeline)]
 
     prompt = f"""Generate a realistic advisor-client {meeting_type_desc} transcript for:
 - Client: {client_name}, {risk_profile} investor
 - Scenario: {scenario_label}
 - Description: {scenario_desc}
 - Timeline: Meeting {timeline_index + 1} of {total_in_timeline}
-
-Requirements:
-- Natural dialogue between advisor and client
-- Realistic Canadian context (RRSP, TFSA, tax strategies, etc.)
-- Specific details (names, amounts, dates)
-- Action items and next steps
-- DO NOT include screenplay markers or scene headings (no "INT.", "EXT.", "[Sound ...]").
-
-Return ONLY JSON (no markdown):
-{{
-  "note_body": "<1-2 paragraphs summarizing the meeting>",
-  "call_transcript": "<realistic advisor-client conversation>"
-}}
-"""
+""" + _MEETING_PROMPT_REQUIREMENTS
 
     try:
-        response = generate_with_retry(
-            lambda: gemini_client.models.generate_content(
-                model="gemini-2.5-flash-lite",
-                contents=prompt,
-                config=types.GenerateContentConfig(temperature=0.9),
-            )
-        )
-
-        if not response or not response.text:
-            raise ValueError("Empty response from Gemini")
-
-        parsed = _extract_json_object(response.text)
+        parsed = _generate_json(gemini_client, prompt, MEETING_SCHEMA)
         note_body = str(parsed.get("note_body", "")).strip()
         call_transcript = _normalize_transcript_text(parsed.get("call_transcript", ""))
 
         return note_body, call_transcript
     except Exception as e:
-        print(f"   ERROR generating meeting note with Gemini: {e}")
+        logger.warning("   ERROR generating meeting note with Gemini: %s", e)
         return "", ""
 
 
@@ -508,51 +760,195 @@ Return ONLY JSON (no markdown):
 # ============================================================================
 
 
+# Fallback note/transcript templates, filled with the client name and scenario label.
+_FALLBACK_INITIAL_NOTE = (
+    "Initial planning meeting with {name} regarding {label}. "
+    "Discussed client situation and drafted action plan. Next steps identified."
+)
+_FALLBACK_INITIAL_TRANSCRIPT = (
+    "Advisor: Good morning, {name}! Thanks for coming in today. "
+    "Let's discuss your {label} situation. "
+    "Client: Yes, I'm looking forward to getting your advice. "
+    "Advisor: Let me walk you through some options. "
+    "Client: That sounds great. What do you recommend? "
+    "Advisor: Let's start by reviewing your current situation and timeline."
+)
+_FALLBACK_FINAL_NOTE = (
+    "Final review call with {name} to finalize {label} strategy. "
+    "All action items confirmed and next review scheduled."
+)
+_FALLBACK_FINAL_TRANSCRIPT = (
+    "Advisor: {name}, following up on our plan. "
+    "Client: Yes, I'm ready to move forward. "
+    "Advisor: Excellent. Let's confirm the steps we discussed. "
+    "Client: When will we review this again? "
+    "Advisor: I'll schedule a follow-up in 3 months to ensure everything is on track."
+)
+_FALLBACK_FOLLOW_UP_NOTE = (
+    "Follow-up check-in with {name} on {label} progress. "
+    "Portfolio adjustments in progress, on track with timeline."
+)
+_FALLBACK_FOLLOW_UP_TRANSCRIPT = (
+    "Advisor: {name}, just checking in on our {label} plan. "
+    "Client: Things are going well, thanks for following up. "
+    "Advisor: Great to hear. Any questions or concerns? "
+    "Client: I had one question about the timing. "
+    "Advisor: Of course, let's discuss that."
+)
+# (note, transcript) template pairs, ordered like _MEETING_TYPES.
+_FALLBACK_TEMPLATES = (
+    (_FALLBACK_INITIAL_NOTE, _FALLBACK_INITIAL_TRANSCRIPT),
+    (_FALLBACK_FOLLOW_UP_NOTE, _FALLBACK_FOLLOW_UP_TRANSCRIPT),
+    (_FALLBACK_FINAL_NOTE, _FALLBACK_FINAL_TRANSCRIPT),
+)
+
+
 def generate_fallback_meeting_note(
-    client_name: str, scenario: Dict[str, Any], timeline_index: int, total_in_timeline: int
+    client_name: str, scenario: Mapping[str, Any], timeline_index: int, total_in_timeline: int
 ) -> Tuple[str, str]:
     """Generate a fallback meeting note if Gemini unavailable."""
-    scenario_label = scenario["label"]
+    note_template, transcript_template = _FALLBACK_TEMPLATES[
+        _meeting_stage(timeline_index, total_in_timeline)
+    ]
+
+    values = {"name": client_name, "label": scenario["label"]}
+    return note_template.format_map(values), transcript_template.format_map(values)
+
+
+# Alert summary per scenario: template with {client_name} (and {amount} when the
+# range, in thousands of dollars, is given) filled in per seeded client.
+_ALERT_SUMMARY_TEMPLATES: Dict[str, Tuple[str, Optional[Tuple[int, int]]]] = {
+    "EDUCATION_WITHDRAWAL": (
+        "{client_name}'s child is approaching post-secondary education with an estimated start date within 8-12 months. The current portfolio allocation may expose education funds to unnecessary volatility given the near-term withdrawal needs. We recommend gradually shifting the designated education portion (approximately {amount}) to a more conservative allocation to protect against market downturns and lock in current asset values.",
+        (20, 100),
+    ),
+    "TAX_LOSS_HARVESTING": (
+        "With the tax year approaching its end, {client_name}'s portfolio contains {amount} in unrealized losses that can be strategically harvested to offset capital gains and reduce overall tax liability. This window is time-sensitive and closes December 31st. Prompt action is needed to execute these trades while maintaining desired asset exposure through substitute holdings.",
+        (10, 80),
+    ),
+    "HOME_PURCHASE": (
+        "{client_name} is planning a home purchase in 12-18 months with an estimated down payment requirement of {amount}. The current portfolio allocation exposes these funds to significant market volatility. We recommend establishing a dedicated, conservative portfolio for the down payment funds while maintaining growth-oriented allocations for longer-term goals.",
+        (50, 300),
+    ),
+    "RETIREMENT_DRAWDOWN": (
+        "{client_name} has recently transitioned from an accumulation phase to retirement drawdown. The portfolio structure is not optimized for generating sustainable income while managing sequence of returns risk. We recommend restructuring to include a 2-3 year cash reserve, laddered fixed income, and a balanced equity allocation for long-term growth.",
+        None,
+    ),
+    "INHERITANCE_WINDFALL": (
+        "{client_name} recently received an inheritance of approximately {amount}. The current portfolio structure is not designed to efficiently absorb and deploy capital of this magnitude. A systematic deployment plan over 6-12 months can help optimize average entry prices and manage market timing risk.",
+        (100, 1000),
+    ),
+    "MARGIN_CALL_RISK": (
+        "{client_name}'s leveraged position is at elevated risk given current market conditions. Recent volatility has brought the margin ratio dangerously close to triggering a forced liquidation. Immediate action to reduce leverage by {amount} is critical to protect the portfolio from forced sales at unfavorable prices.",
+        (50, 300),
+    ),
+    "CONCENTRATED_STOCK_POSITION": (
+        "{client_name}'s largest holding has appreciated to a level that now represents a disproportionate share of total portfolio risk. This concentration creates downside vulnerability if the single name experiences a drawdown. We recommend a staged de-risking plan to reduce exposure by {amount} while managing taxes and preserving long-term growth objectives.",
+        (30, 180),
+    ),
+    "BUSINESS_EXIT_LIQUIDITY_EVENT": (
+        "{client_name} is preparing for a business sale that is expected to generate significant liquidity in the coming quarters. Without a structured deployment plan, idle cash drag and timing risk could materially affect long-term outcomes. We recommend a phased investment policy with short-term reserves and scheduled deployment of {amount} into diversified mandates.",
+        (200, 1500),
+    ),
+    "CROSS_BORDER_RELOCATION": (
+        "{client_name} is planning a cross-border relocation, introducing new tax residency and currency-management considerations. The current portfolio is not optimized for withholding tax exposure, account-structure portability, or FX volatility. A transition plan should reposition assets and build a currency hedge framework ahead of relocation timelines.",
+        None,
+    ),
+    "CHARITABLE_GIVING_STRATEGY": (
+        "{client_name} intends to make a meaningful charitable contribution in the near term and is evaluating donation methods. Donating appreciated securities could improve after-tax outcomes versus donating cash, but requires coordinated asset selection and timing. We recommend pre-identifying eligible lots and a gifting schedule to maximize impact while preserving portfolio balance.",
+        None,
+    ),
+    "ESTATE_FREEZE_PLANNING": (
+        "{client_name} has begun estate freeze and intergenerational transfer planning, which changes liquidity and tax priorities across account types. Current allocations may not align with upcoming trust, corporate-share, and succession structures. We recommend re-segmenting assets by horizon and risk budget to support the estate strategy while maintaining portfolio resilience.",
+        None,
+    ),
+    "INTEREST_RATE_REFINANCE_WINDOW": (
+        "Recent rate movements have created a refinance decision point for {client_name}, affecting monthly cash flow and liquidity buffers. The existing portfolio does not currently reflect the revised short-term cash requirements and rate sensitivity. We recommend a temporary liquidity sleeve and targeted rebalancing to support financing decisions without compromising core long-term allocation.",
+        None,
+    ),
+    "DIVORCE_SETTLEMENT_REBALANCE": (
+        "{client_name} has completed a divorce settlement and now requires a full post-settlement portfolio redesign. Asset ownership, liquidity timing, and updated goals have materially changed risk capacity and drawdown requirements. We recommend re-mapping accounts into a new strategic allocation and building a near-term liquidity buffer of {amount}.",
+        (30, 160),
+    ),
+    "RSU_VESTING_TAX_MANAGEMENT": (
+        "{client_name} has significant RSU vesting events approaching over the next two quarters, creating concentration and tax withholding complexity. Without a plan, post-vest exposure could exceed risk limits and increase tax drag. We recommend a staged sell policy with explicit tax-lot handling and systematic diversification of {amount}.",
+        (40, 220),
+    ),
+    "PENSION_COMMUTATION_DECISION": (
+        "{client_name} is evaluating whether to commute a defined-benefit pension or accept lifetime annuitized payments. This decision materially impacts longevity risk, liquidity flexibility, and required portfolio return assumptions. We recommend scenario testing both paths and preparing an allocation policy tied to the chosen income structure.",
+        None,
+    ),
+    "CURRENCY_HEDGE_REVIEW": (
+        "{client_name}'s foreign equity exposure has risen materially, increasing sensitivity to CAD currency swings. The current hedge ratio may no longer align with risk objectives or spending currency needs. We recommend re-establishing a target hedge corridor and rebalancing FX exposure using a phased implementation schedule.",
+        None,
+    ),
+    "PRIVATE_MARKET_LIQUIDITY_LOCKUP": (
+        "{client_name} has increased private-market allocations with multi-year lockups, reducing portfolio liquidity flexibility. Upcoming cash needs may now conflict with the current lockup profile and distribution timelines. We recommend a liquidity stress test and rebalancing public sleeves to create an accessible reserve of {amount}.",
+        (60, 260),
+    ),
+    "CRITICAL_ILLNESS_CONTINGENCY": (
+        "{client_name} is implementing a critical illness contingency plan requiring higher short-term liquidity and reduced drawdown risk. Current allocation assumes longer horizons and may not support sudden cash needs. We recommend a defensive rebalance with a dedicated contingency reserve and lower volatility positioning.",
+        None,
+    ),
+    "DRAWDOWN_SEQUENCE_RISK": (
+        "{client_name} has entered early drawdown, and current withdrawal rates make the portfolio vulnerable to sequence-of-returns shocks. A market decline in the next 12-24 months could materially impair sustainability. We recommend a bucket strategy with near-term cash/fixed-income funding and adjusted equity risk budgets.",
+        None,
+    ),
+    "ALTERNATIVE_ASSET_OVEREXPOSURE": (
+        "{client_name}'s alternatives sleeve has grown beyond policy limits due to strong performance and new commitments. The resulting allocation drift reduces transparency and complicates liquidity forecasting. We recommend a disciplined rebalance program to bring alternatives back within mandate while preserving long-term diversification benefits.",
+        None,
+    ),
+}
+
+# Prior life-event states used for the alerts' change detection.
+_PRIOR_STATES = (
+    "standard allocation",
+    "balanced portfolio",
+    "normal structure",
+    "unchanged status",
+    "maintenance mode",
+    "baseline configuration",
+    "typical positioning",
+)
 
-    if timeline_index == 0:
-        note_body = (
-            f"Initial planning meeting with {client_name} regarding {scenario_label}. "
-            f"Discussed client situation and drafted action plan. Next steps identified."
-        )
-        transcript = (
-            f"Advisor: Good morning, {client_name}! Thanks for coming in today. "
-            f"Let's discuss your {scenario_label} situation. "
-            f"Client: Yes, I'm looking forward to getting your advice. "
-            f"Advisor: Let me walk you through some options. "
-            f"Client: That sounds great. What do you recommend? "
-            f"Advisor: Let's start by reviewing your current situation and timeline."
-        )
-    elif timeline_index == total_in_timeline - 1:
-        note_body = (
-            f"Final review call with {client_name} to finalize {scenario_label} strategy. "
-            f"All action items confirmed and next review scheduled."
-        )
-        transcript = (
-            f"Advisor: {client_name}, following up on our plan. "
-            f"Client: Yes, I'm ready to move forward. "
-            f"Advisor: Excellent. Let's confirm the steps we discussed. "
-            f"Client: When will we review this again? "
-            f"Advisor: I'll schedule a follow-up in 3 months to ensure everything is on track."
-        )
-    else:
-        note_body = (
-            f"Follow-up check-in with {client_name} on {scenario_label} progress. "
-            f"Portfolio adjustments in progress, on track with timeline."
-        )
-        transcript = (
-            f"Advisor: {client_name}, just checking in on our {scenario_label} plan. "
-            f"Client: Things are going well, thanks for following up. "
-            f"Advisor: Great to hear. Any questions or concerns? "
-            f"Client: I had one question about the timing. "
-            f"Advisor: Of course, let's discuss that."
+# Decision trace per seeded alert as (step, detail template); the details take
+# {label}, {label_lower} and {risk_profile}.
+_ALERT_TRACE_TEMPLATE = (
+    ("Detection", "{label} event identified in client profile"),
+    ("Assessment", "Current portfolio allocation may not be optimal for {label_lower} scenario"),
+    ("Analysis", "Analyzing {risk_profile} portfolio against {label} requirements"),
+    ("Recommendation", "Advisor meeting required to discuss adjustments and implementation timeline"),
+)
+
+_ALERT_REVIEW_BULLET = (
+    "Advisor review and client discussion recommended to align portfolio with current life circumstances"
+)
+
+
+def _alert_summary(scenario_key: str, scenario_label: str, client_name: str) -> str:
+    """Render the seeded alert summary for a scenario, drawing its amount if it has one."""
+    entry = _ALERT_SUMMARY_TEMPLATES.get(scenario_key)
+    if entry is None:
+        return (
+            f"{client_name} requires portfolio review and adjustment regarding {scenario_label}. "
+            "Meeting recommended to discuss strategy and next steps."
         )
+    template, amount_range = entry
+    amount = _format_approx_amount(*amount_range) if amount_range else ""
+    return template.format(client_name=client_name, amount=amount)
+
 
-    return note_body, transcript
+def _alert_decision_trace(scenario_label: str, risk_profile: str) -> List[Dict[str, str]]:
+    """Fill the seeded decision trace template for one alert."""
+    values = {
+        "label": scenario_label,
+        "label_lower": scenario_label.lower(),
+        "risk_profile": risk_profile,
+    }
+    return [
+        {"step": step, "detail": detail.format_map(values)}
+        for step, detail in _ALERT_TRACE_TEMPLATE
+    ]
 
 
 # ============================================================================
@@ -560,8 +956,35 @@ def generate_fallback_meeting_note(
 # ============================================================================
 
 
+def _sqlite_schema_matches_models(conn) -> bool:
+    """True if every model table exists with exactly its columns and indexes."""
+    for table in Base.metadata.sorted_tables:
+        # table_xinfo (unlike table_info) also reports generated columns.
+        columns = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_xinfo({table.name})")}
+        if columns != {column.name for column in table.columns}:
+            return False
+        indexes = {row[1] for row in conn.exec_driver_sql(f"PRAGMA index_list({table.name})")}
+        if not {index.name for index in table.indexes} <= indexes:
+            return False
+    return True
+
+
 def reset_database() -> None:
-    """Reset the entire database."""
+    """
+    Reset the entire database.
+
+    On SQLite with an up-to-date schema the tables are emptied in place, which
+    skips re-issuing DDL for every table on each re-seed. Any schema drift
+    (new tables, columns or indexes) falls back to dropping and recreating.
+    """
+    if str(engine.url).startswith("sqlite"):
+        with engine.begin() as conn:
+            if _sqlite_schema_matches_models(conn):
+                # Children first; INTEGER PRIMARY KEY ids restart at 1 once a table is empty.
+                for table in reversed(Base.metadata.sorted_tables):
+                    conn.execute(table.delete())
+                return
+
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
 
@@ -576,24 +999,27 @@ def _account_tier_for_aum(aum: float) -> str:
         return "Generation"
 
 
-def _non_round_dollar_amount(min_amount: int, max_amount: int) -> int:
+def _non_round_dollar_amount(
+    min_amount: int, max_amount: int, rng: Optional[random.Random] = None
+) -> int:
     """Generate a dollar amount that avoids obvious round-number endings."""
-    amount = random.randint(min_amount, max_amount)
-    if amount % 100 != 0:
-        return amount
+    rng = rng or random
+    return _nudge_off_round(rng.randint(min_amount, max_amount), min_amount, max_amount, rng)
 
-    for _ in range(20):
-        delta = random.choice([11, 27, 37, 53, 71, 89, 97])
-        candidate = amount + delta if random.random() < 0.5 else amount - delta
-        if min_amount <= candidate <= max_amount and candidate % 100 != 0:
-            return candidate
 
-    for _ in range(100):
-        candidate = random.randint(min_amount, max_amount)
-        if candidate % 100 != 0:
-            return candidate
+def _nudge_off_round(amount: int, min_amount: int, max_amount: int, rng: Any = random) -> int:
+    """Return ``amount`` unchanged unless it is a multiple of 100, else a nearby non-round value."""
+    if amount % 100 != 0:
+        return amount
 
-    return amount
+    # Every other value within 99 of a round amount is non-round, so a single draw
+    # from the in-range neighbours (skipping the amount itself) always succeeds.
+    low = max(min_amount, amount - 99)
+    high = min(max_amount, amount + 99)
+    if low == high:
+        return amount
+    candidate = rng.randint(low, high - 1)
+    return candidate + 1 if candidate >= amount else candidate
 
 
 def _normalize_non_round_aum(
@@ -603,12 +1029,12 @@ def _normalize_non_round_aum(
     try:
         amount = int(float(value))
     except (TypeError, ValueError):
-        amount = _non_round_dollar_amount(min_amount, max_amount)
+        return _non_round_dollar_amount(min_amount, max_amount)
 
+    # Nudge a round figure rather than redrawing it, so the AUM stays in the range the
+    # model scaled to the client's segment.
     bounded = max(min_amount, min(max_amount, amount))
-    if bounded % 100 != 0:
-        return bounded
-    return _non_round_dollar_amount(min_amount, max_amount)
+    return _nudge_off_round(bounded, min_amount, max_amount)
 
 
 def _format_approx_amount(min_k: int, max_k: int) -> str:
@@ -617,18 +1043,25 @@ def _format_approx_amount(min_k: int, max_k: int) -> str:
     return f"${amount:,}"
 
 
-def _target_allocations_for_profile(profile: str) -> Tuple[float, float, float]:
-    """Get target allocations for a risk profile."""
-    base_allocations = {
+# Base (equity, fixed income, cash) percentages per risk profile, before jitter.
+BASE_ALLOCATIONS: Mapping[str, Tuple[float, float, float]] = MappingProxyType(
+    {
         "Conservative": (40.0, 50.0, 10.0),
         "Balanced": (60.0, 30.0, 10.0),
         "Growth": (75.0, 20.0, 5.0),
         "Aggressive": (85.0, 12.0, 3.0),
     }
+)
 
-    base_equity, base_fixed_income, _ = base_allocations.get(profile, (85.0, 12.0, 3.0))
-    equity = round(base_equity + random.uniform(-2.4, 2.4), 1)
-    fixed_income = round(base_fixed_income + random.uniform(-2.0, 2.0), 1)
+
+def _target_allocations_for_profile(
+    profile: str, rng: Optional[random.Random] = None
+) -> Tuple[float, float, float]:
+    """Get target allocations for a risk profile."""
+    rng = rng or random
+    base_equity, base_fixed_income, _ = BASE_ALLOCATIONS.get(profile, BASE_ALLOCATIONS["Aggressive"])
+    equity = round(base_equity + rng.uniform(-2.4, 2.4), 1)
+    fixed_income = round(base_fixed_income + rng.uniform(-2.0, 2.0), 1)
     cash = round(100.0 - equity - fixed_income, 1)
 
     if cash < 1.0:
@@ -640,49 +1073,59 @@ def _target_allocations_for_profile(profile: str) -> Tuple[float, float, float]:
     return equity, fixed_income, cash
 
 
-def _create_positions_for_portfolio(
-    session: Session, portfolio: Portfolio, total_value: Decimal, assets: Optional[List[Dict]] = None
-) -> None:
-    """Create positions for a portfolio."""
+_FALLBACK_POSITION_TICKERS = (
+    "VFV",
+    "VSP",
+    "VUN",
+    "XIC",
+    "XGB",
+    "XBB",
+    "VAB",
+    "VBG",
+    "ZCS",
+    "ZSP",
+    "HBAL",
+    "XBAL",
+)
+# Repeated entries weight the draw towards equity.
+_FALLBACK_POSITION_ASSET_CLASSES = ("Equity", "Equity", "Equity", "Fixed Income", "Cash")
+
+
+def _position_rows(
+    total_value: int, assets: Optional[List[Dict]] = None
+) -> List[Dict[str, Any]]:
+    """Position rows for a portfolio, without portfolio_id (filled in at insert time)."""
+    rows: List[Dict[str, Any]] = []
+    # Values are split in integer cents and handed over as plain floats; the
+    # Numeric column converts to float on SQLite anyway.
+    total_cents = total_value * 100
     if assets is None:
         # Fallback: generate random positions
         min_positions = 5
         max_positions = 12
         num_positions = random.randint(min_positions, max_positions)
 
-        raw_weights = [random.random() for _ in range(num_positions)]
+        # Normalized Exp(1) draws are a flat Dirichlet sample, i.e. uniform over the
+        # simplex; normalized uniforms would bunch weights toward the centre.
+        raw_weights = [random.expovariate(1.0) for _ in range(num_positions)]
         total_raw = sum(raw_weights)
         weights = [w / total_raw for w in raw_weights]
 
-        tickers = [
-            "VFV",
-            "VSP",
-            "VUN",
-            "XIC",
-            "XGB",
-            "XBB",
-            "VAB",
-            "VBG",
-            "ZCS",
-            "ZSP",
-            "HBAL",
-            "XBAL",
-        ]
-        asset_classes_list = ["Equity", "Equity", "Equity", "Fixed Income", "Cash"]
-
-        for weight in weights:
-            ticker = random.choice(tickers)
-            asset_class = random.choice(asset_classes_list)
-            value = total_value * Decimal(weight)
-
-            position = Position(
-                portfolio_id=portfolio.id,
-                ticker=ticker,
-                asset_class=asset_class,
-                weight=float(weight),
-                value=value,
+        # One draw per column for the whole portfolio rather than two per position
+        tickers = random.choices(_FALLBACK_POSITION_TICKERS, k=num_positions)
+        asset_classes = random.choices(_FALLBACK_POSITION_ASSET_CLASSES, k=num_positions)
+
+        for weight, ticker, asset_class in zip(weights, tickers, asset_classes):
+            value = round(total_cents * weight) / 100
+
+            rows.append(
+                {
+                    "ticker": ticker,
+                    "asset_class": asset_class,
+                    "weight": weight,
+                    "value": value,
+                }
             )
-            session.add(position)
     else:
         # Use provided assets
         for asset in assets:
@@ -690,19 +1133,122 @@ def _create_positions_for_portfolio(
             asset_class = asset.get("asset_class", "Equity")
             percentage = asset.get("percentage", 1.0) / 100.0  # Convert from percentage
 
-            value = total_value * Decimal(percentage)
+            value = round(total_cents * percentage) / 100
 
-            position = Position(
-                portfolio_id=portfolio.id,
-                ticker=ticker,
-                asset_class=asset_class,
-                weight=float(percentage),
-                value=value,
+            rows.append(
+                {
+                    "ticker": ticker,
+                    "asset_class": asset_class,
+                    "weight": percentage,
+                    "value": value,
+                }
             )
-            session.add(position)
 
+    return rows
+
+
+def _scenario_meeting_note_rows(
+    ai_provider: MockAIProvider,
+    now: datetime,
+    client_name: str,
+    risk_profile: str,
+    scenario: Mapping[str, Any],
+    generated_notes: List[Tuple[str, str]],
+) -> List[Dict[str, Any]]:
+    """
+    Meeting note rows, one per point on the scenario timeline, without client_id.
 
-def seed_client_universes(session: Session, count: int = 70, use_gemini: bool = True) -> None:
+    Empty generated (note, transcript) pairs fall back to the templates.
+    """
+    timeline_days = scenario.get("timeline_days", (0, 30, 60))
+    rows: List[Dict[str, Any]] = []
+    for timeline_idx, days_offset in enumerate(timeline_days):
+        meeting_date = now - timedelta(days=days_offset)
+
+        # Generated meeting note and transcript, or the template fallback
+        note_body, call_transcript = generated_notes[timeline_idx]
+        if not note_body or not call_transcript:
+            note_body, call_transcript = generate_fallback_meeting_note(
+                client_name, scenario, timeline_idx, len(timeline_days)
+            )
+
+        # Auto-summarize transcript
+        ai_summary = ""
+        action_items = []
+        if call_transcript and isinstance(call_transcript, str) and call_transcript.strip():
+            summary_result = ai_provider.summarize_transcript(
+                transcript=call_transcript,
+                context={
+                    "client_name": client_name,
+                    "risk_profile": risk_profile,
+                    "scenario": scenario["label"],
+                },
+            )
+            ai_summary = summary_result.summary_paragraph
+            action_items = (
+                summary_result.action_items
+                if isinstance(summary_result.action_items, list)
+                else []
+            )
+
+        # Ensure action_items is a list
+        if not isinstance(action_items, list):
+            action_items = []
+
+        rows.append(
+            {
+                "title": f"{scenario['label']} - {['Planning', 'Follow-up', 'Review'][min(timeline_idx, 2)]}",
+                "meeting_date": meeting_date,
+                "note_body": note_body or f"Meeting regarding {scenario['label']}",
+                "meeting_type": MeetingNoteType.PHONE_CALL,
+                "call_transcript": str(call_transcript) if call_transcript else "",
+                "ai_summary": ai_summary,
+                "ai_action_items": action_items,
+                "ai_summarized_at": now if ai_summary else None,
+                "ai_provider_used": "mock",
+            }
+        )
+
+    return rows
+
+
+def _insert_child_rows(
+    session: Session,
+    pending_positions: List[Tuple[Portfolio, List[Dict[str, Any]]]],
+    pending_notes: List[Tuple[Client, List[Dict[str, Any]]]],
+) -> None:
+    """
+    Flush the batch's clients/portfolios/alerts, then bulk-insert their positions and notes.
+
+    Parents still go through the ORM because their ids are needed here, but the
+    far more numerous child rows are written as one executemany per table.
+    """
+    session.flush()
+    # identity holds the primary key without refreshing objects expired by a commit.
+    position_rows = [
+        {**row, "portfolio_id": inspect(portfolio).identity[0]}
+        for portfolio, rows in pending_positions
+        for row in rows
+    ]
+    note_rows = [
+        {**row, "client_id": inspect(client).identity[0]}
+        for client, rows in pending_notes
+        for row in rows
+    ]
+    if position_rows:
+        session.execute(insert(Position), position_rows)
+    if note_rows:
+        session.execute(insert(MeetingNote), note_rows)
+    pending_positions.clear()
+    pending_notes.clear()
+
+
+def seed_client_universes(
+    session: Session,
+    count: int = 70,
+    use_gemini: bool = True,
+    gemini_cache_path: Optional[Path] = GEMINI_CACHE_PATH,
+) -> None:
     """
     Seed complete client universes.
 
@@ -713,13 +1259,13 @@ def seed_client_universes(session: Session, count: int = 70, use_gemini: bool =
     - If alert: Scenario with linear progression of meeting notes
     - Auto-summarized transcripts for all meeting notes
     """
-    print(f"\n[SEEDING CLIENT UNIVERSES]")
-    print(f"Generating {count} clients")
-    print(f"Gemini available: {GEMINI_AVAILABLE}")
-    print(f"Using Gemini: {use_gemini and GEMINI_AVAILABLE}")
-    print(f"Provider env: {os.getenv('PROVIDER', 'mock')}")
-    print(f"GEMINI_API_KEY set: {bool(os.getenv('GEMINI_API_KEY', '').strip())}")
-    print(f"Loaded env file: {BASE_DIR / '.env'}\n")
+    logger.info("[SEEDING CLIENT UNIVERSES]")
+    logger.info("Generating %d clients", count)
+    logger.info("Gemini available: %s", GEMINI_AVAILABLE)
+    logger.info("Using Gemini: %s", use_gemini and GEMINI_AVAILABLE)
+    logger.info("Provider env: %s", os.getenv("PROVIDER", "mock"))
+    logger.info("GEMINI_API_KEY set: %s", bool(os.getenv("GEMINI_API_KEY", "").strip()))
+    logger.info("Loaded env file: %s", BASE_DIR / ".env")
 
     now = datetime.utcnow()
     started_at = time.perf_counter()
@@ -731,45 +1277,78 @@ def seed_client_universes(session: Session, count: int = 70, use_gemini: bool =
         gemini_api_key = os.getenv("GEMINI_API_KEY")
         if gemini_api_key:
             gemini_client = genai.Client(api_key=gemini_api_key)
-            print("Gemini client initialized for universe generation\n")
+            logger.info("Gemini client initialized for universe generation")
         else:
-            print("WARNING: GEMINI_API_KEY not set, will use fallback generation\n")
+            logger.warning("GEMINI_API_KEY not set, will use fallback generation")
+
+    gemini_pool = (
+        ThreadPoolExecutor(max_workers=GEMINI_CONCURRENCY, thread_name_prefix="seed-gemini")
+        if gemini_client
+        else None
+    )
+    global _gemini_cache
+    if gemini_client and gemini_cache_path is not None:
+        _gemini_cache = GeminiResponseCache(gemini_cache_path)
+        logger.info("Gemini response cache: %s", gemini_cache_path)
+
+    # Generate every universe up front, UNIVERSE_BATCH_SIZE per request and
+    # fanned out across the pool, instead of one blocking request plus a fixed
+    # sleep per client inside the loop.
+    prefetched_universes: List[Dict[str, Any]] = []
+    if gemini_pool is not None:
+        logger.info(
+            "Generating %d universes with Gemini (%d in flight)...", count, GEMINI_CONCURRENCY
+        )
+        prefetched_universes = _generate_universes_in_batches(gemini_client, gemini_pool, count)
+        logger.info("Universes generated in %.1fs", time.perf_counter() - started_at)
 
     # Create a single Run for all seeded alerts
     run = Run(started_at=now, provider_used="seed", alerts_created=0)
     session.add(run)
     session.flush()
+    client_ids = next_ids(session, Client)
+    portfolio_ids = next_ids(session, Portfolio)
+    alert_ids = next_ids(session, Alert)
+    # The whole seed is one transaction, committed once at the end. Each batch of
+    # clients is a savepoint inside it, so a failing client still only discards
+    # the clients added since the last batch was written.
+    batch = session.begin_nested()
 
     created_clients = 0
     created_alerts = 0
     created_notes = 0
-    used_names = set()  # Track names to avoid duplicates
+    # Exact set of names already assigned. The strings are shared with the universe
+    # dicts, so this costs only hash slots; a probabilistic filter would save little
+    # and its false positives would rename clients that were never duplicates.
+    used_names: set = set()
+    name_pool = _shuffled_name_pool()
+    # (client, name, risk_profile, scenario, futures) for notes still being generated;
+    # entries before index committed_pending belong to clients in written batches.
+    pending_scenario_notes: List[Tuple[Client, str, str, Mapping[str, Any], list]] = []
+    committed_pending = 0
+    # Child rows for clients added since the last batch, bulk-inserted with the next one.
+    pending_positions: List[Tuple[Portfolio, List[Dict[str, Any]]]] = []
+    pending_notes: List[Tuple[Client, List[Dict[str, Any]]]] = []
 
     for i in range(count):
         try:
             if i == 0 or (i + 1) % 5 == 0:
                 elapsed = time.perf_counter() - started_at
-                print(f"[{i+1}/{count}] Processing client universe... ({elapsed:.1f}s elapsed)")
+                logger.info(
+                    "[%d/%d] Processing client universe... (%.1fs elapsed)", i + 1, count, elapsed
+                )
 
             # Generate complete universe with Gemini or fallback
             universe = None
 
             if gemini_client and use_gemini:
-                universe = generate_client_universe_with_gemini(gemini_client, i + 1)
-                time.sleep(1)  # Rate limit
+                universe = prefetched_universes[i]
             else:
-                # Fallback: generate universe with local name generation
-                first = random.choice(FIRST_NAMES)
-                last = random.choice(LAST_NAMES)
-                name = f"{first} {last}"
-
-                # Ensure unique name in fallback mode
-                attempts = 0
-                while name in used_names and attempts < 50:
-                    first = random.choice(FIRST_NAMES)
-                    last = random.choice(LAST_NAMES)
-                    name = f"{first} {last}"
-                    attempts += 1
+                # Fallback: next unused name from the shuffled local pool
+                name = next(
+                    (candidate for candidate in name_pool if candidate not in used_names),
+                    f"Client {i + 1}",
+                )
 
                 fallback_risk = random.choice(RISK_PROFILES)
                 fallback_equity, fallback_fixed_income, fallback_cash = _target_allocations_for_profile(
@@ -794,29 +1373,31 @@ def seed_client_universes(session: Session, count: int = 70, use_gemini: bool =
             if universe:
                 client_name = universe.get("name", f"Client {i + 1}")
                 if client_name in used_names:
-                    print(f"   [DUPLICATE] Name '{client_name}' already used, generating replacement...")
-                    # Generate a unique name locally to replace the duplicate
-                    first = random.choice(FIRST_NAMES)
-                    last = random.choice(LAST_NAMES)
-                    replacement_name = f"{first} {last}"
-                    attempts = 0
-                    while replacement_name in used_names and attempts < 50:
-                        first = random.choice(FIRST_NAMES)
-                        last = random.choice(LAST_NAMES)
-                        replacement_name = f"{first} {last}"
-                        attempts += 1
-
-                    if replacement_name not in used_names:
+                    logger.info(
+                        "   [DUPLICATE] Name '%s' already used, generating replacement...",
+                        client_name,
+                    )
+                    # Resolve the duplicate locally rather than asking Gemini again
+                    replacement_name = next(
+                        (candidate for candidate in name_pool if candidate not in used_names),
+                        None,
+                    )
+
+                    if replacement_name is not None:
                         universe["name"] = replacement_name
                         client_name = replacement_name
-                        print(f"   [REPLACEMENT] Using '{replacement_name}' instead")
+                        logger.info("   [REPLACEMENT] Using '%s' instead", replacement_name)
                     else:
-                        print(f"   [ERROR] Could not find unique name, skipping client {i + 1}")
+                        logger.warning(
+                            "   [ERROR] Could not find unique name, skipping client %d", i + 1
+                        )
                         continue
 
                 used_names.add(client_name)
             else:
-                print(f"   [ERROR] Could not generate universe for client {i + 1}, skipping")
+                logger.warning(
+                    "   [ERROR] Could not generate universe for client %d, skipping", i + 1
+                )
                 continue
             segment = universe.get("segment", "Core")
             risk_profile = universe.get("risk_profile", "Balanced")
@@ -828,6 +1409,7 @@ def seed_client_universes(session: Session, count: int = 70, use_gemini: bool =
 
             # Create client
             client = Client(
+                id=next(client_ids),
                 name=client_name,
                 email=f"{client_name.lower().replace(' ', '.')}{i+1}@example.internal",
                 segment=segment,
@@ -836,17 +1418,19 @@ def seed_client_universes(session: Session, count: int = 70, use_gemini: bool =
                 created_at=now - timedelta(days=random.randint(30, 365 * 5)),
             )
             session.add(client)
-            session.flush()
             created_clients += 1
 
             # Create portfolio with generated assets
-            total_value = Decimal(aum)
+            total_value = aum
             target_equity, target_fixed_income, target_cash = _target_allocations_for_profile(
                 risk_profile
             )
 
+            # Rows are linked through relationships rather than flushed one at a time
+            # for their ids; each batch commit inserts every table in bulk.
             portfolio = Portfolio(
-                client_id=client.id,
+                id=next(portfolio_ids),
+                client=client,
                 name="Primary Portfolio",
                 total_value=total_value,
                 target_equity_pct=target_equity,
@@ -854,20 +1438,14 @@ def seed_client_universes(session: Session, count: int = 70, use_gemini: bool =
                 target_cash_pct=target_cash,
             )
             session.add(portfolio)
-            session.flush()
 
             # Create positions
-            _create_positions_for_portfolio(session, portfolio, total_value, assets)
+            pending_positions.append((portfolio, _position_rows(total_value, assets)))
 
             # If client has alert, create it with scenario
             alert = None
             if has_alert and scenario_key:
-                # Find the scenario
-                scenario = None
-                for s in SCENARIOS:
-                    if s["key"] == scenario_key:
-                        scenario = s
-                        break
+                scenario = SCENARIO_BY_KEY.get(scenario_key)
 
                 if scenario:
                     # Create alert with detailed description
@@ -876,51 +1454,17 @@ def seed_client_universes(session: Session, count: int = 70, use_gemini: bool =
                     )  # 50% HIGH
                     confidence = random.randint(70, 95)
 
-                    # Generate detailed alert summary based on scenario
-                    scenario_summaries = {
-                        "EDUCATION_WITHDRAWAL": f"{client_name}'s child is approaching post-secondary education with an estimated start date within 8-12 months. The current portfolio allocation may expose education funds to unnecessary volatility given the near-term withdrawal needs. We recommend gradually shifting the designated education portion (approximately {_format_approx_amount(20, 100)}) to a more conservative allocation to protect against market downturns and lock in current asset values.",
-                        "TAX_LOSS_HARVESTING": f"With the tax year approaching its end, {client_name}'s portfolio contains {_format_approx_amount(10, 80)} in unrealized losses that can be strategically harvested to offset capital gains and reduce overall tax liability. This window is time-sensitive and closes December 31st. Prompt action is needed to execute these trades while maintaining desired asset exposure through substitute holdings.",
-                        "HOME_PURCHASE": f"{client_name} is planning a home purchase in 12-18 months with an estimated down payment requirement of {_format_approx_amount(50, 300)}. The current portfolio allocation exposes these funds to significant market volatility. We recommend establishing a dedicated, conservative portfolio for the down payment funds while maintaining growth-oriented allocations for longer-term goals.",
-                        "RETIREMENT_DRAWDOWN": f"{client_name} has recently transitioned from an accumulation phase to retirement drawdown. The portfolio structure is not optimized for generating sustainable income while managing sequence of returns risk. We recommend restructuring to include a 2-3 year cash reserve, laddered fixed income, and a balanced equity allocation for long-term growth.",
-                        "INHERITANCE_WINDFALL": f"{client_name} recently received an inheritance of approximately {_format_approx_amount(100, 1000)}. The current portfolio structure is not designed to efficiently absorb and deploy capital of this magnitude. A systematic deployment plan over 6-12 months can help optimize average entry prices and manage market timing risk.",
-                        "MARGIN_CALL_RISK": f"{client_name}'s leveraged position is at elevated risk given current market conditions. Recent volatility has brought the margin ratio dangerously close to triggering a forced liquidation. Immediate action to reduce leverage by {_format_approx_amount(50, 300)} is critical to protect the portfolio from forced sales at unfavorable prices.",
-                        "CONCENTRATED_STOCK_POSITION": f"{client_name}'s largest holding has appreciated to a level that now represents a disproportionate share of total portfolio risk. This concentration creates downside vulnerability if the single name experiences a drawdown. We recommend a staged de-risking plan to reduce exposure by {_format_approx_amount(30, 180)} while managing taxes and preserving long-term growth objectives.",
-                        "BUSINESS_EXIT_LIQUIDITY_EVENT": f"{client_name} is preparing for a business sale that is expected to generate significant liquidity in the coming quarters. Without a structured deployment plan, idle cash drag and timing risk could materially affect long-term outcomes. We recommend a phased investment policy with short-term reserves and scheduled deployment of {_format_approx_amount(200, 1500)} into diversified mandates.",
-                        "CROSS_BORDER_RELOCATION": f"{client_name} is planning a cross-border relocation, introducing new tax residency and currency-management considerations. The current portfolio is not optimized for withholding tax exposure, account-structure portability, or FX volatility. A transition plan should reposition assets and build a currency hedge framework ahead of relocation timelines.",
-                        "CHARITABLE_GIVING_STRATEGY": f"{client_name} intends to make a meaningful charitable contribution in the near term and is evaluating donation methods. Donating appreciated securities could improve after-tax outcomes versus donating cash, but requires coordinated asset selection and timing. We recommend pre-identifying eligible lots and a gifting schedule to maximize impact while preserving portfolio balance.",
-                        "ESTATE_FREEZE_PLANNING": f"{client_name} has begun estate freeze and intergenerational transfer planning, which changes liquidity and tax priorities across account types. Current allocations may not align with upcoming trust, corporate-share, and succession structures. We recommend re-segmenting assets by horizon and risk budget to support the estate strategy while maintaining portfolio resilience.",
-                        "INTEREST_RATE_REFINANCE_WINDOW": f"Recent rate movements have created a refinance decision point for {client_name}, affecting monthly cash flow and liquidity buffers. The existing portfolio does not currently reflect the revised short-term cash requirements and rate sensitivity. We recommend a temporary liquidity sleeve and targeted rebalancing to support financing decisions without compromising core long-term allocation.",
-                        "DIVORCE_SETTLEMENT_REBALANCE": f"{client_name} has completed a divorce settlement and now requires a full post-settlement portfolio redesign. Asset ownership, liquidity timing, and updated goals have materially changed risk capacity and drawdown requirements. We recommend re-mapping accounts into a new strategic allocation and building a near-term liquidity buffer of {_format_approx_amount(30, 160)}.",
-                        "RSU_VESTING_TAX_MANAGEMENT": f"{client_name} has significant RSU vesting events approaching over the next two quarters, creating concentration and tax withholding complexity. Without a plan, post-vest exposure could exceed risk limits and increase tax drag. We recommend a staged sell policy with explicit tax-lot handling and systematic diversification of {_format_approx_amount(40, 220)}.",
-                        "PENSION_COMMUTATION_DECISION": f"{client_name} is evaluating whether to commute a defined-benefit pension or accept lifetime annuitized payments. This decision materially impacts longevity risk, liquidity flexibility, and required portfolio return assumptions. We recommend scenario testing both paths and preparing an allocation policy tied to the chosen income structure.",
-                        "CURRENCY_HEDGE_REVIEW": f"{client_name}'s foreign equity exposure has risen materially, increasing sensitivity to CAD currency swings. The current hedge ratio may no longer align with risk objectives or spending currency needs. We recommend re-establishing a target hedge corridor and rebalancing FX exposure using a phased implementation schedule.",
-                        "PRIVATE_MARKET_LIQUIDITY_LOCKUP": f"{client_name} has increased private-market allocations with multi-year lockups, reducing portfolio liquidity flexibility. Upcoming cash needs may now conflict with the current lockup profile and distribution timelines. We recommend a liquidity stress test and rebalancing public sleeves to create an accessible reserve of {_format_approx_amount(60, 260)}.",
-                        "CRITICAL_ILLNESS_CONTINGENCY": f"{client_name} is implementing a critical illness contingency plan requiring higher short-term liquidity and reduced drawdown risk. Current allocation assumes longer horizons and may not support sudden cash needs. We recommend a defensive rebalance with a dedicated contingency reserve and lower volatility positioning.",
-                        "DRAWDOWN_SEQUENCE_RISK": f"{client_name} has entered early drawdown, and current withdrawal rates make the portfolio vulnerable to sequence-of-returns shocks. A market decline in the next 12-24 months could materially impair sustainability. We recommend a bucket strategy with near-term cash/fixed-income funding and adjusted equity risk budgets.",
-                        "ALTERNATIVE_ASSET_OVEREXPOSURE": f"{client_name}'s alternatives sleeve has grown beyond policy limits due to strong performance and new commitments. The resulting allocation drift reduces transparency and complicates liquidity forecasting. We recommend a disciplined rebalance program to bring alternatives back within mandate while preserving long-term diversification benefits.",
-                    }
 
                     # Generate realistic "change detection" from state
-                    prior_states = [
-                        "standard allocation",
-                        "balanced portfolio",
-                        "normal structure",
-                        "unchanged status",
-                        "maintenance mode",
-                        "baseline configuration",
-                        "typical positioning",
-                    ]
-                    prior_state = random.choice(prior_states)
-
-                    detailed_summary = scenario_summaries.get(
-                        scenario_key,
-                        f"{client_name} requires portfolio review and adjustment regarding {scenario['label']}. Meeting recommended to discuss strategy and next steps."
-                    )
+                    prior_state = random.choice(_PRIOR_STATES)
+
+                    detailed_summary = _alert_summary(scenario_key, scenario["label"], client_name)
 
                     alert = Alert(
+                        id=next(alert_ids),
                         run_id=run.id,
-                        portfolio_id=portfolio.id,
-                        client_id=client.id,
+                        portfolio=portfolio,
+                        client=client,
                         created_at=now - timedelta(days=random.randint(1, 10)),
                         priority=priority,
                         confidence=confidence,
@@ -929,18 +1473,15 @@ def seed_client_universes(session: Session, count: int = 70, use_gemini: bool =
                         reasoning_bullets=[
                             f"Scenario: {scenario['label']}",
                             scenario["description"],
-                            f"Current AUM: ${float(portfolio.total_value):,.0f}",
+                            f"Current AUM: ${total_value:,}",
                             f"Risk Profile: {client.risk_profile}",
-                            "Advisor review and client discussion recommended to align portfolio with current life circumstances",
+                            _ALERT_REVIEW_BULLET,
                         ],
                         human_review_required=True,
                         suggested_next_step=f"Schedule comprehensive meeting with {client_name} to discuss {scenario['label'].lower()} strategy and implement recommendations",
-                        decision_trace_steps=[
-                            {"step": "Detection", "detail": f"{scenario['label']} event identified in client profile"},
-                            {"step": "Assessment", "detail": f"Current portfolio allocation may not be optimal for {scenario['label'].lower()} scenario"},
-                            {"step": "Analysis", "detail": f"Analyzing {client.risk_profile} portfolio against {scenario['label']} requirements"},
-                            {"step": "Recommendation", "detail": "Advisor meeting required to discuss adjustments and implementation timeline"},
-                        ],
+                        decision_trace_steps=_alert_decision_trace(
+                            scenario["label"], client.risk_profile
+                        ),
                         change_detection=[
                             {
                                 "metric": "life_event_status",
@@ -956,83 +1497,45 @@ def seed_client_universes(session: Session, count: int = 70, use_gemini: bool =
                         scenario=scenario_key,
                     )
                     session.add(alert)
-                    session.flush()
                     created_alerts += 1
 
             # Create meeting notes for this client
             # Case 1: Client has alert with scenario -> linear progression
             if has_alert and scenario_key and alert:
-                scenario = None
-                for s in SCENARIOS:
-                    if s["key"] == scenario_key:
-                        scenario = s
-                        break
+                scenario = SCENARIO_BY_KEY.get(scenario_key)
 
                 if scenario:
-                    timeline_days = scenario.get("timeline_days", [0, 30, 60])
-
-                    for timeline_idx, days_offset in enumerate(timeline_days):
-                        meeting_date = now - timedelta(days=days_offset)
-
-                        # Generate meeting note and transcript
-                        if gemini_client and use_gemini:
-                            note_body, call_transcript = generate_scenario_meeting_notes_with_gemini(
+                    timeline_days = scenario.get("timeline_days", (0, 30, 60))
+
+                    if gemini_client and use_gemini:
+                        # Queue every point on the timeline and keep going; the notes are
+                        # written after the loop, so these requests overlap later clients.
+                        note_futures = [
+                            gemini_pool.submit(
+                                generate_scenario_meeting_notes_with_gemini,
                                 gemini_client,
                                 client_name,
                                 risk_profile,
                                 scenario,
-                                timeline_idx,
+                                idx,
                                 len(timeline_days),
                             )
-                            time.sleep(1)  # Rate limit
-
-                            if not note_body or not call_transcript:
-                                note_body, call_transcript = generate_fallback_meeting_note(
-                                    client_name, scenario, timeline_idx, len(timeline_days)
-                                )
-                        else:
-                            note_body, call_transcript = generate_fallback_meeting_note(
-                                client_name, scenario, timeline_idx, len(timeline_days)
-                            )
-
-                        # Auto-summarize transcript
-                        ai_summary = ""
-                        action_items = []
-                        if call_transcript and isinstance(call_transcript, str) and call_transcript.strip():
-                            summary_result = ai_provider.summarize_transcript(
-                                transcript=call_transcript,
-                                context={
-                                    "client_name": client_name,
-                                    "risk_profile": risk_profile,
-                                    "scenario": scenario["label"],
-                                },
-                            )
-                            ai_summary = summary_result.summary_paragraph
-                            action_items = (
-                                summary_result.action_items
-                                if isinstance(summary_result.action_items, list)
-                                else []
-                            )
-
-                        # Ensure action_items is a list
-                        if not isinstance(action_items, list):
-                            action_items = []
-
-                        # Create meeting note
-                        meeting_note = MeetingNote(
-                            client_id=client.id,
-                            title=f"{scenario['label']} - {['Planning', 'Follow-up', 'Review'][min(timeline_idx, 2)]}",
-                            meeting_date=meeting_date,
-                            note_body=note_body or f"Meeting regarding {scenario['label']}",
-                            meeting_type=MeetingNoteType.PHONE_CALL,
-                            call_transcript=str(call_transcript) if call_transcript else "",
-                            ai_summary=ai_summary,
-                            ai_action_items=action_items,
-                            ai_summarized_at=datetime.utcnow() if ai_summary else None,
-                            ai_provider_used="mock",
+                            for idx in range(len(timeline_days))
+                        ]
+                        pending_scenario_notes.append(
+                            (client, client_name, risk_profile, scenario, note_futures)
+                        )
+                    else:
+                        note_rows = _scenario_meeting_note_rows(
+                            ai_provider,
+                            now,
+                            client_name,
+                            risk_profile,
+                            scenario,
+                            [("", "")] * len(timeline_days),
                         )
-                        session.add(meeting_note)
-                        created_notes += 1
+                        pending_notes.append((client, note_rows))
+                        created_notes += len(note_rows)
 
             else:
                 # Case 2: Client without alert -> create at least 1 generic meeting note
@@ -1067,43 +1570,77 @@ def seed_client_universes(session: Session, count: int = 70, use_gemini: bool =
                     else []
                 )
 
-                meeting_note = MeetingNote(
-                    client_id=client.id,
-                    title="Quarterly Portfolio Review",
-                    meeting_date=meeting_date,
-                    note_body=note_body,
-                    meeting_type=MeetingNoteType.PHONE_CALL,
-                    call_transcript=str(call_transcript) if call_transcript else "",
-                    ai_summary=summary_result.summary_paragraph,
-                    ai_action_items=action_items_list,
-                    ai_summarized_at=datetime.utcnow(),
-                    ai_provider_used="mock",
-                )
-                session.add(meeting_note)
+                meeting_note_row = {
+                    "title": "Quarterly Portfolio Review",
+                    "meeting_date": meeting_date,
+                    "note_body": note_body,
+                    "meeting_type": MeetingNoteType.PHONE_CALL,
+                    "call_transcript": str(call_transcript) if call_transcript else "",
+                    "ai_summary": summary_result.summary_paragraph,
+                    "ai_action_items": action_items_list,
+                    "ai_summarized_at": now,
+                    "ai_provider_used": "mock",
+                }
+                pending_notes.append((client, [meeting_note_row]))
                 created_notes += 1
 
-            # Batch commit every 10 clients
+            # Write a batch every 10 clients
             if (i + 1) % 10 == 0:
-                session.flush()
-                session.commit()
-                print(
-                    f"[{i+1}/{count}] Batch committed: {created_clients} clients, "
-                    f"{created_alerts} alerts, {created_notes} notes"
+                _insert_child_rows(session, pending_positions, pending_notes)
+                batch.commit()
+                batch = session.begin_nested()
+                committed_pending = len(pending_scenario_notes)
+                logger.info(
+                    "[%d/%d] Batch written: %d clients, %d alerts, %d notes",
+                    i + 1,
+                    count,
+                    created_clients,
+                    created_alerts,
+                    created_notes,
                 )
 
         except Exception as e:
-            print(f"ERROR processing client {i+1}: {e}")
-            session.rollback()
+            logger.error("ERROR processing client %d: %s", i + 1, e)
+            batch.rollback()
+            batch = session.begin_nested()
+            # The rollback discarded every client since the last batch was written.
+            pending_positions.clear()
+            pending_notes.clear()
+            for *_, note_futures in pending_scenario_notes[committed_pending:]:
+                for future in note_futures:
+                    future.cancel()
+            del pending_scenario_notes[committed_pending:]
             continue
 
-    # Final commit
+    for client, client_name, risk_profile, scenario, note_futures in pending_scenario_notes:
+        note_rows = _scenario_meeting_note_rows(
+            ai_provider,
+            now,
+            client_name,
+            risk_profile,
+            scenario,
+            [future.result() for future in note_futures],
+        )
+        pending_notes.append((client, note_rows))
+        created_notes += len(note_rows)
+
+    if gemini_pool is not None:
+        gemini_pool.shutdown()
+    if _gemini_cache is not None:
+        _gemini_cache.close()
+        _gemini_cache = None
+
+    # Final batch, then the single commit
     run.alerts_created = created_alerts
-    session.flush()
+    _insert_child_rows(session, pending_positions, pending_notes)
+    batch.commit()
     session.commit()
 
-    print(
-        f"\n[SEEDING COMPLETE] {created_clients} clients, "
-        f"{created_alerts} alerts, {created_notes} meeting notes\n"
+    logger.info(
+        "[SEEDING COMPLETE] %d clients, %d alerts, %d meeting notes",
+        created_clients,
+        created_alerts,
+        created_notes,
     )
 
 
@@ -1112,6 +1649,31 @@ def seed_client_universes(session: Session, count: int = 70, use_gemini: bool =
 # ============================================================================
 
 
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """
+    Route seed logging through a queue drained by one listener thread.
+
+    Pool workers only enqueue records, so concurrent generation never blocks on
+    the stderr lock or a per-line flush.
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    # QueueHandler formats each record before enqueueing, so the format lives here.
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+    )
+
+    # Suppress verbose library logs
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("google_genai").setLevel(logging.WARNING)
+    logging.getLogger("google.genai").setLevel(logging.WARNING)
+
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stderr))
+    listener.start()
+    return listener
+
+
 def main() -> None:
     """Main entry point."""
     import argparse
@@ -1133,19 +1695,31 @@ def main() -> None:
         dest="gemini_enabled",
         help="Disable Gemini and use fallback generation.",
     )
+    parser.add_argument(
+        "--no-gemini-cache",
+        action="store_true",
+        help="Always call Gemini instead of reusing responses cached by earlier runs.",
+    )
     args = parser.parse_args()
 
+    log_listener = _start_log_listener()
     reset_database()
     session = SessionLocal()
 
     try:
-        seed_client_universes(session, count=args.clients, use_gemini=args.gemini_enabled)
-        print("[SEED SUCCESS] Database ready for Wealthsimple Operator\n")
+        seed_client_universes(
+            session,
+            count=args.clients,
+            use_gemini=args.gemini_enabled,
+            gemini_cache_path=None if args.no_gemini_cache else GEMINI_CACHE_PATH,
+        )
+        logger.info("[SEED SUCCESS] Database ready for Wealthsimple Operator")
     except Exception as e:
-        print(f"[SEED ERROR] {e}\n")
+        logger.error("[SEED ERROR] %s", e)
         session.rollback()
     finally:
         session.close()
+        log_listener.stop()
 
 
 if __name__ == "__main__":
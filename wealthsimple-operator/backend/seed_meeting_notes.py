@@ -87,11 +87,10 @@ def seed_meeting_notes(num_notes: int = 12):
             session.add(note)
             created_count += 1
 
-            # Commit in batches
             if created_count % 5 == 0:
-                session.commit()
                 print(f"[OK] Created {created_count} meeting notes...")
 
+        # One commit for the whole batch of notes
         session.commit()
         print(f"\n[SUCCESS] Successfully created {created_count} meeting notes!")
 
@@ -0,0 +1,58 @@
+"""Small thread-safe in-process TTL cache.
+
+Used for cheap, short-lived memoization of hot read paths (for example
+pagination counts) without pulling in an external cache dependency.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Bounded mapping whose entries expire ``ttl_seconds`` after being set."""
+
+    def __init__(self, maxsize: int = 512, ttl_seconds: float = 30.0) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by clear(), so a value computed before a clear is not stored after it.
+        self._generation = 0
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], V]) -> V:
+        """Return the cached value for ``key``, computing it on miss or expiry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1]
+            generation = self._generation
+
+        # Compute outside the lock so a slow factory does not serialize readers.
+        value = factory()
+        with self._lock:
+            if self._generation == generation:
+                self._store(key, value)
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store ``value`` under ``key``, replacing any existing entry."""
+        with self._lock:
+            self._store(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def _store(self, key: Hashable, value: V) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -45,7 +45,10 @@ export default function AlertDetailPage() {
     setError(null);
     try {
       const res = await postAlertAction(alert.id, action);
-      setAlert(res.alert);
+      setAlert({
+        ...res.alert,
+        client_profile_view: res.alert.client_profile_view ?? alert.client_profile_view
+      });
     } catch (e) {
       setError((e as Error).message);
     } finally {
@@ -14,7 +14,8 @@ import {
   generateReallocationPlan,
   rejectFollowUpDraft,
   postAlertAction,
-  queueReallocationPlan
+  queueReallocationPlan,
+  waitForFollowUpDraft
 } from "../lib/api";
 import { PriorityPill } from "./StatusPills";
 import { Button } from "./Buttons";
@@ -261,9 +262,15 @@ export default function PriorityQueue({
     setDraftLoading(true);
     setDraftMessage(null);
     try {
-      const response = await createFollowUpDraft(selected.id, { forceRegenerate });
+      const started = await createFollowUpDraft(selected.id, { forceRegenerate });
+      setDraftMessage(started.message);
+      const response = await waitForFollowUpDraft(started.draft.id);
       setFollowUpDraft(response.draft);
-      setDraftMessage(response.message);
+      if (response.draft.status === "GENERATION_FAILED") {
+        setDraftMessage("Follow-up draft generation failed. Try regenerating.");
+        return;
+      }
+      setDraftMessage("Follow-up draft generated (fresh each time).");
       onFollowUpDraftEvent?.({ type: "created", draft: response.draft });
     } catch (e) {
       setDraftMessage((e as Error).message);
@@ -315,6 +322,8 @@ export default function PriorityQueue({
       const response = await postAlertAction(selected.id, action);
       const patchedDetail: AlertDetail = {
         ...response.alert,
+        client_profile_view:
+          response.alert.client_profile_view ?? selectedDetail?.client_profile_view,
         change_detection: [
           {
             metric: "status",
@@ -773,13 +782,21 @@ export default function PriorityQueue({
                         ? "border-amber-200 bg-amber-50 text-amber-700"
                         : followUpDraft.status === "APPROVED_READY"
                           ? "border-emerald-200 bg-emerald-50 text-emerald-700"
-                          : "border-gray-200 bg-gray-50 text-gray-600"
+                          : followUpDraft.status === "GENERATING"
+                            ? "border-indigo-200 bg-indigo-50 text-indigo-700"
+                            : followUpDraft.status === "GENERATION_FAILED"
+                              ? "border-red-200 bg-red-50 text-red-700"
+                              : "border-gray-200 bg-gray-50 text-gray-600"
                     }`}>
                       {followUpDraft.status === "PENDING_APPROVAL"
                         ? "Pending Approval"
                         : followUpDraft.status === "APPROVED_READY"
                           ? "Approved Ready"
-                          : "Rejected"}
+                          : followUpDraft.status === "GENERATING"
+                            ? "Generating"
+                            : followUpDraft.status === "GENERATION_FAILED"
+                              ? "Generation Failed"
+                              : "Rejected"}
                     </span>
                   )}
                 </div>
@@ -130,6 +130,33 @@ export async function fetchFollowUpDraft(
   return handle<{ draft: FollowUpDraft; message: string }>(res);
 }
 
+export async function fetchFollowUpDraftById(
+  draftId: number
+): Promise<{ draft: FollowUpDraft; message: string }> {
+  const res = await fetch(apiUrl(`/alerts/follow-up-drafts/${draftId}`), {
+    cache: "no-store"
+  });
+  return handle<{ draft: FollowUpDraft; message: string }>(res);
+}
+
+// Drafts are generated in the background; poll the draft the POST created (by id,
+// so an older draft for the same alert is never mistaken for the result).
+export async function waitForFollowUpDraft(
+  draftId: number,
+  options?: { intervalMs?: number; timeoutMs?: number }
+): Promise<{ draft: FollowUpDraft; message: string }> {
+  const intervalMs = options?.intervalMs ?? 1000;
+  const deadline = Date.now() + (options?.timeoutMs ?? 60000);
+  for (;;) {
+    const response = await fetchFollowUpDraftById(draftId);
+    if (response.draft.status !== "GENERATING") return response;
+    if (Date.now() >= deadline) {
+      throw new Error("Follow-up draft is still generating. Try again in a moment.");
+    }
+    await new Promise((resolve) => setTimeout(resolve, intervalMs));
+  }
+}
+
 export async function approveFollowUpDraft(
   draftId: number
 ): Promise<{ draft: FollowUpDraft; message: string }> {
@@ -63,6 +63,8 @@ export interface AlertDetail extends AlertSummary {
 }
 
 export type FollowUpDraftStatus =
+  | "GENERATING"
+  | "GENERATION_FAILED"
   | "PENDING_APPROVAL"
   | "APPROVED_READY"
   | "REJECTED";
@@ -257,11 +259,13 @@ export interface MonitoringUniverseDetail {
 export interface AlertsListResponse {
   items: AlertSummary[];
   total: number;
+  next_cursor?: string | null;
 }
 
 export interface AuditListResponse {
   items: AuditEventEntry[];
   total: number;
+  next_cursor?: string | null;
 }
 
 export interface HealthResponse {